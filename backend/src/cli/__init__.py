@@ -1,13 +1,54 @@
 # CLI Module
 from .checker import check_cli_available
-from .parser import parse_cli_command, parse_cli_output
+from .parser import parse_cli_command, parse_cli_output, IncrementalFenceParser
+from .structured import StreamJsonParser, parse_stream_json
 from .executor import CLIExecutor, CLIExecutionError, CLITimeoutError
+from .pool import CLIProcessPool
+from .registry import CLIRegistry, CLIStatus
+from .cache import ResponseCache
+from .capture import BoundedCapture, CaptureStore
+from .health import ModelHealthTracker, CircuitOpenError
+from .accounting import ExecutionUsage, UsageAccounting
+from .admission import AdmissionThresholds, HostAdmission
+from .fairness import FairQueue
+from .latency import LatencyTracker
+from .sessions import CLISession, CLISessionStore
+from .singleflight import SingleFlight
+from .timeouts import AdaptiveTimeouts
+from .supervisor import ProcessSupervisor, ResourceLimits
+from .scheduler import CLIScheduler, ModelLimits, SchedulerRejectedError
 
 __all__ = [
     "check_cli_available",
     "parse_cli_command",
     "parse_cli_output",
+    "IncrementalFenceParser",
+    "StreamJsonParser",
+    "parse_stream_json",
     "CLIExecutor",
     "CLIExecutionError",
     "CLITimeoutError",
+    "CLIProcessPool",
+    "CLIRegistry",
+    "CLIStatus",
+    "ResponseCache",
+    "CLIScheduler",
+    "ModelLimits",
+    "SchedulerRejectedError",
+    "ModelHealthTracker",
+    "CircuitOpenError",
+    "BoundedCapture",
+    "CaptureStore",
+    "ProcessSupervisor",
+    "ResourceLimits",
+    "SingleFlight",
+    "CLISession",
+    "CLISessionStore",
+    "AdaptiveTimeouts",
+    "ExecutionUsage",
+    "UsageAccounting",
+    "AdmissionThresholds",
+    "HostAdmission",
+    "FairQueue",
+    "LatencyTracker",
 ]
@@ -0,0 +1,284 @@
+"""
+CLI 실행 리소스 사용량 집계 모듈
+
+실행마다 CPU 시간(user/sys), 최대 RSS, 실행 시간, stdout/stderr 크기, 종료 코드를 기록하고
+모델별/엔드포인트별로 집계한다. asyncio가 자식 프로세스를 바로 회수하므로 rusage를 직접
+받을 수 없어, 실행 중 /proc을 주기적으로 읽어 프로세스(그룹)의 사용량을 샘플링한다.
+마지막 샘플 이후 짧은 구간의 CPU 시간은 누락될 수 있다.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Iterable, Optional
+
+from .latency import percentile
+
+_IS_POSIX = os.name == "posix"
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if _IS_POSIX else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if _IS_POSIX else 4096
+
+
+def _read_stat(pid: str) -> Optional[list[str]]:
+    """/proc/<pid>/stat의 ')' 이후 필드 (comm에 공백/괄호가 있을 수 있음)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    fields = stat[stat.rfind(")") + 2:].split()
+    # fields[0]=state, [2]=pgrp, [11]=utime, [12]=stime, [13]=cutime, [14]=cstime,
+    # [19]=starttime(ticks), [21]=rss(pages)
+    return fields if len(fields) >= 22 else None
+
+
+def _empty_usage() -> dict:
+    return {
+        "processes": 0,
+        "cpu_seconds": 0.0,
+        "cpu_user_seconds": 0.0,
+        "cpu_system_seconds": 0.0,
+        "rss_bytes": 0,
+    }
+
+
+def _add_usage(usage: dict, fields: list[str]):
+    # 회수된 자식의 시간(cutime/cstime)도 포함 - 회수된 프로세스는 목록에 없으므로 중복 없음
+    user = (int(fields[11]) + int(fields[13])) / _CLOCK_TICKS
+    system = (int(fields[12]) + int(fields[14])) / _CLOCK_TICKS
+    usage["processes"] += 1
+    usage["cpu_user_seconds"] += user
+    usage["cpu_system_seconds"] += system
+    usage["cpu_seconds"] += user + system
+    usage["rss_bytes"] += int(fields[21]) * _PAGE_SIZE
+
+
+def _rounded(usage: dict) -> dict:
+    for key in ("cpu_seconds", "cpu_user_seconds", "cpu_system_seconds"):
+        usage[key] = round(usage[key], 3)
+    return usage
+
+
+def read_start_time(pid: int) -> Optional[int]:
+    """프로세스 시작 시각 (부팅 후 clock tick, 조회할 수 없으면 None)
+
+    pid가 재사용됐는지 확인하는 용도 - 같은 pid라도 시작 시각이 다르면 다른 프로세스
+    """
+    fields = _read_stat(str(pid))
+    return int(fields[19]) if fields is not None else None
+
+
+def read_process_usage(pid: int) -> dict:
+    """/proc에서 프로세스 하나의 CPU 시간/RSS 조회 (Linux 전용)"""
+    usage = _empty_usage()
+    fields = _read_stat(str(pid))
+    if fields is not None:
+        _add_usage(usage, fields)
+    return _rounded(usage)
+
+
+def _scan_groups(pgids: set[int]) -> dict[int, dict[int, list[str]]]:
+    """/proc을 한 번 훑어 그룹별 (pid → stat 필드) 조회"""
+    groups: dict[int, dict[int, list[str]]] = {pgid: {} for pgid in pgids}
+    if not os.path.isdir("/proc"):
+        return groups
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        fields = _read_stat(entry)
+        if fields is None:
+            continue
+        members = groups.get(int(fields[2]))
+        if members is not None:
+            members[int(entry)] = fields
+    return groups
+
+
+def read_process_groups_usage(pgids: Iterable[int]) -> dict[int, dict]:
+    """여러 프로세스 그룹의 CPU 시간/RSS 합계 조회 - /proc은 한 번만 훑음 (Linux 전용)"""
+    result = {}
+    for pgid, members in _scan_groups(set(pgids)).items():
+        usage = _empty_usage()
+        for fields in members.values():
+            _add_usage(usage, fields)
+        result[pgid] = _rounded(usage)
+    return result
+
+
+def read_process_group_usage(pgid: int) -> dict:
+    """/proc에서 프로세스 그룹 전체의 CPU 시간/RSS 합계 조회 (Linux 전용)"""
+    return read_process_groups_usage([pgid])[pgid]
+
+
+class UsageSampler:
+    """실행 중 프로세스(그룹) 사용량 주기 샘플링 - 최대 RSS, 마지막 CPU 시간
+
+    /proc 읽기는 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+    그룹 구성원은 rescan_interval마다 /proc 전체를 훑어 다시 찾고,
+    그 사이에는 알고 있는 pid의 stat만 읽는다.
+    """
+
+    def __init__(
+        self,
+        pid: int,
+        group: bool = False,
+        interval: float = 0.5,
+        rescan_interval: float = 5.0,
+    ):
+        self.pid = pid
+        self.group = group
+        self.interval = interval
+        self.rescan_interval = rescan_interval
+        self.cpu_user_seconds = 0.0
+        self.cpu_system_seconds = 0.0
+        self.max_rss_bytes = 0
+        self.samples = 0
+        self.scans = 0
+        self._members: set[int] = set()
+        self._scanned_at: Optional[float] = None
+        # 스레드에서 돌던 샘플링과 stop()의 마지막 샘플링이 겹치지 않게
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if _IS_POSIX and os.path.isdir("/proc"):
+            self._task = asyncio.create_task(self._run())
+
+    def _read_group(self, rescan: bool) -> dict:
+        now = time.monotonic()
+        if rescan and (
+            self._scanned_at is None or now - self._scanned_at >= self.rescan_interval
+        ):
+            members = _scan_groups({self.pid})[self.pid]
+            self._members = set(members)
+            self._scanned_at = now
+            self.scans += 1
+        else:
+            members = {}
+            for pid in list(self._members | {self.pid}):
+                fields = _read_stat(str(pid))
+                # 종료됐거나 pid가 다른 그룹에 재사용됨
+                if fields is None or int(fields[2]) != self.pid:
+                    self._members.discard(pid)
+                    continue
+                members[pid] = fields
+        usage = _empty_usage()
+        for fields in members.values():
+            _add_usage(usage, fields)
+        return usage
+
+    def sample(self, rescan: bool = True):
+        with self._lock:
+            if self.group:
+                usage = self._read_group(rescan)
+            else:
+                usage = read_process_usage(self.pid)
+            if usage["processes"] == 0:
+                return
+            self.samples += 1
+            # CPU 시간은 누적값이므로 줄어들지 않게 유지 (자식 종료로 합계가 줄어드는 경우)
+            self.cpu_user_seconds = max(self.cpu_user_seconds, usage["cpu_user_seconds"])
+            self.cpu_system_seconds = max(self.cpu_system_seconds, usage["cpu_system_seconds"])
+            self.max_rss_bytes = max(self.max_rss_bytes, usage["rss_bytes"])
+
+    async def _run(self):
+        while True:
+            await asyncio.to_thread(self.sample)
+            await asyncio.sleep(self.interval)
+
+    def stop(self):
+        """샘플링 종료 (프로세스가 아직 남아 있으면 알고 있는 pid로 마지막 샘플링)"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self.sample(rescan=False)
+
+
+@dataclass
+class ExecutionUsage:
+    """CLI 실행 한 번의 리소스 사용량"""
+    model: str
+    endpoint: str
+    wall_seconds: float
+    cpu_user_seconds: float = 0.0
+    cpu_system_seconds: float = 0.0
+    max_rss_bytes: int = 0
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    exit_status: Optional[int] = None
+
+    @property
+    def cpu_seconds(self) -> float:
+        return self.cpu_user_seconds + self.cpu_system_seconds
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["wall_seconds"] = round(self.wall_seconds, 4)
+        data["cpu_seconds"] = round(self.cpu_seconds, 3)
+        return data
+
+
+@dataclass
+class _Aggregate:
+    """모델/엔드포인트별 누적 사용량"""
+    runs: int = 0
+    failures: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    peak_rss_bytes: int = 0
+    exit_statuses: dict = field(default_factory=dict)
+    recent: deque = field(default_factory=lambda: deque(maxlen=500))
+
+    def add(self, usage: ExecutionUsage):
+        self.runs += 1
+        if usage.exit_status != 0:
+            self.failures += 1
+        self.wall_seconds += usage.wall_seconds
+        self.cpu_seconds += usage.cpu_seconds
+        self.stdout_bytes += usage.stdout_bytes
+        self.stderr_bytes += usage.stderr_bytes
+        self.peak_rss_bytes = max(self.peak_rss_bytes, usage.max_rss_bytes)
+        status = str(usage.exit_status)
+        self.exit_statuses[status] = self.exit_statuses.get(status, 0) + 1
+        self.recent.append(usage)
+
+    def to_dict(self) -> dict:
+        recent = list(self.recent)
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "wall_seconds_total": round(self.wall_seconds, 3),
+            "wall_seconds_avg": round(self.wall_seconds / self.runs, 4) if self.runs else 0.0,
+            "wall_seconds_p95": round(percentile([u.wall_seconds for u in recent], 0.95), 4),
+            "cpu_seconds_total": round(self.cpu_seconds, 3),
+            "cpu_seconds_avg": round(self.cpu_seconds / self.runs, 4) if self.runs else 0.0,
+            "cpu_seconds_p95": round(percentile([u.cpu_seconds for u in recent], 0.95), 4),
+            "max_rss_bytes_peak": self.peak_rss_bytes,
+            "max_rss_bytes_p95": percentile([u.max_rss_bytes for u in recent], 0.95),
+            "stdout_bytes_total": self.stdout_bytes,
+            "stderr_bytes_total": self.stderr_bytes,
+            "exit_statuses": dict(self.exit_statuses),
+        }
+
+
+class UsageAccounting:
+    """실행별 리소스 사용량을 모델/엔드포인트별로 집계"""
+
+    def __init__(self):
+        self._models: dict[str, _Aggregate] = {}
+        self._endpoints: dict[str, _Aggregate] = {}
+
+    def record(self, usage: ExecutionUsage):
+        self._models.setdefault(usage.model, _Aggregate()).add(usage)
+        self._endpoints.setdefault(usage.endpoint, _Aggregate()).add(usage)
+
+    def stats(self) -> dict:
+        return {
+            "models": {name: agg.to_dict() for name, agg in sorted(self._models.items())},
+            "endpoints": {name: agg.to_dict() for name, agg in sorted(self._endpoints.items())},
+        }
@@ -0,0 +1,227 @@
+"""
+호스트 부하 기반 실행 허가 모듈
+
+모델별 동시 실행 제한이 있어도 호스트 CPU가 이미 포화되었거나 메모리가 부족할 때
+CLI를 더 띄우면 실행 중인 모든 작업이 느려진다. /proc에서 load average,
+사용 가능 메모리, 실행 중인 CLI의 RSS 합계를 읽어 임계치를 넘으면
+새 실행을 잠시 미루고(delay), 더 심하면 바로 거부한다(reject, 503).
+허가는 스케줄러/공정 대기열 슬롯을 잡기 전에 받으므로 대기 중에는 슬롯을 점유하지 않는다.
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .scheduler import SchedulerRejectedError
+
+if TYPE_CHECKING:
+    from .supervisor import ProcessSupervisor
+
+
+def _unknown_load() -> dict:
+    return {
+        "load1": None,
+        "cpu_count": os.cpu_count() or 1,
+        "load_per_cpu": None,
+        "mem_total_bytes": None,
+        "mem_available_bytes": None,
+        "mem_available_ratio": None,
+    }
+
+
+def read_host_load() -> dict:
+    """/proc에서 호스트 부하 조회 (Linux 전용, 읽을 수 없는 값은 None)"""
+    load = _unknown_load()
+    cpu_count = load["cpu_count"]
+    try:
+        with open("/proc/loadavg") as f:
+            load["load1"] = float(f.read().split()[0])
+        load["load_per_cpu"] = round(load["load1"] / cpu_count, 3)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        meminfo = {}
+        with open("/proc/meminfo") as f:
+            for line in f:
+                name, value = line.split(":", 1)
+                meminfo[name] = int(value.split()[0]) * 1024
+        load["mem_total_bytes"] = meminfo["MemTotal"]
+        load["mem_available_bytes"] = meminfo["MemAvailable"]
+        load["mem_available_ratio"] = round(meminfo["MemAvailable"] / meminfo["MemTotal"], 4)
+    except (OSError, ValueError, KeyError, ZeroDivisionError):
+        pass
+    return load
+
+
+@dataclass
+class AdmissionThresholds:
+    """허가 임계치 (None이면 해당 항목 확인 안 함)
+
+    - load_per_cpu: 1분 load average / CPU 수
+    - mem_available_ratio: 사용 가능 메모리 / 전체 메모리 (이보다 작으면 초과)
+    - cli_rss_bytes: 실행 중인 CLI 프로세스 그룹 RSS 합계
+    """
+    delay_load_per_cpu: Optional[float] = 1.5
+    reject_load_per_cpu: Optional[float] = 4.0
+    delay_mem_available_ratio: Optional[float] = 0.15
+    reject_mem_available_ratio: Optional[float] = 0.05
+    delay_cli_rss_bytes: Optional[int] = None
+    reject_cli_rss_bytes: Optional[int] = None
+    # 부하가 내려가길 기다리는 최대 시간(초), 넘으면 거부
+    max_delay: float = 30.0
+    poll_interval: float = 0.5
+    # 거부 응답의 Retry-After(초)
+    retry_after: int = 10
+
+    def to_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+class HostAdmission:
+    """호스트 부하 기반 CLI 실행 허가
+
+    - thresholds: delay/reject 임계치
+    - supervisor: 실행 중인 CLI의 RSS 합계를 얻기 위한 감독자 (없으면 RSS 확인 안 함)
+    - sample_ttl: 부하 샘플 재사용 시간(초) - 요청마다 /proc을 읽지 않도록
+    대기 중인 요청들은 poll_interval마다 갱신되는 샘플 하나를 공유한다 (/proc 읽기는 스레드에서).
+    동기 조회(sample/overloaded/stats)는 캐시된 샘플만 보므로 이벤트 루프를 막지 않는다.
+    """
+
+    def __init__(
+        self,
+        thresholds: Optional[AdmissionThresholds] = None,
+        supervisor: Optional["ProcessSupervisor"] = None,
+        sample_ttl: float = 1.0,
+    ):
+        self.thresholds = thresholds or AdmissionThresholds()
+        self.supervisor = supervisor
+        self.sample_ttl = sample_ttl
+        self._sample: Optional[dict] = None
+        self._sampled_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.admitted = 0
+        self.delayed = 0
+        self.rejected = 0
+        self.delay_seconds_total = 0.0
+
+    def _read(self) -> dict:
+        sample = read_host_load()
+        sample["cli_rss_bytes"] = (
+            sum(p.get("rss_bytes", 0) for p in self.supervisor.snapshot())
+            if self.supervisor is not None else None
+        )
+        return sample
+
+    def _store(self, sample: dict) -> dict:
+        self._sample = sample
+        self._sampled_at = time.monotonic()
+        return sample
+
+    def _fresh(self, max_age: float) -> bool:
+        return self._sample is not None and time.monotonic() - self._sampled_at < max_age
+
+    def sample(self) -> dict:
+        """마지막 부하 샘플 - /proc은 읽지 않고, 오래되었으면 스레드 갱신만 예약
+
+        아직 샘플이 없으면 모든 값이 None인 샘플을 돌려준다 (임계치 확인 안 함).
+        """
+        if not self._fresh(self.sample_ttl):
+            self._schedule_refresh()
+        if self._sample is None:
+            return {**_unknown_load(), "cli_rss_bytes": None}
+        return self._sample
+
+    def _schedule_refresh(self):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def refresh(self) -> dict:
+        """대기자용 샘플 갱신 - poll_interval 안의 샘플은 재사용하고, 진행 중인 갱신은 공유"""
+        if self._fresh(min(self.sample_ttl, self.thresholds.poll_interval)):
+            return self._sample
+        self._schedule_refresh()
+        return await asyncio.shield(self._refresh_task)
+
+    async def _refresh(self) -> dict:
+        return self._store(await asyncio.to_thread(self._read))
+
+    def _exceeded(self, sample: dict, level: str) -> list[str]:
+        """level("delay"/"reject") 임계치를 넘은 항목 이름"""
+        t = self.thresholds
+        reasons = []
+        load_limit = getattr(t, f"{level}_load_per_cpu")
+        if (
+            load_limit is not None
+            and sample["load_per_cpu"] is not None
+            and sample["load_per_cpu"] >= load_limit
+        ):
+            reasons.append(f"load_per_cpu {sample['load_per_cpu']} >= {load_limit}")
+        mem_limit = getattr(t, f"{level}_mem_available_ratio")
+        if (
+            mem_limit is not None
+            and sample["mem_available_ratio"] is not None
+            and sample["mem_available_ratio"] <= mem_limit
+        ):
+            reasons.append(f"mem_available_ratio {sample['mem_available_ratio']} <= {mem_limit}")
+        rss_limit = getattr(t, f"{level}_cli_rss_bytes")
+        if (
+            rss_limit is not None
+            and sample["cli_rss_bytes"] is not None
+            and sample["cli_rss_bytes"] >= rss_limit
+        ):
+            reasons.append(f"cli_rss_bytes {sample['cli_rss_bytes']} >= {rss_limit}")
+        return reasons
+
+    def overloaded(self) -> bool:
+        """delay 임계치 초과 여부 (warm 프로세스 보충 등 미룰 수 있는 spawn용, 캐시된 샘플 기준)"""
+        return bool(self._exceeded(self.sample(), "delay"))
+
+    async def admit(self, model: str):
+        """실행 허가 - delay 임계치를 넘으면 대기, reject 임계치/최대 대기 시간을 넘으면 503"""
+        t = self.thresholds
+        started = time.monotonic()
+        sample = await self.refresh()
+        waited = False
+        while True:
+            reasons = self._exceeded(sample, "reject")
+            if reasons:
+                self._reject(model, reasons, started, waited)
+            if not self._exceeded(sample, "delay"):
+                break
+            elapsed = time.monotonic() - started
+            if elapsed >= t.max_delay:
+                self._reject(model, self._exceeded(sample, "delay"), started, waited)
+            waited = True
+            await asyncio.sleep(min(t.poll_interval, t.max_delay - elapsed))
+            sample = await self.refresh()
+
+        self.admitted += 1
+        if waited:
+            self.delayed += 1
+            self.delay_seconds_total += time.monotonic() - started
+
+    def _reject(self, model: str, reasons: list[str], started: float, waited: bool):
+        self.rejected += 1
+        if waited:
+            self.delay_seconds_total += time.monotonic() - started
+        raise SchedulerRejectedError(
+            f"Host overloaded, not starting {model}: {', '.join(reasons)}",
+            status_code=503,
+            retry_after=self.thresholds.retry_after,
+        )
+
+    def stats(self) -> dict:
+        return {
+            "thresholds": self.thresholds.to_dict(),
+            "sample": self.sample(),
+            "admitted": self.admitted,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "delay_seconds_total": round(self.delay_seconds_total, 3),
+        }
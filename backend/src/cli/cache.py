@@ -0,0 +1,288 @@
+"""
+CLI 응답 캐시 모듈 - 같은 prompt 재실행 방지
+
+키: 모델 + CLI 버전 + prompt 해시 + 저장소 HEAD + 작업 트리 변경 상태 (content-addressed)
+1단계: 메모리 LRU, 2단계: SQLite 디스크 캐시
+실행마다 달라지는 값(로그 id, 리소스 사용량, 세션)은 저장하지 않는다.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+# 실행마다 달라지는 결과 필드 - 캐시에 남기면 만료된 로그 id 등을 돌려주게 됨
+PER_RUN_FIELDS = ("output_log_id", "usage", "session", "session_id", "cached")
+
+
+def read_repo_head(repo_path: str = ".") -> Optional[str]:
+    """git 저장소의 HEAD 커밋 해시 (subprocess 없이 .git 파일에서 직접 읽음)"""
+    git_dir = os.path.join(repo_path, ".git")
+    try:
+        if os.path.isfile(git_dir):
+            # worktree/submodule: "gitdir: <path>"
+            with open(git_dir) as f:
+                git_dir = os.path.join(repo_path, f.read().split(":", 1)[1].strip())
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+        if not head.startswith("ref:"):
+            return head
+
+        ref = head.split(":", 1)[1].strip()
+        ref_path = os.path.join(git_dir, ref)
+        if os.path.isfile(ref_path):
+            with open(ref_path) as f:
+                return f.read().strip()
+
+        packed = os.path.join(git_dir, "packed-refs")
+        if os.path.isfile(packed):
+            with open(packed) as f:
+                for line in f:
+                    parts = line.strip().split(" ")
+                    if len(parts) == 2 and parts[1] == ref:
+                        return parts[0]
+    except (OSError, IndexError):
+        pass
+    return None
+
+
+def read_worktree_state(repo_path: str = ".") -> Optional[str]:
+    """작업 트리 변경 상태 해시 - 변경이 없으면 "", git으로 확인할 수 없으면 None
+
+    git status --porcelain 항목과 변경된 파일의 크기/수정 시각을 해시한다.
+    (이미 수정된 파일을 다시 고쳐도 status 줄은 같으므로 파일 정보까지 포함)
+    """
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v1", "-z", "--untracked-files=all"],
+            cwd=repo_path,
+            capture_output=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    if not result.stdout:
+        return ""
+
+    digest = hashlib.sha256(result.stdout)
+    for entry in result.stdout.split(b"\0"):
+        # "XY <path>" (이름 변경의 원래 경로는 상태 없이 다음 항목으로 옴)
+        path = entry[3:]
+        if not path:
+            continue
+        try:
+            stat = os.stat(os.path.join(repo_path, os.fsdecode(path)))
+        except OSError:
+            continue
+        digest.update(f"\0{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def make_cache_key(
+    model: str,
+    prompt: str,
+    cli_version: Optional[str] = None,
+    repo_head: Optional[str] = None,
+    worktree: Optional[str] = None,
+) -> str:
+    """캐시 키 생성"""
+    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()
+    material = "\0".join(
+        [model, cli_version or "", prompt_hash, repo_head or "", worktree or ""]
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        hits = self.memory_hits + self.disk_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class ResponseCache:
+    """CLI 실행 결과 캐시 (메모리 LRU + SQLite)
+
+    - max_entries: 메모리 LRU 항목 수 상한
+    - max_disk_bytes: 디스크 캐시 전체 크기 상한 (초과 시 오래 안 쓴 항목부터 삭제)
+    - max_age: 항목 유효 기간(초)
+    - max_entry_bytes: 이보다 큰 결과는 저장하지 않음
+    - db_path: None이면 메모리 캐시만 사용
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_entries: int = 256,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        max_age: float = 24 * 3600.0,
+        max_entry_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.max_age = max_age
+        self.max_entry_bytes = max_entry_bytes
+        self._memory: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._stats = CacheStats()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+    def stats(self) -> dict:
+        """캐시 통계 (hit/miss 카운터 포함)"""
+        data = self._stats.to_dict()
+        data["memory_entries"] = len(self._memory)
+        data["disk_enabled"] = self.db_path is not None
+        return data
+
+    async def get(self, key: str) -> Optional[dict]:
+        """캐시 조회 - 메모리 → 디스크 순"""
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if now - created_at < self.max_age:
+                self._memory.move_to_end(key)
+                self._stats.memory_hits += 1
+                return dict(value)
+            del self._memory[key]
+
+        if self.db_path is not None:
+            row = await asyncio.to_thread(self._disk_get, key, now)
+            if row is not None:
+                created_at, value = row
+                self._remember(key, created_at, value)
+                self._stats.disk_hits += 1
+                return dict(value)
+
+        self._stats.misses += 1
+        return None
+
+    async def set(self, key: str, value: dict):
+        """결과 저장 (실행마다 달라지는 필드는 제외)"""
+        value = {k: v for k, v in value.items() if k not in PER_RUN_FIELDS}
+        payload = json.dumps(value)
+        if len(payload) > self.max_entry_bytes:
+            return
+        now = time.time()
+        self._remember(key, now, dict(value))
+        self._stats.stores += 1
+        if self.db_path is not None:
+            await asyncio.to_thread(self._disk_set, key, payload, now)
+
+    async def clear(self):
+        """캐시 비우기"""
+        self._memory.clear()
+        if self.db_path is not None:
+            await asyncio.to_thread(self._disk_execute, "DELETE FROM responses", ())
+
+    def close(self):
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, created_at: float, value: dict):
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
+
+    # === SQLite (스레드에서 실행) ===
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+            )
+            self._db.commit()
+        return self._db
+
+    def _disk_execute(self, sql: str, params: tuple):
+        with self._db_lock:
+            db = self._connect()
+            db.execute(sql, params)
+            db.commit()
+
+    def _disk_get(self, key: str, now: float) -> Optional[tuple[float, dict]]:
+        with self._db_lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if now - created_at >= self.max_age:
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                db.commit()
+                return None
+            db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            db.commit()
+            return created_at, json.loads(value)
+
+    def _disk_set(self, key: str, payload: str, now: float):
+        with self._db_lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            self._disk_evict(db, now)
+            db.commit()
+
+    def _disk_evict(self, db: sqlite3.Connection, now: float):
+        """기간 만료 항목과 크기 상한 초과분 삭제"""
+        expired = db.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.max_age,)
+        ).rowcount
+        self._stats.evictions += max(expired, 0)
+
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        rows = db.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self._stats.evictions += 1
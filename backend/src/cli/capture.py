@@ -0,0 +1,241 @@
+"""
+CLI 출력 캡처 모듈 - 메모리 사용량이 고정된 출력 수집
+
+process.communicate()는 출력 전체를 메모리에 모으므로, 긴 에이전트 실행은
+요청마다 수십 MB를 차지한다. BoundedCapture는 앞부분(head)과 뒷부분(tail)만
+메모리에 두고, 한도를 넘는 출력은 임시 파일로 흘려보낸다(spill).
+전체 로그는 CaptureStore에서 mmap으로 바이트 범위 단위로 읽을 수 있다.
+이벤트 루프에서는 awrite로 쓰고(파일 쓰기는 스레드에서), 만료된 로그는 타이머로 정리한다.
+"""
+
+import asyncio
+import mmap
+import os
+import tempfile
+import time
+import uuid
+from typing import Optional
+
+TRUNCATION_MARKER = b"\n... [output truncated] ...\n"
+
+
+class BoundedCapture:
+    """head/tail만 메모리에 두는 출력 버퍼
+
+    - head_bytes: 메모리에 보관할 앞부분 크기
+    - tail_bytes: 메모리에 보관할 뒷부분 크기
+    - spill_path: 한도를 넘으면 전체 출력을 기록할 파일 (None이면 중간 부분은 버림)
+    """
+
+    def __init__(
+        self,
+        head_bytes: int = 256 * 1024,
+        tail_bytes: int = 256 * 1024,
+        spill_path: Optional[str] = None,
+    ):
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self.spill_path = spill_path
+        self.total_bytes = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._spill_file = None
+        self._spilled = False
+
+    @property
+    def truncated(self) -> bool:
+        """메모리 한도를 넘었는지 여부"""
+        return self.total_bytes > self.head_bytes + self.tail_bytes
+
+    @property
+    def spilled(self) -> bool:
+        return self._spilled
+
+    def write(self, data: bytes):
+        """출력 조각 추가 (파일 쓰기 포함 - 이벤트 루프에서는 awrite 사용)"""
+        pending = self._append(data)
+        if pending:
+            self._write_spill(pending)
+
+    async def awrite(self, data: bytes):
+        """출력 조각 추가 - spill 파일 쓰기는 스레드에서"""
+        pending = self._append(data)
+        if pending:
+            await asyncio.to_thread(self._write_spill, pending)
+
+    def _append(self, data: bytes) -> list[bytes]:
+        """메모리 head/tail 갱신 - spill 파일에 써야 할 조각 반환"""
+        if not data:
+            return []
+        pending = []
+        limit = self.head_bytes + self.tail_bytes
+        if (
+            not self._spilled
+            and self.spill_path is not None
+            and self.total_bytes + len(data) > limit
+        ):
+            # 한도 초과 - 지금까지의 출력을 파일에 쓰고 이후 출력도 계속 기록
+            self._spilled = True
+            pending += [bytes(self._head), bytes(self._tail)]
+        self.total_bytes += len(data)
+        if self._spilled:
+            pending.append(data)
+
+        room = self.head_bytes - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if data:
+            self._tail += data
+            if len(self._tail) > self.tail_bytes:
+                del self._tail[:len(self._tail) - self.tail_bytes]
+        return pending
+
+    def _write_spill(self, chunks: list[bytes]):
+        if self._spill_file is None:
+            self._spill_file = open(self.spill_path, "wb")
+        for chunk in chunks:
+            self._spill_file.write(chunk)
+
+    def close(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def getvalue(self) -> bytes:
+        """메모리에 남은 출력 (잘렸으면 head + 표시 + tail)"""
+        if not self.truncated:
+            return bytes(self._head + self._tail)
+        return bytes(self._head) + TRUNCATION_MARKER + bytes(self._tail)
+
+
+class CaptureStore:
+    """spill된 전체 로그 저장소 - log_id로 바이트 범위 조회
+
+    - directory: 로그 파일 디렉터리 (None이면 임시 디렉터리)
+    - max_age: 이 시간(초)이 지난 로그 파일은 cleanup에서 삭제
+      (등록되지 않은 파일 - 이전 프로세스가 남긴 로그 - 도 수정 후 max_age가 지나면 삭제)
+    - head_bytes/tail_bytes: 새 캡처의 메모리 한도
+    - cleanup_interval: start() 후 정리 주기(초)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_age: float = 3600.0,
+        head_bytes: int = 256 * 1024,
+        tail_bytes: int = 256 * 1024,
+        cleanup_interval: float = 300.0,
+    ):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "gitcommand-cli-logs")
+        self.max_age = max_age
+        self.head_bytes = head_bytes
+        self.tail_bytes = tail_bytes
+        self.cleanup_interval = cleanup_interval
+        self._logs: dict[str, tuple[str, float]] = {}
+        self._cleanup_task: Optional[asyncio.Task] = None
+        self._directory_ready = False
+        self.removed = 0
+
+    async def start(self):
+        """시작 시 한 번 정리하고 주기적 정리 시작"""
+        if self._cleanup_task is not None:
+            return
+        await self.acleanup()
+        self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+
+    async def stop(self):
+        if self._cleanup_task is None:
+            return
+        self._cleanup_task.cancel()
+        try:
+            await self._cleanup_task
+        except asyncio.CancelledError:
+            pass
+        self._cleanup_task = None
+
+    async def _cleanup_loop(self):
+        while True:
+            await asyncio.sleep(self.cleanup_interval)
+            await self.acleanup()
+
+    def create(self) -> tuple[str, BoundedCapture]:
+        """새 캡처 생성 - (log_id, capture)"""
+        if not self._directory_ready:
+            os.makedirs(self.directory, exist_ok=True)
+            self._directory_ready = True
+        log_id = uuid.uuid4().hex
+        path = os.path.join(self.directory, f"{log_id}.log")
+        capture = BoundedCapture(self.head_bytes, self.tail_bytes, spill_path=path)
+        return log_id, capture
+
+    def register(self, log_id: str, capture: BoundedCapture):
+        """spill된 캡처를 조회 가능하도록 등록 (파일은 닫혀 있어야 함 - capture.close)"""
+        capture.close()
+        if capture.spilled:
+            self._logs[log_id] = (capture.spill_path, time.time())
+
+    def size(self, log_id: str) -> int:
+        path = self._path(log_id)
+        return os.path.getsize(path)
+
+    def read(self, log_id: str, start: int = 0, end: Optional[int] = None) -> bytes:
+        """로그의 [start, end) 바이트 범위 읽기 (mmap)"""
+        path = self._path(log_id)
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            end = size if end is None else min(end, size)
+            start = max(0, start)
+            if size == 0 or start >= end:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[start:end]
+
+    def _expire(self) -> tuple[list[str], set[str]]:
+        """기간이 지난 로그를 등록 해제 - (삭제할 파일, 남은 파일)"""
+        now = time.time()
+        expired = []
+        for log_id, (path, created_at) in list(self._logs.items()):
+            if now - created_at >= self.max_age:
+                del self._logs[log_id]
+                expired.append(path)
+        return expired, {path for path, _ in self._logs.values()}
+
+    def _remove_files(self, expired: list[str], keep: set[str]) -> int:
+        """만료된 로그와 등록되지 않은 오래된 .log 파일 삭제 - 삭제한 수 반환"""
+        paths = list(expired)
+        cutoff = time.time() - self.max_age
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if (
+                        entry.name.endswith(".log")
+                        and entry.path not in keep
+                        and entry.path not in paths
+                        and entry.stat().st_mtime < cutoff
+                    ):
+                        paths.append(entry.path)
+        except OSError:
+            pass
+        removed = 0
+        for path in paths:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def cleanup(self):
+        """기간이 지난 로그 삭제 (동기)"""
+        self.removed += self._remove_files(*self._expire())
+
+    async def acleanup(self):
+        """기간이 지난 로그 삭제 - 파일 삭제/디렉터리 조회는 스레드에서"""
+        expired, keep = self._expire()
+        self.removed += await asyncio.to_thread(self._remove_files, expired, keep)
+
+    def _path(self, log_id: str) -> str:
+        if log_id not in self._logs:
+            raise KeyError(log_id)
+        return self._logs[log_id][0]
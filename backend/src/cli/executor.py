@@ -4,9 +4,36 @@ CLI 실행 모듈 - 구독제 CLI 도구 연동
 """
 
 import asyncio
+import codecs
+import contextlib
+import os
 import platform
 import shutil
-from typing import AsyncIterator
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from .accounting import ExecutionUsage, UsageSampler
+from .cache import make_cache_key, read_repo_head, read_worktree_state
+from .capture import BoundedCapture
+from .latency import LatencyTracker
+from .parser import IncrementalFenceParser, parse_cli_output
+from .structured import StreamJsonParser, parse_stream_json
+from .scheduler import SchedulerRejectedError
+
+if TYPE_CHECKING:
+    from .accounting import UsageAccounting
+    from .admission import HostAdmission
+    from .cache import ResponseCache
+    from .fairness import FairQueue
+    from .capture import CaptureStore
+    from .pool import CLIProcessPool
+    from .health import ModelHealthTracker
+    from .registry import CLIRegistry
+    from .scheduler import CLIScheduler
+    from .sessions import CLISessionStore
+    from .singleflight import SingleFlight
+    from .supervisor import ProcessSupervisor
+    from .timeouts import AdaptiveTimeouts
 
 
 def _get_executable_path(cmd: str) -> str:
@@ -35,6 +62,21 @@ class CLITimeoutError(Exception):
     pass
 
 
+# 메모리 한도 캡처 모드의 읽기 단위와 stderr 보관 크기
+READ_CHUNK_BYTES = 64 * 1024
+STDERR_TAIL_BYTES = 64 * 1024
+
+# 스트리밍 읽기 단위와 소비자가 느릴 때 쌓아 둘 최대 조각 수 (넘으면 읽기 중단 → CLI 쪽 대기)
+STREAM_CHUNK_BYTES = 16 * 1024
+STREAM_MAX_PENDING_CHUNKS = 16
+
+# 헤지 지연의 기본값 (해당 모델의 p95 기록이 없을 때)
+DEFAULT_HEDGE_DELAY = 15.0
+
+# 실행 시간 기록을 연동한 컴포넌트가 없는 executor의 공용 기록 (헤지 지연 p95 계산용)
+_default_latency = LatencyTracker()
+
+
 def select_model(preferred: str, available: list[str]) -> str:
     """사용 가능한 모델 중 선택"""
     if preferred in available:
@@ -44,20 +86,138 @@ def select_model(preferred: str, available: list[str]) -> str:
     raise CLIExecutionError("No available models")
 
 
-async def execute_with_fallback(prompt: str, models: list[str]) -> dict:
-    """모델 폴백과 함께 실행 - 첫 번째 실패 시 다음 모델로 시도"""
+async def execute_with_fallback(
+    prompt: str,
+    models: list[str],
+    hedge: bool = False,
+    hedge_delay: Optional[float] = None,
+    **executor_options,
+) -> dict:
+    """모델 폴백과 함께 실행 - 첫 번째 실패 시 다음 모델로 시도
+
+    hedge=True이면 앞 모델이 hedge_delay(미지정 시 모델별 p95) 안에 응답하지 않을 때
+    다음 모델을 병렬로 시작하고 가장 먼저 성공한 결과를 사용한다.
+    executor_options(pool, registry, scheduler 등)는 모델별 CLIExecutor에 그대로 전달된다.
+    """
+    if hedge:
+        return await _execute_hedged(prompt, models, hedge_delay, executor_options)
+
+    errors: list[Exception] = []
     for model in models:
         try:
-            executor = CLIExecutor(model=model)
+            executor = CLIExecutor(model=model, **executor_options)
             result = await executor.generate_code(prompt)
             result["model_used"] = model
             return result
-        except Exception:
+        except Exception as e:
+            errors.append(e)
             continue
 
+    _raise_all_failed(errors)
+
+
+def _raise_all_failed(errors: list[Exception]):
+    """모든 모델 실패 - 전부 스케줄러 거부였다면 그 에러(429/503)를 그대로 전달"""
+    if errors and all(isinstance(e, SchedulerRejectedError) for e in errors):
+        raise errors[-1]
     raise CLIExecutionError("All models failed")
 
 
+async def _execute_hedged(
+    prompt: str,
+    models: list[str],
+    hedge_delay: Optional[float],
+    executor_options: dict,
+) -> dict:
+    """헤지 실행 - 늦어지는 모델이 있으면 다음 모델을 겹쳐 실행"""
+    started_at = time.monotonic()
+    remaining = list(models)
+    running: dict[asyncio.Task, str] = {}
+    executors: dict[str, CLIExecutor] = {}
+    launched_at: dict[str, float] = {}
+    finished_at: dict[str, float] = {}
+    launched: list[str] = []
+    errors: list[Exception] = []
+
+    def launch_next():
+        model = remaining.pop(0)
+        executor = executors[model] = CLIExecutor(model=model, **executor_options)
+        task = asyncio.create_task(executor.generate_code(prompt))
+        running[task] = model
+        launched_at[model] = time.monotonic()
+        launched.append(model)
+
+    def delay_for(model: str) -> float:
+        if hedge_delay is not None:
+            return hedge_delay
+        p95 = executors[model].latency.percentile(model, 0.95)
+        return p95 if p95 is not None else DEFAULT_HEDGE_DELAY
+
+    try:
+        while remaining or running:
+            if not running:
+                launch_next()
+
+            timeout = delay_for(launched[-1]) if remaining else None
+            done, _ = await asyncio.wait(
+                running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                # 응답이 늦음 - 다음 모델을 병렬로 시작
+                launch_next()
+                continue
+
+            for task in done:
+                model = running.pop(task)
+                finished_at[model] = time.monotonic()
+                if task.exception() is not None:
+                    errors.append(task.exception())
+                    continue
+
+                now = time.monotonic()
+                result = task.result()
+                # 순차 실행이었다면 앞 모델들이 쓴 시간 + 승자의 실행 시간이 필요
+                sequential = now - launched_at[model]
+                for other in launched[:launched.index(model)]:
+                    sequential += finished_at.get(other, now) - launched_at[other]
+                elapsed = now - started_at
+
+                result["model_used"] = model
+                result["hedged"] = len(launched) > 1
+                result["models_launched"] = list(launched)
+                result["elapsed_seconds"] = round(elapsed, 3)
+                result["hedge_saved_seconds"] = round(max(0.0, sequential - elapsed), 3)
+                return result
+    finally:
+        # 남은 실행은 취소 (executor가 프로세스를 종료함)
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    _raise_all_failed(errors)
+
+
+def _structured_extra(parsed: dict) -> dict:
+    """구조화 출력 결과에서 응답에 추가할 필드"""
+    extra = {"tool_calls": parsed["tool_calls"], "file_edits": parsed["file_edits"]}
+    if parsed["session_id"]:
+        extra["session_id"] = parsed["session_id"]
+    return extra
+
+
+def _with_context(context: str, prompt: str) -> str:
+    """컨텍스트를 앞에 붙인 prompt"""
+    if not context:
+        return prompt
+    return f"{context}\n\n{prompt}"
+
+
+def _event_text(events: list[dict]) -> str:
+    """StreamJsonParser 이벤트 중 텍스트만 이어 붙임"""
+    return "".join(event["text"] for event in events if event["type"] == "text")
+
+
 class CLIExecutor:
     """CLI 실행기 - 구독제 CLI 도구 연동
 
@@ -68,14 +228,88 @@ class CLIExecutor:
     - Qwen: qwen 'prompt'
     """
 
-    def __init__(self, model: str = "claude", timeout: int = 120):
+    def __init__(
+        self,
+        model: str = "claude",
+        timeout: int = 120,
+        pool: Optional["CLIProcessPool"] = None,
+        registry: Optional["CLIRegistry"] = None,
+        cache: Optional["ResponseCache"] = None,
+        scheduler: Optional["CLIScheduler"] = None,
+        priority: int = 0,
+        health: Optional["ModelHealthTracker"] = None,
+        capture_store: Optional["CaptureStore"] = None,
+        supervisor: Optional["ProcessSupervisor"] = None,
+        singleflight: Optional["SingleFlight"] = None,
+        timeouts: Optional["AdaptiveTimeouts"] = None,
+        accounting: Optional["UsageAccounting"] = None,
+        endpoint: str = "direct",
+        admission: Optional["HostAdmission"] = None,
+        fair_queue: Optional["FairQueue"] = None,
+        user: str = "anonymous",
+        stream_flush_interval: float = 0.0,
+        structured_output: bool = False,
+        sessions: Optional["CLISessionStore"] = None,
+        session_key: Optional[str] = None,
+        latency: Optional[LatencyTracker] = None,
+    ):
         self.model = model
         self.timeout = timeout
+        self.pool = pool
+        self.registry = registry
+        self.cache = cache
+        self.scheduler = scheduler
+        self.priority = priority
+        self.health = health
+        # 지정하면 출력 전체 대신 head/tail만 메모리에 보관 (나머지는 로그 파일)
+        self.capture_store = capture_store
+        self.supervisor = supervisor
+        # 지정하면 같은 모델/prompt의 동시 실행을 하나로 합침
+        self.singleflight = singleflight
+        # 지정하면 고정 timeout 대신 관측한 실행 시간으로 타임아웃 결정
+        self.timeouts = timeouts
+        # 지정하면 실행별 CPU/메모리/출력 크기를 기록 (endpoint별로도 집계)
+        self.accounting = accounting
+        self.endpoint = endpoint
+        # 지정하면 호스트 부하가 높을 때 CLI 실행을 미루거나 거부
+        self.admission = admission
+        # 지정하면 사용자별 대기열에서 차례대로 실행 (큰 배치가 다른 사용자를 굶기지 않게)
+        self.fair_queue = fair_queue
+        self.user = user
+        # 0보다 크면 이 시간(초) 동안 도착한 스트리밍 조각을 STREAM_CHUNK_BYTES까지 합쳐서 전달
+        self.stream_flush_interval = stream_flush_interval
+        # True이면 stream_json_args가 있는 CLI는 JSON 이벤트 스트림으로 실행 (없으면 텍스트 파싱)
+        self.structured_output = structured_output
+        # 둘 다 지정하면 session_args가 있는 CLI는 같은 키(이슈)의 이전 대화를 이어서 실행
+        self.sessions = sessions
+        self.session_key = session_key
+        # 성공한 실행 시간 기록 - 헤지 지연/스케줄러/폴백 순서/적응형 타임아웃이 같은 기록을 읽음
+        # (지정하지 않으면 연동한 컴포넌트의 기록, 그것도 없으면 모듈 공용 기록)
+        if latency is None:
+            latency = next(
+                (c.latency for c in (timeouts, health, scheduler) if c is not None),
+                _default_latency,
+            )
+        self.latency = latency
+        # 이번 실행에 붙일 세션 인자 (_session_run 동안만 설정)
+        self._session_args: list[str] = []
         # 실제 작동하는 CLI 명령어 형식
+        # stream_json_args: 줄 단위 JSON 이벤트를 출력하게 하는 추가 인자 (구조화 출력 지원 CLI만)
+        # session_args: 세션 id로 새 대화를 시작/재개하는 옵션 (세션 재개 지원 CLI만)
         self._cli_configs = {
-            "claude": {"cmd": "claude", "args": ["-p"], "use_stdin": True},
-            "codex": {"cmd": "codex", "args": ["exec"], "use_stdin": False},
-            "gemini": {"cmd": "gemini", "args": ["-p"], "use_stdin": False},
+            "claude": {
+                "cmd": "claude", "args": ["-p"], "use_stdin": True,
+                "stream_json_args": ["--output-format", "stream-json", "--verbose"],
+                "session_args": {"start": "--session-id", "resume": "--resume"},
+            },
+            "codex": {
+                "cmd": "codex", "args": ["exec"], "use_stdin": False,
+                "stream_json_args": ["--json"],
+            },
+            "gemini": {
+                "cmd": "gemini", "args": ["-p"], "use_stdin": False,
+                "stream_json_args": ["--output-format", "stream-json"],
+            },
             "qwen": {"cmd": "qwen", "args": [], "use_stdin": False},
         }
 
@@ -86,68 +320,427 @@ class CLIExecutor:
             {"cmd": self.model, "args": [], "use_stdin": False}
         )
 
-    async def generate_code(self, prompt: str) -> dict:
-        """코드 생성 실행 - 실제 CLI 호출"""
+    def _is_structured(self, config: dict) -> bool:
+        """이번 실행을 JSON 이벤트 스트림으로 읽을지 여부"""
+        return self.structured_output and bool(config.get("stream_json_args"))
+
+    def _text_capture(self) -> BoundedCapture:
+        """구조화 출력의 어시스턴트 텍스트 보관용 캡처 (출력 캡처와 같은 head/tail 한도)"""
+        if self.capture_store is None:
+            return BoundedCapture()
+        return BoundedCapture(
+            head_bytes=self.capture_store.head_bytes, tail_bytes=self.capture_store.tail_bytes
+        )
+
+    def _cli_args(self, config: dict) -> list[str]:
+        args = config["args"] + self._session_args
+        if self._is_structured(config):
+            return args + config["stream_json_args"]
+        return args
+
+    def _resolve_executable(self, cmd: str) -> str:
+        """실행 파일 경로 - 레지스트리 캐시가 있으면 PATH 탐색 생략"""
+        status = self.registry.cached(cmd) if self.registry is not None else None
+        if status is None:
+            return _get_executable_path(cmd)
+        if not status.available:
+            raise FileNotFoundError(f"{cmd} is not installed")
+        return status.path or cmd
+
+    async def _create_subprocess(self, *cmd: str, **kwargs) -> asyncio.subprocess.Process:
+        """프로세스 생성 - supervisor가 있으면 별도 프로세스 그룹으로 감독 하에 실행"""
+        if self.supervisor is not None:
+            return await self.supervisor.spawn(*cmd, model=self.model, **kwargs)
+        return await asyncio.create_subprocess_exec(*cmd, **kwargs)
+
+    async def _terminate(self, process: asyncio.subprocess.Process):
+        """프로세스 종료 및 회수 - supervisor가 있으면 프로세스 그룹 전체 종료"""
+        if self.supervisor is not None:
+            await self.supervisor.terminate(process)
+            return
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+    async def spawn_process(self, prompt: Optional[str] = None) -> asyncio.subprocess.Process:
+        """CLI 프로세스 생성 - stdin 방식은 prompt 없이 띄워 두고 나중에 입력 가능"""
         config = self._get_cli_config()
-        cmd_path = _get_executable_path(config["cmd"])
+        cmd_path = self._resolve_executable(config["cmd"])
+
+        if config["use_stdin"]:
+            # Claude: stdin으로 prompt 전달
+            return await self._create_subprocess(
+                cmd_path, *self._cli_args(config),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+        # Codex/Gemini/Qwen: args로 prompt 전달
+        cmd = [cmd_path] + self._cli_args(config) + [prompt or ""]
+        return await self._create_subprocess(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
 
+    def _flight_key(self, prompt: str, worktree: Optional[str] = None) -> str:
+        """동시 실행 병합 키 - 모델/CLI 버전/prompt/저장소 HEAD (+ 작업 트리 상태)"""
+        config = self._get_cli_config()
+        status = self.registry.cached(config["cmd"]) if self.registry is not None else None
+        return make_cache_key(
+            self.model,
+            prompt,
+            cli_version=status.version if status is not None else None,
+            repo_head=read_repo_head(os.getcwd()),
+            worktree=worktree,
+        )
+
+    async def _cache_key(self, prompt: str) -> Optional[str]:
+        """응답 캐시 키 - 작업 트리 변경 상태까지 포함 (확인할 수 없으면 None → 캐시 안 함)"""
+        cwd = os.getcwd()
+        if read_repo_head(cwd) is None:
+            # git 저장소가 아님 - 변경을 추적할 수 없음
+            return None
+        worktree = await asyncio.to_thread(read_worktree_state, cwd)
+        if worktree is None:
+            return None
+        return self._flight_key(prompt, worktree)
+
+    async def generate_code(self, prompt: str, use_cache: bool = True, context: str = "") -> dict:
+        """코드 생성 실행 - 캐시 확인 후 실제 CLI 호출 (동일 요청은 실행 하나로 병합)
+
+        context: 이슈/저장소 컨텍스트 - prompt 앞에 붙이되, 세션을 재개하면 다시 보내지 않음
+        """
+        session_args = self._get_cli_config().get("session_args")
+        if self.sessions is not None and self.session_key and session_args:
+            return await self._session_run(prompt, context, session_args)
+        prompt = _with_context(context, prompt)
+
+        key = None
+        if self.cache is not None and use_cache:
+            key = await self._cache_key(prompt)
+        if key is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                cached["cached"] = True
+                return cached
+
+        if self.singleflight is None:
+            return await self._run_and_cache(prompt, key)
+        return await self.singleflight.do(
+            key or self._flight_key(prompt),
+            lambda: self._run_and_cache(prompt, key),
+        )
+
+    async def _session_run(
+        self, prompt: str, context: str, session_args: dict, retry: bool = True
+    ) -> dict:
+        """세션 실행 - 대화 상태에 따라 결과가 달라지므로 캐시/병합하지 않음
+
+        재개에 실패하면(CLI 쪽 세션 기록이 사라진 경우 등) 컨텍스트를 포함해
+        새 세션으로 한 번 더 실행한다. 서킷 열림/스케줄러·부하 거부는 CLI를 실행하지
+        않은 것이므로 세션을 그대로 두고 바로 전달한다. 시간 초과는 세션을 버리고 전달한다.
+        """
+        # health 모듈이 이 모듈을 import하므로 여기서 가져옴
+        from .health import CircuitOpenError
+
+        session = self.sessions.acquire(self.model, self.session_key)
+        async with session.lock:
+            resumed = session.resumable
+            if resumed:
+                self._session_args = [session_args["resume"], session.session_id]
+                full_prompt = prompt
+            else:
+                self._session_args = [session_args["start"], session.session_id]
+                full_prompt = _with_context(context, prompt)
+            try:
+                result = await self._scheduled_run(full_prompt)
+            except (CircuitOpenError, SchedulerRejectedError):
+                raise
+            except CLITimeoutError:
+                # 중단된 턴이 CLI 쪽 세션에 어떻게 남았는지 알 수 없으므로 버리고, 재시도하지 않음
+                self.sessions.invalidate(session)
+                raise
+            except CLIExecutionError:
+                self.sessions.invalidate(session)
+                if not (resumed and retry):
+                    raise
+            else:
+                saved = self.sessions.record(session, len(_with_context(context, "").encode()))
+                result["session"] = {
+                    "session_id": session.session_id,
+                    "resumed": resumed,
+                    "turn": session.turns,
+                    "prompt_bytes_saved": saved,
+                }
+                return result
+            finally:
+                self._session_args = []
+        return await self._session_run(prompt, context, session_args, retry=False)
+
+    async def _run_and_cache(self, prompt: str, key: Optional[str]) -> dict:
+        result = await self._scheduled_run(prompt)
+        if key is not None:
+            await self.cache.set(key, result)
+        return result
+
+    async def _scheduled_run(self, prompt: str) -> dict:
+        """서킷 확인 → 호스트 부하 허가 → 스케줄러 슬롯 획득 → 실행"""
+        if self.health is not None:
+            # 서킷이 열린 모델은 spawn 없이 바로 실패
+            self.health.check(self.model)
+        # _tracked_run이 시작되면 결과 기록(시험 요청 해제 포함)은 그쪽이 맡음
+        owned = False
+        try:
+            await self._admit()
+            async with self._slots():
+                owned = True
+                return await self._tracked_run(prompt)
+        except BaseException:
+            # 거부/대기 중 취소(헤지 패배, 배치 취소, 연결 끊김) - 시험 요청을 붙잡아 두지 않음
+            if self.health is not None and not owned:
+                self.health.release_trial(self.model)
+            raise
+
+    @contextlib.asynccontextmanager
+    async def _slots(self) -> AsyncIterator[None]:
+        """모델 슬롯(같은 우선순위는 사용자별 DRR) → 전체 공정 대기열 슬롯 순서로 획득
+
+        전체 슬롯은 모델 슬롯이 빈 뒤에만 잡으므로, 모델 대기열에서 기다리는 배치가
+        전체 슬롯을 점유해 다른 사용자의 요청을 막지 않는다.
+        """
+        model_slot = (
+            self.scheduler.slot(self.model, self.priority, self.user)
+            if self.scheduler is not None else contextlib.nullcontext()
+        )
+        async with model_slot:
+            async with self._fair_slot():
+                yield
+
+    def _fair_slot(self):
+        """사용자별 공정 대기열 슬롯 (fair_queue가 없으면 바로 통과)"""
+        if self.fair_queue is None:
+            return contextlib.nullcontext()
+        return self.fair_queue.slot(self.user)
+
+    async def _admit(self):
+        """호스트 부하 확인 (부하가 높으면 대기 또는 503) - 슬롯을 잡기 전에 호출"""
+        if self.admission is not None:
+            await self.admission.admit(self.model)
+
+    async def _tracked_run(self, prompt: str) -> dict:
+        """실행 결과를 헬스 트래커에 기록"""
+        if self.health is None:
+            return await self._run(prompt)
         try:
-            if config["use_stdin"]:
-                # Claude: stdin으로 prompt 전달
-                process = await asyncio.create_subprocess_exec(
-                    cmd_path, *config["args"],
-                    stdin=asyncio.subprocess.PIPE,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                try:
-                    stdout, stderr = await asyncio.wait_for(
-                        process.communicate(input=prompt.encode()),
-                        timeout=self.timeout,
+            result = await self._run(prompt)
+        except (CLIExecutionError, CLITimeoutError):
+            self.health.record_failure(self.model)
+            raise
+        except BaseException:
+            # 취소 등 모델 상태와 무관한 종료
+            self.health.release_trial(self.model)
+            raise
+        self.health.record_success(self.model)
+        return result
+
+    async def _run(self, prompt: str) -> dict:
+        """실제 CLI 호출"""
+        config = self._get_cli_config()
+        prompt_bytes = len(prompt.encode())
+        timeout = (
+            self.timeouts.timeout_for(self.model, prompt_bytes)
+            if self.timeouts is not None else self.timeout
+        )
+
+        started_at = time.monotonic()
+
+        try:
+            process = None
+            if (
+                config["use_stdin"] and self.pool is not None
+                and not self._is_structured(config) and not self._session_args
+            ):
+                # 미리 띄워 둔 프로세스 사용 (없으면 새로 실행)
+                # 풀은 세션 없이 텍스트 출력 모드로 띄움
+                process = self.pool.acquire(self.model)
+            if process is None:
+                process = await self.spawn_process(prompt)
+
+            sampler = self._start_sampler(process)
+            stdin_input = prompt.encode() if config["use_stdin"] else None
+            try:
+                if self.capture_store is None:
+                    collected = await asyncio.wait_for(
+                        self._communicate(process, stdin_input),
+                        timeout=timeout,
                     )
-                except asyncio.TimeoutError:
-                    process.kill()
-                    raise CLITimeoutError(f"CLI timed out after {self.timeout}s")
-            else:
-                # Codex/Gemini/Qwen: args로 prompt 전달
-                cmd = [cmd_path] + config["args"] + [prompt]
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                try:
-                    stdout, stderr = await asyncio.wait_for(
-                        process.communicate(),
-                        timeout=self.timeout,
+                else:
+                    collected = await asyncio.wait_for(
+                        self._communicate_bounded(process, stdin_input),
+                        timeout=timeout,
                     )
-                except asyncio.TimeoutError:
-                    process.kill()
-                    raise CLITimeoutError(f"CLI timed out after {self.timeout}s")
+            except asyncio.TimeoutError:
+                await self._terminate(process)
+                self._record_usage(sampler, process, started_at)
+                if self.timeouts is not None:
+                    self.timeouts.record_timeout(self.model, prompt_bytes, timeout)
+                raise CLITimeoutError(f"CLI timed out after {timeout}s")
+            except asyncio.CancelledError:
+                # 헤지 실행에서 진 경우 등 - 프로세스를 남기지 않음
+                await asyncio.shield(self._terminate(process))
+                self._record_usage(sampler, process, started_at)
+                raise
 
+            output, errors, parsed, extra, (stdout_bytes, stderr_bytes) = collected
+            usage = self._record_usage(sampler, process, started_at, stdout_bytes, stderr_bytes)
             if process.returncode != 0:
-                raise CLIExecutionError(stderr.decode())
-
-            output = stdout.decode()
+                raise CLIExecutionError(errors)
+            if parsed.get("is_error"):
+                # stream-json 결과 이벤트가 실패를 알림 (종료 코드는 0일 수 있음)
+                raise CLIExecutionError(output or errors)
 
-            # Parse code from output
-            from .parser import parse_cli_output
-            parsed = parse_cli_output(output)
+            self.latency.record(self.model, time.monotonic() - started_at, prompt_bytes)
 
             code = ""
             if parsed["code_blocks"]:
                 code = parsed["code_blocks"][0]["code"]
+            elif parsed.get("file_edits"):
+                # 구조화 출력: 텍스트에 코드 블록이 없으면 파일 수정 도구의 내용 사용
+                code = next((e["content"] for e in parsed["file_edits"] if e["content"]), "")
 
-            return {
+            result = {
                 "success": True,
                 "code": code,
                 "output": output,
                 "model": self.model,
+                **extra,
             }
+            if usage is not None:
+                result["usage"] = usage
+            return result
 
         except (FileNotFoundError, OSError) as e:
             raise CLIExecutionError(f"CLI not found: {e}")
 
+    def _start_sampler(self, process: asyncio.subprocess.Process) -> Optional[UsageSampler]:
+        """리소스 사용량 샘플링 시작 - supervisor 하에서는 프로세스 그룹 전체를 집계"""
+        if self.accounting is None:
+            return None
+        sampler = UsageSampler(process.pid, group=self.supervisor is not None)
+        sampler.start()
+        return sampler
+
+    def _record_usage(
+        self,
+        sampler: Optional[UsageSampler],
+        process: asyncio.subprocess.Process,
+        started_at: float,
+        stdout_bytes: int = 0,
+        stderr_bytes: int = 0,
+    ) -> Optional[dict]:
+        """실행 사용량 기록 - 결과에 붙일 dict 반환"""
+        if sampler is None:
+            return None
+        sampler.stop()
+        usage = ExecutionUsage(
+            model=self.model,
+            endpoint=self.endpoint,
+            wall_seconds=time.monotonic() - started_at,
+            cpu_user_seconds=sampler.cpu_user_seconds,
+            cpu_system_seconds=sampler.cpu_system_seconds,
+            max_rss_bytes=sampler.max_rss_bytes,
+            stdout_bytes=stdout_bytes,
+            stderr_bytes=stderr_bytes,
+            exit_status=process.returncode,
+        )
+        self.accounting.record(usage)
+        return usage.to_dict()
+
+    async def _communicate(
+        self, process: asyncio.subprocess.Process, stdin_input: Optional[bytes]
+    ) -> tuple[str, str, dict, dict, tuple[int, int]]:
+        """출력 전체를 메모리에 모아 파싱 - (output, stderr, parsed, extra, (stdout/stderr 크기))"""
+        stdout, stderr = await process.communicate(input=stdin_input)
+        sizes = (len(stdout), len(stderr))
+        output = stdout.decode()
+        if process.returncode != 0:
+            return output, stderr.decode(), {"code_blocks": []}, {}, sizes
+
+        if self._is_structured(self._get_cli_config()):
+            parsed = parse_stream_json(output)
+            return parsed["text"], stderr.decode(), parsed, _structured_extra(parsed), sizes
+
+        # Parse code from output
+        return output, stderr.decode(), parse_cli_output(output), {}, sizes
+
+    async def _communicate_bounded(
+        self, process: asyncio.subprocess.Process, stdin_input: Optional[bytes]
+    ) -> tuple[str, str, dict, dict, tuple[int, int]]:
+        """메모리 한도 캡처 - head/tail만 보관하고 나머지는 로그 파일로 spill
+
+        코드 블록은 출력이 도착하는 대로 파싱하므로 잘린 중간 부분의 코드도 추출된다.
+        """
+        log_id, capture = self.capture_store.create()
+        errors = BoundedCapture(head_bytes=0, tail_bytes=STDERR_TAIL_BYTES)
+        structured = self._is_structured(self._get_cli_config())
+        # 구조화 출력은 이벤트에서 꺼낸 텍스트만 보관 (원본 이벤트 스트림은 캡처/로그 파일에)
+        if structured:
+            parser = StreamJsonParser(text_capture=self._text_capture())
+        else:
+            parser = IncrementalFenceParser(retain_text=False)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        async def feed_stdin():
+            if stdin_input is None:
+                return
+            try:
+                process.stdin.write(stdin_input)
+                await process.stdin.drain()
+                process.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        async def pump_stdout():
+            while True:
+                chunk = await process.stdout.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                await capture.awrite(chunk)
+                parser.feed(decoder.decode(chunk))
+            parser.feed(decoder.decode(b"", final=True))
+
+        async def pump_stderr():
+            while True:
+                chunk = await process.stderr.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                errors.write(chunk)
+
+        try:
+            await asyncio.gather(feed_stdin(), pump_stdout(), pump_stderr())
+            await process.wait()
+        finally:
+            if capture.spilled:
+                await asyncio.to_thread(capture.close)
+            self.capture_store.register(log_id, capture)
+
+        extra = {
+            "output_truncated": capture.truncated,
+            "output_bytes": capture.total_bytes,
+            "output_log_id": log_id if capture.spilled else None,
+        }
+        output = capture.getvalue().decode(errors="replace")
+        sizes = (capture.total_bytes, errors.total_bytes)
+        parsed = parser.close()
+        if structured:
+            output = parsed["text"]
+            extra.update(_structured_extra(parsed))
+        return output, errors.getvalue().decode(errors="replace"), parsed, extra, sizes
+
     async def analyze_code(self, prompt: str) -> dict:
         """코드 분석 실행"""
         result = await self.generate_code(prompt)
@@ -155,27 +748,196 @@ class CLIExecutor:
         return result
 
     async def stream_output(self, prompt: str) -> AsyncIterator[str]:
-        """스트리밍 출력"""
-        config = self._get_cli_config()
-        cmd_path = _get_executable_path(config["cmd"])
-
-        if config["use_stdin"]:
-            process = await asyncio.create_subprocess_exec(
-                cmd_path, *config["args"],
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            process.stdin.write(prompt.encode())
-            await process.stdin.drain()
-            process.stdin.close()
+        """스트리밍 출력 - 같은 모델/prompt의 진행 중인 스트림이 있으면 공유"""
+        if self.singleflight is None:
+            source = self._scheduled_stream(prompt)
         else:
-            cmd = [cmd_path] + config["args"] + [prompt]
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            source = self.singleflight.stream(
+                "stream:" + self._flight_key(prompt),
+                lambda: self._scheduled_stream(prompt),
             )
+        # 소비자가 중간에 닫으면 안쪽 generator도 바로 닫아 CLI를 종료 (GC까지 미루지 않음)
+        async with contextlib.aclosing(source):
+            async for line in source:
+                yield line
+
+    async def _scheduled_stream(self, prompt: str) -> AsyncIterator[str]:
+        """서킷 확인 → 호스트 부하 허가 → 스트림이 끝날 때까지 슬롯 점유"""
+        if self.health is not None:
+            self.health.check(self.model)
+        owned = False
+        try:
+            await self._admit()
+            async with self._slots():
+                owned = True
+                async with contextlib.aclosing(self._tracked_stream(prompt)) as lines:
+                    async for line in lines:
+                        yield line
+        except BaseException:
+            if self.health is not None and not owned:
+                self.health.release_trial(self.model)
+            raise
+
+    async def _tracked_stream(self, prompt: str) -> AsyncIterator[str]:
+        """스트림 결과를 헬스 트래커에 기록"""
+        try:
+            async with contextlib.aclosing(self._stream(prompt)) as lines:
+                async for line in lines:
+                    yield line
+        except (CLIExecutionError, CLITimeoutError):
+            if self.health is not None:
+                self.health.record_failure(self.model)
+            raise
+        except BaseException:
+            # 취소/소비자가 중간에 닫음 등 모델 상태와 무관한 종료
+            if self.health is not None:
+                self.health.release_trial(self.model)
+            raise
+        if self.health is not None:
+            self.health.record_success(self.model)
+
+    async def _stream(self, prompt: str) -> AsyncIterator[str]:
+        """CLI 출력을 조각 단위로 읽음
+
+        - stdout/stderr를 동시에 읽어 stderr 파이프가 가득 차 멈추는 일이 없음
+        - 줄바꿈과 무관하게 STREAM_CHUNK_BYTES 단위로 읽어 전달 (줄바꿈 없는 긴 출력도 제한)
+        - 소비자가 느리면 대기 조각이 STREAM_MAX_PENDING_CHUNKS에서 멈춰 CLI 쪽에 backpressure
+        - 끝나면 회수하고 종료 코드가 0이 아니면 CLIExecutionError, 중간에 닫히면 종료 후 회수
+        - 구조화 출력 모드에서는 JSON 이벤트 중 어시스턴트 텍스트만 전달
+        - 전체 실행 시간이 타임아웃(적응형 타임아웃이 있으면 그 값)을 넘으면 CLI를 종료하고
+          CLITimeoutError (소비자가 멈춰 있어도 CLI는 종료됨)
+        """
+        config = self._get_cli_config()
+        prompt_bytes = len(prompt.encode())
+        timeout = (
+            self.timeouts.timeout_for(self.model, prompt_bytes)
+            if self.timeouts is not None else self.timeout
+        )
+        started_at = time.monotonic()
+        process = await self.spawn_process(prompt)
+        sampler = self._start_sampler(process)
+        stdout_bytes = 0
+        timed_out = False
+        chunks: asyncio.Queue = asyncio.Queue(maxsize=STREAM_MAX_PENDING_CHUNKS)
+        errors = BoundedCapture(head_bytes=0, tail_bytes=STDERR_TAIL_BYTES)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # 구조화 출력이면 JSON 이벤트 중 어시스턴트 텍스트만 전달 (보관 텍스트는 head/tail만)
+        structured = (
+            StreamJsonParser(text_capture=self._text_capture())
+            if self._is_structured(config) else None
+        )
+
+        async def feed_stdin():
+            if not config["use_stdin"]:
+                return
+            try:
+                process.stdin.write(prompt.encode())
+                await process.stdin.drain()
+                process.stdin.close()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+        async def pump_stdout():
+            nonlocal stdout_bytes
+            try:
+                while True:
+                    chunk = await process.stdout.read(STREAM_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    stdout_bytes += len(chunk)
+                    await chunks.put(chunk)
+            except Exception:
+                await chunks.put(None)
+                raise
+            await chunks.put(None)
+
+        async def pump_stderr():
+            while True:
+                chunk = await process.stderr.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                errors.write(chunk)
+
+        async def expire():
+            nonlocal timed_out
+            await asyncio.sleep(timeout)
+            timed_out = True
+            # 출력 pump는 EOF를 받아 끝나고, 소비자가 돌아오면 CLITimeoutError
+            await asyncio.shield(self._terminate(process))
+
+        pumps = [
+            asyncio.create_task(feed_stdin()),
+            asyncio.create_task(pump_stdout()),
+            asyncio.create_task(pump_stderr()),
+        ]
+        watchdog = asyncio.create_task(expire())
+        finished = False
+        streamed = False
+        parsed = None
+        try:
+            eof = False
+            while not eof:
+                chunk = await chunks.get()
+                if chunk is None:
+                    break
+                text = decoder.decode(chunk)
+                if self.stream_flush_interval > 0:
+                    text, eof = await self._coalesce(chunks, decoder, text)
+                if structured is not None:
+                    text = _event_text(structured.feed(text))
+                if text:
+                    streamed = True
+                    yield text
+            tail = decoder.decode(b"", final=True)
+            if structured is not None:
+                tail = _event_text(structured.feed(tail))
+                parsed = structured.close()
+                if not streamed and not tail:
+                    # 텍스트 이벤트 없이 최종 결과만 온 경우
+                    tail = parsed["text"]
+            if tail:
+                yield tail
+
+            await asyncio.gather(*pumps)
+            await process.wait()
+            finished = True
+        finally:
+            watchdog.cancel()
+            if not finished:
+                for pump in pumps:
+                    pump.cancel()
+                await asyncio.shield(self._terminate(process))
+                await asyncio.gather(*pumps, return_exceptions=True)
+            self._record_usage(sampler, process, started_at, stdout_bytes, errors.total_bytes)
+
+        if timed_out:
+            if self.timeouts is not None:
+                self.timeouts.record_timeout(self.model, prompt_bytes, timeout)
+            raise CLITimeoutError(f"CLI stream timed out after {timeout}s")
+        if process.returncode != 0:
+            raise CLIExecutionError(errors.getvalue().decode(errors="replace"))
+        if parsed is not None and parsed["is_error"]:
+            raise CLIExecutionError(parsed["text"] or errors.getvalue().decode(errors="replace"))
 
-        async for line in process.stdout:
-            yield line.decode()
+    async def _coalesce(
+        self, chunks: asyncio.Queue, decoder: codecs.IncrementalDecoder, text: str
+    ) -> tuple[str, bool]:
+        """stream_flush_interval 동안 도착한 조각을 STREAM_CHUNK_BYTES까지 합침 - (text, eof)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.stream_flush_interval
+        parts = [text]
+        size = len(text)
+        while size < STREAM_CHUNK_BYTES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                chunk = await asyncio.wait_for(chunks.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            if chunk is None:
+                return "".join(parts), True
+            part = decoder.decode(chunk)
+            parts.append(part)
+            size += len(part)
+        return "".join(parts), False
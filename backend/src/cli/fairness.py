@@ -0,0 +1,199 @@
+"""
+사용자별 공정 대기열 모듈 - Deficit Round Robin
+
+실행이 요청 순서대로 처리되면 큰 배치를 보낸 사용자 한 명이 다른 사용자를 굶긴다.
+사용자(세션/JWT subject)별 대기열을 두고 DRR로 번갈아 실행 슬롯을 나눠 주므로,
+배치가 돌고 있어도 다른 사용자의 단일 요청은 한 라운드 안에 실행된다.
+executor는 모델 슬롯(CLIScheduler, 같은 우선순위는 사용자별 DRR)을 얻은 뒤에 전체 슬롯을 잡는다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from .latency import percentile
+from .scheduler import SchedulerRejectedError
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    cost: int
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _UserState:
+    """사용자별 대기열/DRR 상태와 지표"""
+    queue: deque = field(default_factory=deque)
+    deficit: float = 0.0
+    # 이번 라운드에서 quantum을 이미 받았는지
+    visiting: bool = False
+    running: int = 0
+    served: int = 0
+    rejected: int = 0
+    wait_times: deque = field(default_factory=lambda: deque(maxlen=200))
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self.queue if not waiter.future.done())
+
+
+class FairQueue:
+    """사용자별 DRR 실행 슬롯 분배
+
+    - max_concurrent: 전체 동시 실행 수
+    - quantum: 라운드마다 사용자에게 주는 실행 비용 (weight 배)
+    - weights: 사용자별 가중치 (기본 1.0)
+    - max_queue_per_user: 사용자별 대기열 길이 (초과 시 429)
+    - queue_timeout: 최대 대기 시간(초) (초과 시 503)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        quantum: float = 1.0,
+        weights: Optional[dict[str, float]] = None,
+        max_queue_per_user: int = 64,
+        queue_timeout: float = 300.0,
+    ):
+        if max_concurrent < 1 or quantum <= 0:
+            raise ValueError("Invalid fair queue settings")
+        self.max_concurrent = max_concurrent
+        self.quantum = quantum
+        self.weights: dict[str, float] = dict(weights or {})
+        self.max_queue_per_user = max_queue_per_user
+        self.queue_timeout = queue_timeout
+        self._users: dict[str, _UserState] = {}
+        # 대기자가 있는 사용자의 라운드 순서
+        self._active: deque[str] = deque()
+        self._running = 0
+
+    def _user(self, user: str) -> _UserState:
+        if user not in self._users:
+            self._users[user] = _UserState()
+        return self._users[user]
+
+    def set_weight(self, user: str, weight: float):
+        if weight <= 0:
+            raise ValueError("weight must be > 0")
+        self.weights[user] = weight
+
+    async def acquire(self, user: str, cost: int = 1):
+        """실행 슬롯 획득 - 없으면 사용자 대기열에서 차례를 기다림"""
+        state = self._user(user)
+        if self._running < self.max_concurrent and not self._active:
+            self._grant(state, 0.0)
+            return
+
+        if state.queued >= self.max_queue_per_user:
+            state.rejected += 1
+            raise SchedulerRejectedError(
+                f"Too many queued executions for {user} ({self.max_queue_per_user} waiting)",
+                status_code=429,
+                retry_after=max(1, int(self.queue_timeout / 10)),
+            )
+
+        waiter = _Waiter(future=asyncio.get_running_loop().create_future(), cost=cost)
+        state.queue.append(waiter)
+        if user not in self._active:
+            self._active.append(user)
+        self._dispatch()
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._abandon(user, waiter)
+            state.rejected += 1
+            raise SchedulerRejectedError(
+                f"Fair queue wait for {user} exceeded {self.queue_timeout}s",
+                status_code=503,
+                retry_after=max(1, int(self.queue_timeout / 10)),
+            )
+        except asyncio.CancelledError:
+            self._abandon(user, waiter)
+            raise
+
+    def _abandon(self, user: str, waiter: _Waiter):
+        """대기 포기 - 직전에 슬롯을 받았다면 돌려줌"""
+        if waiter.future.done() and not waiter.future.cancelled():
+            self.release(user)
+        else:
+            waiter.future.cancel()
+
+    def _grant(self, state: _UserState, waited: float):
+        self._running += 1
+        state.running += 1
+        state.served += 1
+        state.wait_times.append(waited)
+
+    def release(self, user: str):
+        """실행 슬롯 반납"""
+        state = self._user(user)
+        state.running = max(0, state.running - 1)
+        self._running = max(0, self._running - 1)
+        self._dispatch()
+
+    def _dispatch(self):
+        """빈 슬롯을 DRR 순서로 분배"""
+        while self._running < self.max_concurrent and self._active:
+            user = self._active[0]
+            state = self._users[user]
+            while state.queue and state.queue[0].future.done():
+                state.queue.popleft()
+            if not state.queue:
+                # 대기열이 비면 라운드에서 빠지고 남은 deficit은 버림
+                self._active.popleft()
+                state.deficit = 0.0
+                state.visiting = False
+                continue
+
+            if not state.visiting:
+                state.deficit += self.quantum * self.weights.get(user, 1.0)
+                state.visiting = True
+
+            head = state.queue[0]
+            if state.deficit < head.cost:
+                # 이번 라운드 몫을 다 씀 - 다음 사용자로
+                state.visiting = False
+                self._active.rotate(-1)
+                continue
+
+            state.queue.popleft()
+            state.deficit -= head.cost
+            self._grant(state, time.monotonic() - head.queued_at)
+            head.future.set_result(None)
+            if not state.queue or state.deficit < state.queue[0].cost:
+                state.visiting = False
+                if state.queue:
+                    self._active.rotate(-1)
+
+    @asynccontextmanager
+    async def slot(self, user: str, cost: int = 1) -> AsyncIterator[None]:
+        """슬롯 획득 → 실행 → 반납"""
+        await self.acquire(user, cost)
+        try:
+            yield
+        finally:
+            self.release(user)
+
+    def stats(self) -> dict:
+        """사용자별 대기열 길이/실행 수/대기 시간"""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": self._running,
+            "users": {
+                user: {
+                    "weight": self.weights.get(user, 1.0),
+                    "queued": state.queued,
+                    "running": state.running,
+                    "served": state.served,
+                    "rejected": state.rejected,
+                    "wait_time_p50": round(percentile(state.wait_times, 0.5), 4),
+                    "wait_time_p95": round(percentile(state.wait_times, 0.95), 4),
+                }
+                for user, state in sorted(self._users.items())
+            },
+        }
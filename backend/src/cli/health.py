@@ -0,0 +1,161 @@
+"""
+모델 헬스 추적 모듈 - 서킷 브레이커와 지연 시간 기반 폴백 순서
+
+모델별 최근 성공률을 기록하고 (실행 시간은 공유 LatencyTracker의 p50 사용),
+연속 실패가 쌓이면 서킷을 열어 spawn 없이 바로 건너뛴다.
+쿨다운이 지나면 half-open 상태에서 시험 요청 하나만 허용한다.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .executor import CLIExecutionError
+from .latency import LatencyTracker
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(CLIExecutionError):
+    """서킷이 열린 모델 호출 에러"""
+    pass
+
+
+@dataclass
+class ModelHealth:
+    """모델별 헬스 상태"""
+    state: str = CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    trial_in_flight: bool = False
+    outcomes: deque = field(default_factory=lambda: deque(maxlen=50))
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        if not self.outcomes:
+            return None
+        return sum(self.outcomes) / len(self.outcomes)
+
+
+class ModelHealthTracker:
+    """모델별 서킷 브레이커 + 지연 시간 기반 폴백 순서
+
+    - failure_threshold: 서킷을 여는 연속 실패 횟수
+    - cooldown: 서킷이 열린 뒤 half-open으로 넘어가기까지의 시간(초)
+    - default_latency: 기록이 없는 모델의 예상 실행 시간(초)
+    - latency: 모델 실행 시간 기록 (executor와 공유, 없으면 자체 생성)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        default_latency: float = 30.0,
+        latency: Optional[LatencyTracker] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.default_latency = default_latency
+        self.latency = latency if latency is not None else LatencyTracker()
+        self._models: dict[str, ModelHealth] = {}
+
+    def _health(self, model: str) -> ModelHealth:
+        if model not in self._models:
+            self._models[model] = ModelHealth()
+        return self._models[model]
+
+    def state(self, model: str) -> str:
+        """현재 서킷 상태 (쿨다운이 지났으면 half-open)"""
+        health = self._health(model)
+        if health.state == OPEN and time.monotonic() - health.opened_at >= self.cooldown:
+            health.state = HALF_OPEN
+        return health.state
+
+    def allow(self, model: str) -> bool:
+        """호출 허용 여부 - half-open에서는 시험 요청 하나만 허용"""
+        state = self.state(model)
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN:
+            health = self._health(model)
+            if not health.trial_in_flight:
+                health.trial_in_flight = True
+                return True
+        return False
+
+    def check(self, model: str):
+        """호출 전 확인 - 서킷이 열려 있으면 CircuitOpenError"""
+        if not self.allow(model):
+            raise CircuitOpenError(f"{model} circuit is open after repeated failures")
+
+    def record_success(self, model: str, latency: Optional[float] = None):
+        """성공 기록 - 서킷을 닫음
+
+        latency: 실행 시간 (executor는 공유 LatencyTracker에 직접 기록하므로 넘기지 않음)
+        """
+        health = self._health(model)
+        health.outcomes.append(1)
+        health.consecutive_failures = 0
+        health.state = CLOSED
+        health.trial_in_flight = False
+        if latency is not None:
+            self.latency.record(model, latency)
+
+    def record_failure(self, model: str):
+        """실패 기록 - 연속 실패가 임계치를 넘거나 시험 요청이 실패하면 서킷을 엶"""
+        health = self._health(model)
+        health.outcomes.append(0)
+        health.consecutive_failures += 1
+        if health.state == HALF_OPEN or health.consecutive_failures >= self.failure_threshold:
+            health.state = OPEN
+            health.opened_at = time.monotonic()
+        health.trial_in_flight = False
+
+    def release_trial(self, model: str):
+        """결과 없이 끝난 시험 요청 (취소 등) - 다음 요청이 다시 시험할 수 있게 함"""
+        self._health(model).trial_in_flight = False
+
+    def expected_time_to_success(self, model: str) -> float:
+        """예상 성공 소요 시간 = 최근 실행 시간 p50 / 성공률"""
+        health = self._health(model)
+        latency = self.latency.percentile(model, 0.5)
+        if latency is None:
+            latency = self.default_latency
+        success_rate = health.success_rate
+        if success_rate is None:
+            success_rate = 1.0
+        return latency / max(success_rate, 0.05)
+
+    def order(self, models: list[str], preferred: Optional[str] = None) -> list[str]:
+        """폴백 순서 결정
+
+        서킷이 열린 모델은 제외하고, 사용자가 고른 모델(preferred)은 맨 앞에 두며
+        나머지는 예상 성공 소요 시간 순으로 정렬한다.
+        """
+        candidates = [m for m in dict.fromkeys(models) if self.state(m) != OPEN]
+        head = [preferred] if preferred in candidates else []
+        rest = [m for m in candidates if m != preferred]
+        rest.sort(key=self.expected_time_to_success)
+        return head + rest
+
+    def _latency_p50(self, model: str) -> Optional[float]:
+        latency = self.latency.percentile(model, 0.5)
+        return round(latency, 4) if latency is not None else None
+
+    def stats(self) -> dict:
+        """모델별 헬스 상태"""
+        return {
+            model: {
+                "state": self.state(model),
+                "consecutive_failures": health.consecutive_failures,
+                "success_rate": (
+                    round(health.success_rate, 4) if health.success_rate is not None else None
+                ),
+                "latency_p50": self._latency_p50(model),
+                "expected_time_to_success": round(self.expected_time_to_success(model), 4),
+            }
+            for model, health in self._models.items()
+        }
@@ -0,0 +1,91 @@
+"""
+CLI 실행 시간 기록 모듈 - 헤지 지연, 스케줄러 Retry-After, 폴백 순서, 적응형 타임아웃이 함께 사용
+
+실행마다 모델 × prompt 크기 구간별로 성공한 실행 시간을 한 번만 기록하고,
+각 컴포넌트는 같은 LatencyTracker에서 필요한 값(p50/p95/p99/평균)을 읽는다.
+"""
+
+import math
+from collections import deque
+from typing import Iterable, Optional
+
+# prompt 크기 구간 (bytes 상한, 이름)
+PROMPT_SIZE_BUCKETS = (
+    (1024, "<1KB"),
+    (8 * 1024, "1-8KB"),
+    (32 * 1024, "8-32KB"),
+    (None, ">=32KB"),
+)
+
+
+def prompt_size_bucket(prompt_bytes: int) -> str:
+    """prompt 크기 구간 이름"""
+    for limit, name in PROMPT_SIZE_BUCKETS:
+        if limit is None or prompt_bytes < limit:
+            return name
+    return PROMPT_SIZE_BUCKETS[-1][1]
+
+
+def percentile(samples: Iterable[float], percentile: float) -> float:
+    """nearest-rank 백분위수 (기록이 없으면 0.0)"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(percentile * len(ordered)) - 1))
+    return ordered[index]
+
+
+class LatencyTracker:
+    """모델 × prompt 크기 구간별 최근 성공 실행 시간
+
+    - window: 구간별로 보관할 최근 기록 수
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        # (model, bucket) → 최근 실행 시간(초)
+        self._samples: dict[tuple[str, str], deque] = {}
+        # 기록할 때마다 증가 - 저장이 필요한지 판단용
+        self.version = 0
+
+    def record(self, model: str, seconds: float, prompt_bytes: int = 0):
+        """성공한 실행 시간 기록"""
+        self.extend(model, prompt_size_bucket(prompt_bytes), [seconds])
+
+    def extend(self, model: str, bucket: str, seconds: Iterable[float]):
+        """구간에 기록 여러 개 추가 (저장된 값 복원용)"""
+        key = (model, bucket)
+        if key not in self._samples:
+            self._samples[key] = deque(maxlen=self.window)
+        self._samples[key].extend(seconds)
+        self.version += 1
+
+    def samples(self, model: str, bucket: Optional[str] = None) -> list[float]:
+        """구간 기록 (bucket이 없으면 모델 전체 기록)"""
+        if bucket is not None:
+            return list(self._samples.get((model, bucket), ()))
+        return [s for (m, _), values in self._samples.items() if m == model for s in values]
+
+    def percentile(
+        self, model: str, fraction: float, bucket: Optional[str] = None
+    ) -> Optional[float]:
+        """최근 실행 시간 백분위수 (기록이 없으면 None)"""
+        samples = self.samples(model, bucket)
+        if not samples:
+            return None
+        return percentile(samples, fraction)
+
+    def mean(self, model: str) -> Optional[float]:
+        """모델의 최근 평균 실행 시간 (기록이 없으면 None)"""
+        samples = self.samples(model)
+        if not samples:
+            return None
+        return sum(samples) / len(samples)
+
+    def buckets(self) -> dict[tuple[str, str], list[float]]:
+        """(model, bucket)별 기록 복사본"""
+        return {key: list(values) for key, values in self._samples.items()}
+
+    def clear(self):
+        self._samples.clear()
+        self.version += 1
@@ -30,23 +30,224 @@ def parse_cli_command(user_input: str) -> dict:
 
 def parse_cli_output(raw_output: str) -> dict:
     """CLI 출력에서 코드 블록과 설명 추출"""
-    # Extract code blocks
-    code_block_pattern = r"```(\w+)?\n([\s\S]*?)```"
-    code_blocks = []
-
-    for match in re.finditer(code_block_pattern, raw_output):
-        language = match.group(1) or "text"
-        code = match.group(2)
-        code_blocks.append({
-            "language": language,
-            "code": code.strip(),
-        })
+    parser = IncrementalFenceParser()
+    parser.feed(raw_output)
+    return parser.close()
 
-    # Extract explanation (text outside code blocks)
-    explanation = re.sub(code_block_pattern, "", raw_output).strip()
 
-    return {
-        "code_blocks": code_blocks,
-        "explanation": explanation,
-        "has_code": len(code_blocks) > 0,
-    }
+# 여는 fence: ``` + 언어(선택) + 줄바꿈
+_COMPAT_OPEN = re.compile(r"```(\w*)")
+# markdown 모드: 들여쓰기 + ``` 또는 ~~~ (3개 이상) + info string
+_MD_OPEN = re.compile(r"^([ \t]*)(`{3,}|~{3,})([^\n]*)$")
+_MD_CLOSE = re.compile(r"^[ \t]*(`{3,}|~{3,})[ \t]*$")
+
+
+class IncrementalFenceParser:
+    """청크 단위로 입력받는 코드 fence 파서
+
+    닫는 fence가 도착하는 즉시 코드 블록을 반환하고, 설명(코드 블록 밖 텍스트)은
+    복사하지 않고 전체 출력의 오프셋 구간으로만 기록한다.
+
+    - mode="compat": 기존 정규식 파서와 동일한 결과 (``` + 언어 + 줄바꿈 ... ```)
+    - mode="markdown": 줄 단위 fence - ``` / ~~~, 들여쓴 fence, 더 긴 fence 안의 중첩 fence 지원
+    - retain_text=False: 입력 텍스트를 보관하지 않음 (코드 블록만 필요할 때, 설명은 빈 문자열)
+    """
+
+    def __init__(self, mode: str = "compat", retain_text: bool = True):
+        if mode not in ("compat", "markdown"):
+            raise ValueError(f"Unknown fence parser mode: {mode}")
+        self.mode = mode
+        self.retain_text = retain_text
+        self.code_blocks: list[dict] = []
+        self._chunks: list[str] = []
+        self._length = 0
+        # 아직 판정하지 못한 꼬리 텍스트와 그 시작 오프셋
+        self._window = ""
+        self._window_start = 0
+        # 코드 블록이 차지하는 [start, end) 구간 (설명은 그 나머지)
+        self._block_spans: list[tuple[int, int]] = []
+        # 열린 fence 상태
+        self._open_start: Optional[int] = None
+        self._open_language = ""
+        self._content_start = 0
+        # compat 모드: 열린 블록의 내용 조각과 청크 경계에 걸친 ``` 탐지용 꼬리
+        self._content_parts: list[str] = []
+        self._content_length = 0
+        self._carry = ""
+        # markdown 모드 전용
+        self._fence_char = ""
+        self._fence_len = 0
+        self._fence_indent = 0
+        self._content_lines: list[str] = []
+
+    def feed(self, chunk: str) -> list[dict]:
+        """청크 입력 - 이번 청크로 완성된 코드 블록 목록 반환"""
+        if not chunk:
+            return []
+        offset = self._length
+        if self.retain_text:
+            self._chunks.append(chunk)
+        self._length += len(chunk)
+        before = len(self.code_blocks)
+        if self.mode == "compat":
+            self._feed_compat(chunk, offset)
+        else:
+            self._window += chunk
+            self._scan_markdown(final=False)
+        return self.code_blocks[before:]
+
+    def close(self) -> dict:
+        """입력 종료 - parse_cli_output과 같은 형태의 결과 반환"""
+        if self.mode == "markdown":
+            self._scan_markdown(final=True)
+            if self._open_start is not None:
+                # 닫히지 않은 fence는 문서 끝까지를 코드로 취급
+                self._emit_markdown(self._length)
+
+        return {
+            "code_blocks": list(self.code_blocks),
+            "explanation": self.explanation(self.text) if self.retain_text else "",
+            "has_code": len(self.code_blocks) > 0,
+        }
+
+    @property
+    def text(self) -> str:
+        """지금까지 입력된 전체 출력"""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def explanation_spans(self) -> list[tuple[int, int]]:
+        """설명 텍스트의 [start, end) 오프셋 구간"""
+        spans = []
+        position = 0
+        for start, end in self._block_spans:
+            if start > position:
+                spans.append((position, start))
+            position = end
+        if position < self._length:
+            spans.append((position, self._length))
+        return spans
+
+    def explanation(self, text: Optional[str] = None) -> str:
+        """오프셋 구간으로 설명 텍스트 생성"""
+        if text is None:
+            text = self.text
+        return "".join(text[start:end] for start, end in self.explanation_spans()).strip()
+
+    # === compat 모드 ===
+
+    def _feed_compat(self, text: str, offset: int):
+        """text: 새 입력, offset: text[0]의 전체 출력 기준 오프셋"""
+        while True:
+            if self._open_start is None:
+                window = self._window + text
+                base = offset - len(self._window)
+                position = 0
+                while True:
+                    index = window.find("```", position)
+                    if index < 0:
+                        # 끝의 `` 는 다음 청크에서 fence가 될 수 있으므로 남김
+                        self._window = window[max(len(window) - 2, position):]
+                        return
+                    match = _COMPAT_OPEN.match(window, index)
+                    end = match.end()
+                    if end == len(window):
+                        # 언어 이름/줄바꿈이 아직 도착하지 않음
+                        self._window = window[index:]
+                        return
+                    if window[end] == "\n":
+                        break
+                    position = index + 1
+
+                self._open_start = base + index
+                self._open_language = match.group(1) or "text"
+                self._content_start = base + end + 1
+                self._content_parts = []
+                self._content_length = 0
+                self._carry = ""
+                self._window = ""
+                text = window[end + 1:]
+                offset = self._content_start
+            else:
+                search = self._carry + text
+                index = search.find("```")
+                if index < 0:
+                    self._content_parts.append(text)
+                    self._content_length += len(text)
+                    self._carry = search[-2:]
+                    return
+
+                fence = self._content_length - len(self._carry) + index
+                content = "".join(self._content_parts) + text
+                self.code_blocks.append({
+                    "language": self._open_language,
+                    "code": content[:fence].strip(),
+                })
+                close_end = self._content_start + fence + 3
+                self._block_spans.append((self._open_start, close_end))
+                self._open_start = None
+                self._content_parts = []
+                text = content[fence + 3:]
+                offset = close_end
+
+    # === markdown 모드 ===
+
+    def _scan_markdown(self, final: bool):
+        window = self._window
+        base = self._window_start
+        position = 0
+
+        while True:
+            newline = window.find("\n", position)
+            if newline < 0:
+                if not final or position >= len(window):
+                    break
+                line_end = len(window)
+                next_position = len(window)
+            else:
+                line_end = newline
+                next_position = newline + 1
+
+            line = window[position:line_end]
+            line_start = base + position
+            if self._open_start is None:
+                match = _MD_OPEN.match(line)
+                if match and not (match.group(2)[0] == "`" and "`" in match.group(3)):
+                    info = match.group(3).strip()
+                    self._open_start = line_start
+                    self._open_language = info.split()[0] if info else "text"
+                    self._fence_char = match.group(2)[0]
+                    self._fence_len = len(match.group(2))
+                    self._fence_indent = len(match.group(1))
+                    self._content_lines = []
+            else:
+                match = _MD_CLOSE.match(line)
+                if (
+                    match
+                    and match.group(1)[0] == self._fence_char
+                    and len(match.group(1)) >= self._fence_len
+                ):
+                    self._emit_markdown(base + next_position)
+                else:
+                    self._content_lines.append(self._dedent(line))
+            position = next_position
+
+        self._window = window[position:]
+        self._window_start = base + position
+
+    def _dedent(self, line: str) -> str:
+        """여는 fence의 들여쓰기만큼 내용 줄의 앞 공백 제거"""
+        strip = 0
+        while strip < self._fence_indent and strip < len(line) and line[strip] in " \t":
+            strip += 1
+        return line[strip:]
+
+    def _emit_markdown(self, end: int):
+        self.code_blocks.append({
+            "language": self._open_language,
+            "code": "\n".join(self._content_lines).strip(),
+        })
+        self._block_spans.append((self._open_start, end))
+        self._open_start = None
+        self._content_lines = []
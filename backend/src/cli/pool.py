@@ -0,0 +1,260 @@
+"""
+CLI 프로세스 풀 모듈 - 미리 띄워 둔 CLI 프로세스 재사용
+
+stdin으로 prompt를 받는 CLI(Claude Code 등)는 프로세스를 먼저 띄워 두고
+요청이 오면 prompt만 써 넣으면 되므로 Node/CLI 콜드 스타트를 숨길 수 있다.
+argv로 prompt를 받는 CLI는 미리 띄울 수 없으므로 기존 one-shot 실행으로 폴백한다.
+
+대상 CLI는 비대화형(-p/exec) 모드에서 prompt 하나를 처리하고 종료하므로 워커 하나가
+요청 하나만 맡는다. 따라서 "N번 처리 후 교체" 같은 요청 수 기준 재활용은 의미가 없고
+(항상 1), 대기 중인 프로세스만 max_age 기준으로 교체한다. 여러 요청을 한 프로세스로
+처리하는 장수 워커는 요청 간 대화 상태가 섞이지 않는 CLI 프로토콜이 있어야 가능하다.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .admission import HostAdmission
+    from .registry import CLIRegistry
+    from .supervisor import ProcessSupervisor
+
+
+@dataclass
+class WarmProcess:
+    """미리 띄워 둔 CLI 프로세스"""
+    model: str
+    process: asyncio.subprocess.Process
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+    def is_healthy(self, max_age: float) -> bool:
+        """프로세스가 살아 있고 재활용 기한이 지나지 않았는지 확인"""
+        return self.process.returncode is None and self.age < max_age
+
+
+@dataclass
+class ModelPoolStats:
+    """모델별 풀 통계"""
+    hits: int = 0
+    misses: int = 0
+    spawned: int = 0
+    recycled: int = 0
+    spawn_failures: int = 0
+    # 연속 실패 수 - 성공하면 0으로 돌아감
+    consecutive_failures: int = 0
+    # 연속 실패가 한도에 닿으면 이 시각(monotonic)까지 보충을 멈춤
+    retry_at: float = 0.0
+
+
+class CLIProcessPool:
+    """모델별 warm CLI 프로세스 풀
+
+    - min_size: 모델별로 항상 유지할 대기 프로세스 수
+    - max_size: 수요가 몰릴 때 늘릴 수 있는 대기 프로세스 상한
+    - max_age: 이 시간(초)이 지난 대기 프로세스는 종료 후 새로 띄움 (recycle)
+      (꺼낸 프로세스는 요청 하나를 처리하고 종료하므로 요청 수 기준 재활용은 없음)
+    - health_interval: 죽은/오래된 프로세스를 정리하는 주기(초)
+    - max_spawn_failures/spawn_backoff: 연속으로 이만큼 띄우지 못하면 spawn_backoff초 동안 보충 중단
+      (CLI가 잠시 없었던 경우에도 풀이 영구히 꺼지지 않도록 기한 후 다시 시도)
+    """
+
+    def __init__(
+        self,
+        models: Optional[list[str]] = None,
+        min_size: int = 1,
+        max_size: int = 4,
+        max_age: float = 600.0,
+        health_interval: float = 30.0,
+        max_spawn_failures: int = 3,
+        spawn_backoff: float = 60.0,
+        registry: Optional["CLIRegistry"] = None,
+        supervisor: Optional["ProcessSupervisor"] = None,
+        admission: Optional["HostAdmission"] = None,
+    ):
+        if min_size < 0 or max_size < min_size:
+            raise ValueError("Invalid pool size: require 0 <= min_size <= max_size")
+        self.models = models if models is not None else ["claude"]
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_age = max_age
+        self.health_interval = health_interval
+        self.max_spawn_failures = max_spawn_failures
+        self.spawn_backoff = spawn_backoff
+        self.registry = registry
+        self.supervisor = supervisor
+        # 호스트 부하가 높으면 warm 프로세스 보충을 다음 헬스 체크로 미룸
+        self.admission = admission
+        self._idle: dict[str, list[WarmProcess]] = {m: [] for m in self.models}
+        self._targets: dict[str, int] = {m: min_size for m in self.models}
+        self._spawning: dict[str, int] = {m: 0 for m in self.models}
+        self._stats: dict[str, ModelPoolStats] = {m: ModelPoolStats() for m in self.models}
+        self._health_task: Optional[asyncio.Task] = None
+        self._fill_tasks: set[asyncio.Task] = set()
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def start(self):
+        """풀 시작 - 모델별 min_size 만큼 프로세스를 띄우고 헬스 체크 루프 실행"""
+        if self._running:
+            return
+        self._running = True
+        await asyncio.gather(*(self._fill(model) for model in self.models))
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    async def stop(self):
+        """풀 종료 - 대기 중인 프로세스를 모두 종료하고 회수"""
+        self._running = False
+        tasks = list(self._fill_tasks)
+        if self._health_task is not None:
+            tasks.append(self._health_task)
+            self._health_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for model, idle in self._idle.items():
+            while idle:
+                await self._terminate(idle.pop())
+
+    def acquire(self, model: str) -> Optional[asyncio.subprocess.Process]:
+        """대기 중인 프로세스 하나를 꺼냄 - 없으면 None (호출자는 one-shot 실행으로 폴백)"""
+        if not self._running or model not in self._idle:
+            return None
+
+        stats = self._stats[model]
+        idle = self._idle[model]
+        while idle:
+            warm = idle.pop(0)
+            if warm.is_healthy(self.max_age):
+                stats.hits += 1
+                self._schedule_fill(model)
+                return warm.process
+            stats.recycled += 1
+            self._schedule_terminate(warm)
+
+        # 풀이 비어 있었음 - 다음 버스트를 위해 목표 크기를 늘림
+        stats.misses += 1
+        self._targets[model] = min(self.max_size, self._targets[model] + 1)
+        self._schedule_fill(model)
+        return None
+
+    def stats(self) -> dict:
+        """모델별 풀 상태"""
+        return {
+            model: {
+                "idle": len(self._idle[model]),
+                "target": self._targets[model],
+                "hits": s.hits,
+                "misses": s.misses,
+                "spawned": s.spawned,
+                "recycled": s.recycled,
+                "spawn_failures": s.spawn_failures,
+                "consecutive_failures": s.consecutive_failures,
+            }
+            for model, s in self._stats.items()
+        }
+
+    async def _spawn(self, model: str) -> asyncio.subprocess.Process:
+        """stdin 대기 상태의 CLI 프로세스 생성"""
+        from .executor import CLIExecutor
+
+        executor = CLIExecutor(model=model, registry=self.registry, supervisor=self.supervisor)
+        return await executor.spawn_process()
+
+    async def _fill(self, model: str):
+        """목표 크기까지 대기 프로세스를 채움"""
+        stats = self._stats[model]
+        while (
+            self._running
+            and self._spawn_allowed(stats)
+            and len(self._idle[model]) + self._spawning[model] < self._targets[model]
+            and (self.admission is None or not self.admission.overloaded())
+        ):
+            self._spawning[model] += 1
+            try:
+                process = await self._spawn(model)
+            except (FileNotFoundError, OSError):
+                # 설치되지 않은 CLI는 backoff 동안 반복해서 띄우지 않음
+                stats.spawn_failures += 1
+                stats.consecutive_failures += 1
+                if stats.consecutive_failures >= self.max_spawn_failures:
+                    stats.retry_at = time.monotonic() + self.spawn_backoff
+                continue
+            finally:
+                self._spawning[model] -= 1
+
+            stats.consecutive_failures = 0
+
+            warm = WarmProcess(model=model, process=process)
+            if not self._running:
+                await self._terminate(warm)
+                return
+            stats.spawned += 1
+            self._idle[model].append(warm)
+
+    def _spawn_allowed(self, stats: ModelPoolStats) -> bool:
+        if stats.consecutive_failures < self.max_spawn_failures:
+            return True
+        if time.monotonic() < stats.retry_at:
+            return False
+        # backoff가 끝남 - 한 번 더 시도하고 실패하면 다시 backoff
+        stats.consecutive_failures = self.max_spawn_failures - 1
+        return True
+
+    def _schedule_fill(self, model: str):
+        if not self._running:
+            return
+        task = asyncio.create_task(self._fill(model))
+        self._fill_tasks.add(task)
+        task.add_done_callback(self._fill_tasks.discard)
+
+    def _schedule_terminate(self, warm: WarmProcess):
+        task = asyncio.create_task(self._terminate(warm))
+        self._fill_tasks.add(task)
+        task.add_done_callback(self._fill_tasks.discard)
+
+    async def _health_loop(self):
+        """주기적으로 죽은/오래된 프로세스를 정리하고 다시 채움"""
+        while self._running:
+            await asyncio.sleep(self.health_interval)
+            await self.check_health()
+
+    async def check_health(self):
+        """헬스 체크 1회 실행"""
+        for model in self.models:
+            idle = self._idle[model]
+            healthy = [w for w in idle if w.is_healthy(self.max_age)]
+            stale = [w for w in idle if w not in healthy]
+            self._idle[model] = healthy
+            for warm in stale:
+                self._stats[model].recycled += 1
+                await self._terminate(warm)
+            # 수요가 없으면 목표 크기를 min_size 쪽으로 되돌림
+            if stale and self._targets[model] > self.min_size:
+                self._targets[model] -= 1
+            await self._fill(model)
+
+    async def _terminate(self, warm: WarmProcess):
+        """대기 프로세스 종료 및 회수"""
+        process = warm.process
+        if self.supervisor is not None:
+            await self.supervisor.terminate(process)
+            return
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        try:
+            await process.wait()
+        except ProcessLookupError:
+            pass
@@ -0,0 +1,147 @@
+"""
+CLI 레지스트리 모듈 - 설치 상태/버전 캐시
+
+check_cli_available은 요청마다 블로킹 subprocess를 실행하므로,
+모든 CLI를 asyncio subprocess로 동시에 확인하고 결과를 TTL 동안 캐시한다.
+"""
+
+import asyncio
+import shutil
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+SUPPORTED_CLIS = ["claude", "codex", "gemini", "qwen"]
+
+
+@dataclass
+class CLIStatus:
+    """CLI 설치 상태"""
+    name: str
+    available: bool
+    path: Optional[str] = None
+    version: Optional[str] = None
+    checked_at: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "available": self.available,
+            "path": self.path,
+            "version": self.version,
+        }
+
+
+class CLIRegistry:
+    """CLI 설치 상태 레지스트리
+
+    - 모든 CLI를 동시에 probe (asyncio subprocess, 이벤트 루프 블로킹 없음)
+    - ttl(초) 동안 결과 캐시, 만료 시 백그라운드에서 갱신하고 기존 값을 바로 반환
+    """
+
+    def __init__(
+        self,
+        names: Optional[list[str]] = None,
+        ttl: float = 300.0,
+        probe_timeout: float = 5.0,
+    ):
+        self.names = names if names is not None else list(SUPPORTED_CLIS)
+        self.ttl = ttl
+        self.probe_timeout = probe_timeout
+        self._statuses: dict[str, CLIStatus] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    async def probe(self, name: str) -> CLIStatus:
+        """CLI 하나의 설치 여부와 버전 확인"""
+        from .executor import _get_executable_path
+
+        path = await asyncio.to_thread(shutil.which, name)
+        executable = path or await asyncio.to_thread(_get_executable_path, name)
+        version = None
+        returncode = None
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                executable, "--version",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(
+                    process.communicate(), timeout=self.probe_timeout
+                )
+                returncode = process.returncode
+                lines = [line.strip() for line in stdout.decode(errors="replace").splitlines()]
+                version = next((line for line in lines if line), None)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        except (FileNotFoundError, OSError):
+            pass
+
+        return CLIStatus(
+            name=name,
+            available=path is not None or returncode == 0,
+            path=path or (executable if returncode == 0 else None),
+            version=version,
+            checked_at=time.monotonic(),
+        )
+
+    async def refresh(self) -> dict[str, CLIStatus]:
+        """모든 CLI를 동시에 다시 확인 (진행 중인 갱신이 있으면 공유)"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_all())
+        return await asyncio.shield(self._refresh_task)
+
+    async def _refresh_all(self) -> dict[str, CLIStatus]:
+        statuses = await asyncio.gather(*(self.probe(name) for name in self.names))
+        for status in statuses:
+            self._statuses[status.name] = status
+        return dict(self._statuses)
+
+    def _is_stale(self) -> bool:
+        if len(self._statuses) < len(self.names):
+            return True
+        oldest = min(s.checked_at for s in self._statuses.values())
+        return time.monotonic() - oldest >= self.ttl
+
+    async def get_all(self) -> dict[str, CLIStatus]:
+        """캐시된 상태 반환 - 최초 1회만 probe를 기다리고 이후엔 백그라운드 갱신"""
+        if len(self._statuses) < len(self.names):
+            return await self.refresh()
+        if self._is_stale() and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh_all())
+        return dict(self._statuses)
+
+    async def get(self, name: str) -> CLIStatus:
+        """CLI 하나의 캐시된 상태"""
+        if name not in self.names:
+            self.names.append(name)
+        statuses = await self.get_all()
+        return statuses[name]
+
+    def cached(self, name: str) -> Optional[CLIStatus]:
+        """캐시만 조회 (probe하지 않음)"""
+        return self._statuses.get(name)
+
+    async def start(self):
+        """초기 probe 후 ttl 주기로 백그라운드 갱신 시작"""
+        if self._loop_task is not None:
+            return
+        await self.refresh()
+        self._loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """백그라운드 갱신 중지"""
+        tasks = [t for t in (self._loop_task, self._refresh_task) if t is not None]
+        self._loop_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.ttl)
+            await self.refresh()
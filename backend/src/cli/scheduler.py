@@ -0,0 +1,259 @@
+"""
+CLI 실행 스케줄러 모듈 - 모델별 동시 실행 제한과 대기열
+
+버스트 요청이 무거운 CLI 프로세스를 한꺼번에 띄우지 않도록
+모델별 동시 실행 수를 제한하고, 초과 요청은 우선순위 대기열에 넣는다.
+대기열이 가득 차면 429, 대기 시간이 초과되면 503 (Retry-After 포함).
+같은 우선순위의 대기자 사이에서는 사용자별 DRR(Deficit Round Robin)로 다음 실행을 고르므로
+한 사용자의 배치가 모델 슬롯을 모두 차지해도 다른 사용자의 요청은 한 라운드 안에 실행된다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+from .latency import LatencyTracker, percentile
+
+
+class SchedulerRejectedError(Exception):
+    """스케줄러 거부 에러 (대기열 초과/대기 시간 초과)"""
+
+    def __init__(self, message: str, status_code: int, retry_after: int):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+@dataclass
+class ModelLimits:
+    """모델별 제한"""
+    max_concurrent: int = 2
+    max_queue: int = 16
+    queue_timeout: float = 60.0
+
+    def to_dict(self) -> dict:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+        }
+
+
+@dataclass
+class _ModelState:
+    """모델별 실행/대기 상태와 지표"""
+    running: int = 0
+    # (우선순위 역순, 순번, future, user) - 우선순위가 높을수록 먼저
+    waiters: list = field(default_factory=list)
+    # 같은 우선순위 대기자 사이의 사용자 라운드 순서와 남은 deficit
+    rotation: deque = field(default_factory=deque)
+    deficits: dict[str, float] = field(default_factory=dict)
+    admitted: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    queue_times: deque = field(default_factory=lambda: deque(maxlen=200))
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, future, _ in self.waiters if not future.done())
+
+
+class CLIScheduler:
+    """모델별 동시 실행 제한 + 우선순위 대기열
+
+    - max_concurrent: 모델별 동시 실행 CLI 수
+    - max_queue: 모델별 대기열 길이 (초과 시 429)
+    - queue_timeout: 대기열 최대 대기 시간(초) (초과 시 503)
+    - latency: 모델 실행 시간 기록 (Retry-After 계산과 run_time 지표용, executor와 공유)
+    - weights: 사용자별 DRR 가중치 (기본 1.0, FairQueue.weights를 공유할 수 있음)
+    제한은 set_limits로 실행 중에도 변경 가능
+    """
+
+    def __init__(
+        self,
+        default_limits: Optional[ModelLimits] = None,
+        limits: Optional[dict[str, ModelLimits]] = None,
+        latency: Optional[LatencyTracker] = None,
+        weights: Optional[dict[str, float]] = None,
+    ):
+        self.default_limits = default_limits or ModelLimits()
+        self.latency = latency if latency is not None else LatencyTracker()
+        self.weights = weights if weights is not None else {}
+        self._limits: dict[str, ModelLimits] = dict(limits or {})
+        self._states: dict[str, _ModelState] = {}
+        self._sequence = itertools.count()
+
+    def limits_for(self, model: str) -> ModelLimits:
+        return self._limits.get(model, self.default_limits)
+
+    def set_limits(
+        self,
+        model: str,
+        max_concurrent: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+    ) -> ModelLimits:
+        """모델 제한 변경 (실행 중 변경 가능)"""
+        current = self.limits_for(model)
+        updated = ModelLimits(
+            max_concurrent=max_concurrent if max_concurrent is not None else current.max_concurrent,
+            max_queue=max_queue if max_queue is not None else current.max_queue,
+            queue_timeout=queue_timeout if queue_timeout is not None else current.queue_timeout,
+        )
+        if updated.max_concurrent < 1 or updated.max_queue < 0 or updated.queue_timeout <= 0:
+            raise ValueError("Invalid scheduler limits")
+        self._limits[model] = updated
+        # 동시 실행 수가 늘었으면 대기자를 깨움
+        self._dispatch(model)
+        return updated
+
+    def _state(self, model: str) -> _ModelState:
+        if model not in self._states:
+            self._states[model] = _ModelState()
+        return self._states[model]
+
+    def _retry_after(self, model: str) -> int:
+        """대기열이 빠지는 데 걸릴 예상 시간(초)"""
+        state = self._state(model)
+        limits = self.limits_for(model)
+        average_run = self.latency.mean(model) or 10.0
+        backlog = state.queued + state.running
+        return max(1, math.ceil(average_run * backlog / limits.max_concurrent))
+
+    async def acquire(self, model: str, priority: int = 0, user: str = ""):
+        """실행 슬롯 획득 - 없으면 우선순위 대기열에서 대기 (같은 우선순위는 사용자별 DRR)"""
+        state = self._state(model)
+        limits = self.limits_for(model)
+        queued_at = time.monotonic()
+
+        if state.running < limits.max_concurrent and state.queued == 0:
+            state.running += 1
+            state.admitted += 1
+            state.queue_times.append(0.0)
+            return
+
+        if state.queued >= limits.max_queue:
+            state.rejected += 1
+            raise SchedulerRejectedError(
+                f"{model} queue is full ({limits.max_queue} waiting)",
+                status_code=429,
+                retry_after=self._retry_after(model),
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(state.waiters, (-priority, next(self._sequence), future, user))
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=limits.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # 시간 초과 직전에 슬롯을 받은 경우 - 되돌려 줌
+                self.release(model)
+            future.cancel()
+            state.timed_out += 1
+            raise SchedulerRejectedError(
+                f"{model} queue wait exceeded {limits.queue_timeout}s",
+                status_code=503,
+                retry_after=self._retry_after(model),
+            )
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(model)
+            future.cancel()
+            raise
+        finally:
+            self._prune(state)
+
+        state.admitted += 1
+        state.queue_times.append(time.monotonic() - queued_at)
+
+    def release(self, model: str):
+        """실행 슬롯 반납"""
+        state = self._state(model)
+        state.running = max(0, state.running - 1)
+        self._dispatch(model)
+
+    def _dispatch(self, model: str):
+        """빈 슬롯을 우선순위가 가장 높은 대기자에게 넘김 (같은 우선순위는 사용자별 DRR)"""
+        state = self._state(model)
+        limits = self.limits_for(model)
+        while state.running < limits.max_concurrent:
+            self._prune(state)
+            if not state.waiters:
+                break
+            entry = self._pick(state)
+            state.waiters.remove(entry)
+            heapq.heapify(state.waiters)
+            state.running += 1
+            entry[2].set_result(None)
+
+    def _pick(self, state: _ModelState) -> tuple:
+        """최고 우선순위 대기자 중 DRR 차례인 사용자의 가장 오래된 요청"""
+        top = state.waiters[0][0]
+        heads: dict[str, tuple] = {}
+        for entry in sorted(w for w in state.waiters if w[0] == top):
+            heads.setdefault(entry[3], entry)
+
+        # 대기자가 없는 사용자는 라운드에서 빠지고 남은 deficit은 버림
+        for user in list(state.rotation):
+            if user not in heads:
+                state.rotation.remove(user)
+                state.deficits.pop(user, None)
+        for user in heads:
+            if user not in state.rotation:
+                state.rotation.append(user)
+
+        while True:
+            user = state.rotation[0]
+            deficit = state.deficits.get(user, 0.0)
+            if deficit < 1.0:
+                # 라운드 차례 - 가중치만큼 실행 몫을 받음 (실행 1회 비용 1)
+                deficit += self.weights.get(user, 1.0)
+            if deficit >= 1.0:
+                state.deficits[user] = deficit - 1.0
+                if deficit - 1.0 < 1.0:
+                    state.rotation.rotate(-1)
+                return heads[user]
+            state.deficits[user] = deficit
+            state.rotation.rotate(-1)
+
+    @staticmethod
+    def _prune(state: _ModelState):
+        """취소된 대기자 정리"""
+        if any(future.done() for _, _, future, _ in state.waiters):
+            state.waiters = [w for w in state.waiters if not w[2].done()]
+            heapq.heapify(state.waiters)
+
+    @asynccontextmanager
+    async def slot(self, model: str, priority: int = 0, user: str = "") -> AsyncIterator[None]:
+        """슬롯 획득 → 실행 → 반납"""
+        await self.acquire(model, priority, user)
+        try:
+            yield
+        finally:
+            self.release(model)
+
+    def stats(self) -> dict:
+        """모델별 실행/대기 지표"""
+        models = set(self._states) | set(self._limits)
+        result = {}
+        for model in sorted(models):
+            state = self._state(model)
+            result[model] = {
+                "limits": self.limits_for(model).to_dict(),
+                "running": state.running,
+                "queued": state.queued,
+                "admitted": state.admitted,
+                "rejected": state.rejected,
+                "timed_out": state.timed_out,
+                "queue_time_p50": round(percentile(state.queue_times, 0.5), 4),
+                "queue_time_p95": round(percentile(state.queue_times, 0.95), 4),
+                "run_time_p50": round(self.latency.percentile(model, 0.5) or 0.0, 4),
+                "run_time_p95": round(self.latency.percentile(model, 0.95) or 0.0, 4),
+            }
+        return result
@@ -0,0 +1,116 @@
+"""
+CLI 세션 재사용 모듈 - 같은 이슈의 단계별 실행이 이전 대화를 이어받음
+
+에이전트 파이프라인(분석 → 계획 → 코드 → 테스트 → PR)은 단계마다 이슈와 저장소 컨텍스트 전체를
+새 CLI 세션에 다시 보낸다. 세션을 재개할 수 있는 CLI(claude --session-id/--resume)는
+첫 단계에서만 컨텍스트를 보내고, 이후 단계는 같은 세션을 이어서 단계 prompt만 보낸다.
+세션은 LRU(max_sessions) + TTL로 만료한다.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass
+class CLISession:
+    """이슈 하나에 대한 CLI 대화 세션"""
+    model: str
+    key: str
+    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    # 성공한 실행 수 (0이면 아직 CLI 쪽에 세션이 없음 → 새로 시작)
+    turns: int = 0
+    # 첫 실행에 보낸 컨텍스트 크기 - 재개할 때마다 이만큼 덜 보냄
+    context_bytes: int = 0
+    prompt_bytes_saved: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+
+    @property
+    def resumable(self) -> bool:
+        return self.turns > 0
+
+
+class CLISessionStore:
+    """(모델, 키)별 CLI 세션 저장소
+
+    - max_sessions: 보관할 최대 세션 수 (넘으면 가장 오래 안 쓴 세션부터 제거)
+    - ttl: 마지막 사용 후 이 시간(초)이 지나면 만료 (CLI 쪽 대화 기록도 오래되면 의미가 적음)
+    """
+
+    def __init__(self, max_sessions: int = 256, ttl: float = 1800.0):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions: "OrderedDict[tuple[str, str], CLISession]" = OrderedDict()
+        self.started = 0
+        self.resumed = 0
+        self.expired = 0
+        self.evicted = 0
+        self.invalidated = 0
+        self.prompt_bytes_saved = 0
+
+    def acquire(self, model: str, key: str) -> CLISession:
+        """세션 조회 - 없거나 만료됐으면 새 세션"""
+        self.expire()
+        session = self._sessions.get((model, key))
+        if session is None:
+            session = CLISession(model=model, key=key)
+            self._sessions[(model, key)] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted += 1
+        self._sessions.move_to_end((model, key))
+        session.last_used = time.monotonic()
+        return session
+
+    def record(self, session: CLISession, context_bytes: int) -> int:
+        """실행 성공 기록 - 이번 실행에서 아낀 prompt 크기 반환"""
+        saved = 0
+        if session.resumable:
+            saved = session.context_bytes
+            session.prompt_bytes_saved += saved
+            self.prompt_bytes_saved += saved
+            self.resumed += 1
+        else:
+            session.context_bytes = context_bytes
+            self.started += 1
+        session.turns += 1
+        session.last_used = time.monotonic()
+        return saved
+
+    def invalidate(self, session: CLISession):
+        """CLI가 세션을 재개하지 못함 (CLI 쪽 기록 삭제 등) - 다음 실행은 새 세션"""
+        if self._sessions.get((session.model, session.key)) is session:
+            del self._sessions[(session.model, session.key)]
+            self.invalidated += 1
+
+    def expire(self):
+        """TTL이 지난 세션 제거 (가장 오래 안 쓴 것부터 확인)"""
+        now = time.monotonic()
+        while self._sessions:
+            key, session = next(iter(self._sessions.items()))
+            if now - session.last_used < self.ttl:
+                break
+            del self._sessions[key]
+            self.expired += 1
+
+    def get(self, model: str, key: str) -> Optional[CLISession]:
+        self.expire()
+        return self._sessions.get((model, key))
+
+    def stats(self) -> dict:
+        """세션 재사용 통계"""
+        self.expire()
+        return {
+            "sessions": len(self._sessions),
+            "started": self.started,
+            "resumed": self.resumed,
+            "expired": self.expired,
+            "evicted": self.evicted,
+            "invalidated": self.invalidated,
+            "prompt_bytes_saved": self.prompt_bytes_saved,
+        }
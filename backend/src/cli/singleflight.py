@@ -0,0 +1,194 @@
+"""
+요청 병합(single-flight) 모듈 - 같은 키의 동시 실행을 하나로 합침
+
+여러 사용자(또는 여러 탭)가 같은 모델/prompt로 동시에 해결을 요청하면
+CLI를 한 번만 실행하고 모든 대기자가 그 결과(또는 스트림)를 받는다.
+대기자 하나가 취소되어도 다른 대기자가 남아 있으면 실행은 계속되고,
+마지막 대기자가 떠나면 실행을 취소한다 (CLI 프로세스 종료).
+
+공유 스트림은 가장 느린 구독자 속도에 맞춰 원본을 읽고, 모든 구독자가 읽은 조각은 버린다.
+(늦게 합류할 구독자를 위해 앞부분 max_buffered개까지는 보관, 이미 버렸으면 새로 실행)
+"""
+
+import asyncio
+import contextlib
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+
+@dataclass
+class _Call:
+    """진행 중인 단일 실행"""
+    task: asyncio.Task
+    waiters: int = 0
+
+
+@dataclass
+class _StreamCall:
+    """진행 중인 스트림 - 구독자가 아직 읽지 않은 조각을 보관
+
+    - base: chunks[0]의 스트림 내 위치 (0보다 크면 앞부분을 버린 것이므로 처음부터 재생 불가)
+    - positions: 구독자별 다음에 읽을 위치
+    """
+    chunks: deque = field(default_factory=deque)
+    base: int = 0
+    done: bool = False
+    error: Optional[BaseException] = None
+    positions: dict[int, int] = field(default_factory=dict)
+    task: Optional[asyncio.Task] = None
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    # 원본 읽기가 가장 느린 구독자를 기다리는 중
+    paused: bool = False
+    drained: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.chunks)
+
+    def slowest(self) -> int:
+        return min(self.positions.values(), default=self.end)
+
+    def notify(self):
+        event, self.changed = self.changed, asyncio.Event()
+        event.set()
+
+    def advance(self, token: int, limit: int):
+        """구독자가 조각 하나를 읽음 - 모두 읽은 조각은 버리고 멈춘 원본 읽기를 깨움"""
+        self.positions[token] += 1
+        self.trim(limit)
+        if self.paused:
+            self.drained.set()
+
+    def trim(self, limit: int):
+        """모든 구독자가 읽은 조각 버림 (limit개까지는 늦게 합류할 구독자를 위해 유지)"""
+        slowest = self.slowest()
+        while len(self.chunks) > limit and self.base < slowest:
+            self.chunks.popleft()
+            self.base += 1
+
+
+class SingleFlight:
+    """키별 실행 병합
+
+    - do(key, func): 같은 키로 진행 중인 실행이 있으면 합류, 없으면 func() 실행
+    - stream(key, factory): 같은 키의 스트림을 여러 구독자가 공유
+    - max_buffered: 스트림별로 보관할 조각 수 (가장 느린 구독자가 이만큼 밀리면 원본 읽기를 멈춤)
+    """
+
+    def __init__(self, max_buffered: int = 256):
+        if max_buffered < 1:
+            raise ValueError("max_buffered must be >= 1")
+        self.max_buffered = max_buffered
+        self._calls: dict[str, _Call] = {}
+        self._streams: dict[str, _StreamCall] = {}
+        self._tokens = itertools.count()
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[dict]]) -> dict:
+        """실행 결과 반환 - 합류한 대기자의 결과에는 coalesced=True"""
+        call = self._calls.get(key)
+        coalesced = call is not None
+        if call is None:
+            call = _Call(task=asyncio.create_task(func()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget_call(key, call))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 마지막 대기자 - 실행 취소 후 정리(CLI 종료)까지 대기
+                self._forget_call(key, call)
+                call.task.cancel()
+                await asyncio.gather(call.task, return_exceptions=True)
+            raise
+        call.waiters -= 1
+
+        # 대기자마다 별도 사본 (호출자가 결과를 수정해도 서로 영향 없음)
+        result = dict(result)
+        if coalesced:
+            result["coalesced"] = True
+        return result
+
+    def _forget_call(self, key: str, call: _Call):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    async def stream(
+        self, key: str, factory: Callable[[], AsyncIterator[str]]
+    ) -> AsyncIterator[str]:
+        """공유 스트림 구독 - 늦게 합류하면 이미 받은 조각부터 재생"""
+        call = self._streams.get(key)
+        if call is not None and call.base > 0:
+            # 앞부분을 이미 버린 스트림에는 합류할 수 없음 - 새로 실행
+            call = None
+        if call is None:
+            call = _StreamCall()
+            self._streams[key] = call
+            call.task = asyncio.create_task(self._pump(key, call, factory))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+
+        token = next(self._tokens)
+        call.positions[token] = call.base
+        try:
+            while True:
+                while call.positions[token] < call.end:
+                    yield call.chunks[call.positions[token] - call.base]
+                    call.advance(token, self.max_buffered)
+                if call.done:
+                    if call.error is not None:
+                        raise call.error
+                    return
+                await call.changed.wait()
+        finally:
+            del call.positions[token]
+            call.trim(self.max_buffered)
+            call.drained.set()
+            if not call.positions and not call.task.done():
+                # 마지막 구독자가 떠남 - 스트림(CLI) 종료
+                self._forget_stream(key, call)
+                call.task.cancel()
+
+    async def _pump(self, key: str, call: _StreamCall, factory: Callable[[], AsyncIterator[str]]):
+        """원본 스트림을 읽어 구독자에게 전달 (가장 느린 구독자가 밀리면 읽기를 멈춤)"""
+        try:
+            # 대기(paused) 중 취소되어도 원본 제너레이터를 닫아 CLI 정리가 바로 실행되게 함
+            async with contextlib.aclosing(factory()) as source:
+                async for chunk in source:
+                    while call.positions and call.end - call.slowest() >= self.max_buffered:
+                        call.paused = True
+                        call.drained.clear()
+                        await call.drained.wait()
+                    call.paused = False
+                    call.chunks.append(chunk)
+                    call.notify()
+        except Exception as e:
+            call.error = e
+        finally:
+            call.done = True
+            call.notify()
+            self._forget_stream(key, call)
+
+    def _forget_stream(self, key: str, call: _StreamCall):
+        if self._streams.get(key) is call:
+            del self._streams[key]
+
+    def stats(self) -> dict:
+        """병합 통계"""
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls),
+            "streams_in_flight": len(self._streams),
+            "stream_buffered_chunks": sum(len(call.chunks) for call in self._streams.values()),
+        }
@@ -0,0 +1,178 @@
+"""
+CLI 구조화 출력(stream-json) 파싱 모듈
+
+일부 CLI는 줄 단위 JSON 이벤트 스트림을 출력할 수 있다 (claude/gemini --output-format
+stream-json, codex exec --json). 텍스트, 도구 호출, 파일 수정을 이벤트에서 바로 꺼내므로
+출력 텍스트를 다시 파싱해 추측할 필요가 없다. 코드 블록은 어시스턴트 텍스트에서만 찾는다.
+"""
+
+import json
+from typing import Optional
+
+from .capture import BoundedCapture
+from .parser import IncrementalFenceParser
+
+# 파일을 수정하는 도구 이름 (claude / gemini)
+FILE_EDIT_TOOLS = {"Write", "Edit", "MultiEdit", "NotebookEdit", "write_file", "replace"}
+
+
+class StreamJsonParser:
+    """줄 단위 JSON 이벤트 스트림 파서
+
+    청크를 받아 완성된 줄마다 이벤트를 정규화해 반환한다.
+    - {"type": "text", "text": ...}: 어시스턴트 텍스트 (스트리밍 chunk로 전달)
+    - {"type": "tool_call", "name": ..., "input": ...}: 도구 호출
+    - {"type": "result", ...}: 최종 결과 (오류 여부, 세션 id)
+    JSON이 아닌 줄(경고 메시지 등)은 텍스트로 취급한다.
+
+    - text_capture: 어시스턴트 텍스트를 head/tail만 보관할 캡처 (None이면 전체 보관)
+    """
+
+    def __init__(self, text_capture: Optional[BoundedCapture] = None):
+        self.tool_calls: list[dict] = []
+        self.file_edits: list[dict] = []
+        self.session_id: Optional[str] = None
+        self.is_error = False
+        self._text_capture = text_capture
+        self._fence = IncrementalFenceParser(retain_text=text_capture is None)
+        # 아직 줄바꿈이 오지 않은 줄의 조각들
+        self._pending: list[str] = []
+        self._result_text = ""
+        self._saw_text = False
+        # 부분 메시지(delta)를 받았으면 완성된 assistant 메시지의 텍스트는 중복이므로 무시
+        self._saw_delta = False
+
+    def feed(self, chunk: str) -> list[dict]:
+        """청크 입력 - 이번 청크로 완성된 이벤트 목록 반환"""
+        if "\n" not in chunk:
+            if chunk:
+                self._pending.append(chunk)
+            return []
+        # 청크마다 한 번만 나눔 (남은 꼬리는 다음 청크와 이어 붙임)
+        lines = chunk.split("\n")
+        if self._pending:
+            self._pending.append(lines[0])
+            lines[0] = "".join(self._pending)
+        tail = lines.pop()
+        self._pending = [tail] if tail else []
+        events = []
+        for line in lines:
+            events.extend(self._feed_line(line))
+        return events
+
+    def close(self) -> dict:
+        """입력 종료 - parse_cli_output 결과 형태 + 도구 호출/파일 수정"""
+        if self._pending:
+            # 줄바꿈 없이 끝난 마지막 줄
+            self._feed_line("".join(self._pending))
+            self._pending = []
+        if not self._saw_text and self._result_text:
+            # 텍스트 이벤트 없이 최종 결과만 온 경우
+            self._store_text(self._result_text)
+
+        parsed = self._fence.close()
+        if self._text_capture is not None:
+            text = self._text_capture.getvalue().decode(errors="replace")
+        else:
+            text = self._fence.text
+        parsed.update({
+            "text": text,
+            "tool_calls": list(self.tool_calls),
+            "file_edits": list(self.file_edits),
+            "session_id": self.session_id,
+            "is_error": self.is_error,
+        })
+        return parsed
+
+    def _feed_line(self, line: str) -> list[dict]:
+        if not line.strip():
+            return []
+        try:
+            event = json.loads(line)
+        except ValueError:
+            event = None
+        if not isinstance(event, dict):
+            return self._text(line + "\n")
+
+        if event.get("session_id"):
+            self.session_id = event["session_id"]
+        kind = event.get("type")
+        if kind == "assistant":
+            return self._claude_message(event.get("message") or {})
+        if kind == "stream_event":
+            delta = (event.get("event") or {}).get("delta") or {}
+            if delta.get("type") == "text_delta":
+                self._saw_delta = True
+                return self._text(delta.get("text", ""))
+            return []
+        if kind == "message" and event.get("role") == "assistant":
+            # gemini
+            return self._text(event.get("content", ""))
+        if kind == "tool_use":
+            # gemini
+            return self._tool_call(event.get("tool_name", ""), event.get("parameters") or {})
+        if kind == "item.completed":
+            return self._codex_item(event.get("item") or {})
+        if kind == "result":
+            return self._result(event)
+        return []
+
+    def _claude_message(self, message: dict) -> list[dict]:
+        events = []
+        for block in message.get("content") or []:
+            if block.get("type") == "text" and not self._saw_delta:
+                events.extend(self._text(block.get("text", "")))
+            elif block.get("type") == "tool_use":
+                events.extend(self._tool_call(block.get("name", ""), block.get("input") or {}))
+        return events
+
+    def _codex_item(self, item: dict) -> list[dict]:
+        if item.get("type") == "agent_message":
+            return self._text(item.get("text", ""))
+        if item.get("type") == "file_change":
+            for change in item.get("changes") or []:
+                self.file_edits.append(
+                    {"tool": "file_change", "path": change.get("path"), "content": None}
+                )
+            return []
+        if item.get("type") == "command_execution":
+            return self._tool_call("command_execution", {"command": item.get("command")})
+        return []
+
+    def _result(self, event: dict) -> list[dict]:
+        # claude: is_error/result, gemini: status
+        self.is_error = bool(event.get("is_error")) or event.get("status") == "error"
+        if isinstance(event.get("result"), str):
+            self._result_text = event["result"]
+        return [{"type": "result", "is_error": self.is_error, "session_id": self.session_id}]
+
+    def _store_text(self, text: str):
+        """코드 블록 파싱 + 텍스트 보관 (text_capture가 있으면 head/tail만)"""
+        self._fence.feed(text)
+        if self._text_capture is not None:
+            self._text_capture.write(text.encode())
+
+    def _text(self, text: str) -> list[dict]:
+        if not text:
+            return []
+        self._saw_text = True
+        self._store_text(text)
+        return [{"type": "text", "text": text}]
+
+    def _tool_call(self, name: str, tool_input: dict) -> list[dict]:
+        call = {"name": name, "input": tool_input}
+        self.tool_calls.append(call)
+        if name in FILE_EDIT_TOOLS:
+            self.file_edits.append({
+                "tool": name,
+                "path": tool_input.get("file_path") or tool_input.get("notebook_path"),
+                "content": tool_input.get("content", tool_input.get("new_string")),
+            })
+        return [{"type": "tool_call", **call}]
+
+
+def parse_stream_json(raw_output: str) -> dict:
+    """stream-json 출력 전체 파싱"""
+    parser = StreamJsonParser()
+    parser.feed(raw_output)
+    return parser.close()
@@ -0,0 +1,187 @@
+"""
+CLI 프로세스 감독 모듈 - 프로세스 그룹 종료, 회수(reap), 리소스 제한
+
+CLI는 Node 헬퍼 프로세스를 띄우므로 process.kill()만으로는 자식이 남는다.
+각 CLI를 별도 프로세스 그룹(세션)으로 실행하고, 타임아웃/취소 시 그룹 전체를 종료하며
+종료된 프로세스는 항상 wait()로 회수한다.
+"""
+
+import asyncio
+import os
+import signal
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from .accounting import read_process_groups_usage, read_start_time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_IS_POSIX = os.name == "posix"
+
+
+@dataclass
+class ResourceLimits:
+    """CLI 프로세스 리소스 제한 (POSIX 전용, None이면 제한 없음)
+
+    Node 기반 CLI는 가상 메모리를 크게 예약하므로 address_space_bytes는 넉넉하게 잡아야 한다.
+    """
+    cpu_seconds: Optional[int] = None
+    address_space_bytes: Optional[int] = None
+
+    def preexec_fn(self) -> Optional[Callable[[], None]]:
+        """자식 프로세스에서 exec 직전에 실행할 rlimit 설정 함수"""
+        if resource is None or (self.cpu_seconds is None and self.address_space_bytes is None):
+            return None
+        cpu_seconds = self.cpu_seconds
+        address_space = self.address_space_bytes
+
+        def apply_limits():
+            if cpu_seconds is not None:
+                resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+            if address_space is not None:
+                resource.setrlimit(resource.RLIMIT_AS, (address_space, address_space))
+
+        return apply_limits
+
+
+@dataclass
+class SupervisedProcess:
+    """감독 중인 CLI 프로세스"""
+    model: str
+    process: asyncio.subprocess.Process
+    command: str
+    started_at: float = field(default_factory=time.monotonic)
+    # /proc의 시작 시각 - 리더 회수 후 pgid 재사용 여부 확인용 (조회 불가면 None)
+    start_time: Optional[int] = None
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class ProcessSupervisor:
+    """CLI 프로세스 감독자
+
+    - 각 CLI를 새 세션(프로세스 그룹)으로 실행
+    - terminate: 그룹 전체에 SIGTERM → grace 후 SIGKILL → wait()로 회수
+    - 종료된 프로세스는 감시 태스크가 항상 회수하고 목록에서 제거
+    - limits: 선택적 CPU 시간/주소 공간 rlimit
+    """
+
+    def __init__(self, limits: Optional[ResourceLimits] = None, grace_period: float = 2.0):
+        self.limits = limits or ResourceLimits()
+        self.grace_period = grace_period
+        self._running: dict[int, SupervisedProcess] = {}
+        self._reapers: set[asyncio.Task] = set()
+
+    async def spawn(self, *cmd: str, model: str = "", **kwargs) -> asyncio.subprocess.Process:
+        """감독 하에 CLI 실행 (asyncio.create_subprocess_exec와 같은 인자)"""
+        if _IS_POSIX:
+            kwargs.setdefault("start_new_session", True)
+            preexec_fn = self.limits.preexec_fn()
+            if preexec_fn is not None:
+                kwargs.setdefault("preexec_fn", preexec_fn)
+
+        process = await asyncio.create_subprocess_exec(*cmd, **kwargs)
+        supervised = SupervisedProcess(
+            model=model,
+            process=process,
+            command=os.path.basename(str(cmd[0])) if cmd else "",
+            start_time=read_start_time(process.pid) if _IS_POSIX else None,
+        )
+        self._running[process.pid] = supervised
+
+        reaper = asyncio.create_task(self._reap(supervised))
+        self._reapers.add(reaper)
+        reaper.add_done_callback(self._reapers.discard)
+        return process
+
+    async def _reap(self, supervised: SupervisedProcess):
+        """프로세스 종료를 기다려 회수하고 목록에서 제거"""
+        try:
+            await supervised.process.wait()
+        finally:
+            self._running.pop(supervised.pid, None)
+
+    def _signal_group(self, process: asyncio.subprocess.Process, sig: int):
+        try:
+            if _IS_POSIX and process.pid in self._running:
+                os.killpg(process.pid, sig)
+            elif sig == getattr(signal, "SIGKILL", None):
+                process.kill()
+            else:
+                process.terminate()
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    @staticmethod
+    def _group_is_ours(pgid: int, start_time: Optional[int]) -> bool:
+        """pgid가 아직 우리가 띄운 프로세스 그룹인지 확인
+
+        - pgid와 같은 pid의 프로세스가 있으면 시작 시각이 같을 때만 우리 리더(회수 전)
+        - 없으면 리더 없이 자식만 남은 그룹이거나 그룹이 없어진 것 - 그룹에 프로세스가
+          남아 있는 동안 커널은 그 번호를 재사용하지 않으므로 killpg(0)으로 존재만 확인
+        """
+        current = read_start_time(pgid)
+        if current is not None:
+            return current == start_time
+        try:
+            os.killpg(pgid, 0)
+        except (ProcessLookupError, PermissionError):
+            return False
+        return True
+
+    async def terminate(self, process: asyncio.subprocess.Process):
+        """프로세스 그룹 전체 종료 후 회수"""
+        supervised = self._running.get(process.pid)
+        start_time = supervised.start_time if supervised is not None else None
+        if process.returncode is None:
+            self._signal_group(process, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(process.wait(), timeout=self.grace_period)
+            except asyncio.TimeoutError:
+                pass
+        if _IS_POSIX:
+            # 리더가 먼저 끝났어도 그룹에 남은 자식까지 정리 - 리더가 회수된 뒤 pgid가
+            # 다른 그룹에 재사용됐거나 그룹이 이미 없어졌으면 보내지 않음
+            if self._group_is_ours(process.pid, start_time):
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except (ProcessLookupError, PermissionError):
+                    pass
+        elif process.returncode is None:
+            process.kill()
+        await process.wait()
+        self._running.pop(process.pid, None)
+
+    async def terminate_all(self):
+        """감독 중인 모든 CLI 종료 (서버 종료 시)"""
+        await asyncio.gather(
+            *(self.terminate(s.process) for s in list(self._running.values())),
+            return_exceptions=True,
+        )
+
+    def snapshot(self) -> list[dict]:
+        """실행 중인 CLI 프로세스 목록 (나이, 그룹 전체 CPU 시간/RSS)"""
+        running = list(self._running.values())
+        # 그룹 수와 관계없이 /proc은 한 번만 훑음
+        usage = read_process_groups_usage(s.pid for s in running) if _IS_POSIX else {}
+        processes = []
+        for supervised in running:
+            entry = {
+                "pid": supervised.pid,
+                "model": supervised.model,
+                "command": supervised.command,
+                "age_seconds": round(supervised.age, 3),
+            }
+            entry.update(usage.get(supervised.pid, {}))
+            processes.append(entry)
+        return processes
@@ -0,0 +1,214 @@
+"""
+적응형 타임아웃 모듈 - 관측한 실행 시간 백분위수로 모델별 타임아웃 결정
+
+고정 120초 타임아웃은 빠른 모델이 멈췄을 때 폴백을 2분이나 늦추고,
+길지만 정상인 실행은 중간에 끊는다. 공유 LatencyTracker의 모델 × prompt 크기 구간별
+최근 실행 시간으로 p99 × factor를 [min_timeout, max_timeout] 범위로 제한해 사용한다.
+타임아웃이 나면 해당 구간의 타임아웃을 바로 factor배로 올린다 (penalty_ttl초 동안 유지).
+학습한 값은 JSON 파일에 저장해 재시작 후에도 유지한다 (파일 쓰기는 이벤트 루프 밖에서).
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Optional
+
+from .latency import PROMPT_SIZE_BUCKETS, LatencyTracker, percentile, prompt_size_bucket
+
+__all__ = ["AdaptiveTimeouts", "PROMPT_SIZE_BUCKETS", "prompt_size_bucket"]
+
+
+class AdaptiveTimeouts:
+    """모델 × prompt 크기 구간별 적응형 타임아웃
+
+    - factor: p99에 곱할 배수 (타임아웃 직후에는 그 타임아웃에 곱함)
+    - min_timeout/max_timeout: 타임아웃 하한/상한(초)
+    - default_timeout: 기록이 부족할 때 사용할 값
+    - min_samples: 학습값을 쓰기 위한 최소 기록 수 (구간 → 모델 전체 순으로 확인)
+    - latency: 실행 시간 기록 (executor가 성공할 때마다 기록, 없으면 자체 생성)
+    - penalty_ttl: 타임아웃으로 올린 값을 유지할 시간(초)
+    - path: 학습값 저장 파일 (None이면 메모리에만 보관)
+    - save_interval: 파일 저장 최소 간격(초)
+    """
+
+    def __init__(
+        self,
+        factor: float = 2.0,
+        min_timeout: float = 15.0,
+        max_timeout: float = 600.0,
+        default_timeout: float = 120.0,
+        min_samples: int = 10,
+        window: int = 200,
+        latency: Optional[LatencyTracker] = None,
+        penalty_ttl: float = 600.0,
+        path: Optional[str] = None,
+        save_interval: float = 30.0,
+    ):
+        if not min_timeout <= default_timeout <= max_timeout:
+            raise ValueError("default_timeout must be within [min_timeout, max_timeout]")
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.default_timeout = default_timeout
+        self.min_samples = min_samples
+        self.latency = latency if latency is not None else LatencyTracker(window=window)
+        self.penalty_ttl = penalty_ttl
+        self.path = path
+        self.save_interval = save_interval
+        # (model, bucket) → (타임아웃 후 올린 값, 올린 시각)
+        self._penalties: dict[tuple[str, str], tuple[float, float]] = {}
+        self._timeouts = 0
+        self._saved_version = 0
+        self._saved_at = 0.0
+        self._save_task: Optional[asyncio.Future] = None
+        self.load()
+
+    def _clamp(self, seconds: float) -> float:
+        return min(self.max_timeout, max(self.min_timeout, seconds))
+
+    def _learned(self, model: str, bucket: str) -> float:
+        samples = self.latency.samples(model, bucket)
+        if len(samples) < self.min_samples:
+            samples = self.latency.samples(model)
+        if len(samples) < self.min_samples:
+            return self.default_timeout
+        return self._clamp(percentile(samples, 0.99) * self.factor)
+
+    def _penalty(self, model: str, bucket: str) -> float:
+        penalty = self._penalties.get((model, bucket))
+        if penalty is None:
+            return 0.0
+        value, raised_at = penalty
+        if time.monotonic() - raised_at >= self.penalty_ttl:
+            del self._penalties[(model, bucket)]
+            return 0.0
+        return value
+
+    def timeout_for(self, model: str, prompt_bytes: int) -> float:
+        """타임아웃(초) - 구간 기록 → 모델 전체 기록 → 기본값 순, 최근 타임아웃이 있으면 올린 값"""
+        self._maybe_save()
+        bucket = prompt_size_bucket(prompt_bytes)
+        return round(max(self._learned(model, bucket), self._penalty(model, bucket)), 3)
+
+    def record(self, model: str, prompt_bytes: int, seconds: float):
+        """성공한 실행 시간 기록"""
+        self.latency.record(model, seconds, prompt_bytes)
+        self._maybe_save()
+
+    def record_timeout(self, model: str, prompt_bytes: int, timeout: float):
+        """타임아웃 기록 - 같은 구간의 다음 타임아웃을 바로 timeout × factor로 올림
+
+        실제 실행 시간은 모르므로 표본으로 넣지 않음 (p99가 움직이려면 타임아웃이 1%를 넘어야 함)
+        """
+        self._timeouts += 1
+        key = (model, prompt_size_bucket(prompt_bytes))
+        raised = self._clamp(max(timeout, self._penalty(*key)) * self.factor)
+        self._penalties[key] = (raised, time.monotonic())
+
+    # === 저장/복원 ===
+
+    @property
+    def _dirty(self) -> bool:
+        return self.latency.version != self._saved_version
+
+    def _maybe_save(self):
+        """save_interval마다 변경 사항 저장 - 이벤트 루프에서는 스레드에서 파일을 씀"""
+        if (
+            self.path is None
+            or not self._dirty
+            or time.monotonic() - self._saved_at < self.save_interval
+            or (self._save_task is not None and not self._save_task.done())
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+            return
+        version, data = self._snapshot()
+        self._saved_at = time.monotonic()
+        self._save_task = loop.run_in_executor(None, self._write, data)
+        self._save_task.add_done_callback(lambda task: self._saved(task, version))
+
+    def _saved(self, task: asyncio.Future, version: int):
+        if not task.cancelled() and task.exception() is None:
+            self._saved_version = version
+
+    def load(self):
+        """저장된 학습값 복원 (파일이 없거나 손상되었으면 무시)"""
+        if self.path is None or not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            entries = [
+                (entry["model"], entry["bucket"], [float(s) for s in entry["seconds"]])
+                for entry in data.get("samples", [])
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        for model, bucket, seconds in entries:
+            self.latency.extend(model, bucket, seconds)
+        self._saved_version = self.latency.version
+
+    def _snapshot(self) -> tuple[int, dict]:
+        data = {
+            "samples": [
+                {"model": model, "bucket": bucket, "seconds": [round(s, 4) for s in samples]}
+                for (model, bucket), samples in self.latency.buckets().items()
+            ],
+        }
+        return self.latency.version, data
+
+    def _write(self, data: dict):
+        """임시 파일에 쓴 뒤 교체"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def save(self):
+        """학습값 저장 (동기 - 서버 종료 시/이벤트 루프 밖에서 사용)"""
+        if self.path is None:
+            return
+        version, data = self._snapshot()
+        self._write(data)
+        self._saved_version = version
+        self._saved_at = time.monotonic()
+
+    def flush(self):
+        """변경 사항이 있으면 저장 (서버 종료 시)"""
+        if self._dirty:
+            self.save()
+
+    def stats(self) -> dict:
+        """모델/구간별 학습 상태와 현재 타임아웃"""
+        models: dict[str, dict] = {}
+        for (model, bucket), samples in sorted(self.latency.buckets().items()):
+            models.setdefault(model, {})[bucket] = {
+                "samples": len(samples),
+                "p50_seconds": round(percentile(samples, 0.5), 4) if samples else None,
+                "p99_seconds": round(percentile(samples, 0.99), 4) if samples else None,
+                "timeout": self.timeout_for(model, _bucket_floor(bucket)),
+            }
+        return {
+            "factor": self.factor,
+            "min_timeout": self.min_timeout,
+            "max_timeout": self.max_timeout,
+            "default_timeout": self.default_timeout,
+            "penalty_ttl": self.penalty_ttl,
+            "timeouts_observed": self._timeouts,
+            "models": models,
+        }
+
+
+def _bucket_floor(bucket: str) -> int:
+    """구간 이름 → 그 구간에 속하는 최소 prompt 크기"""
+    floor = 0
+    for limit, name in PROMPT_SIZE_BUCKETS:
+        if name == bucket:
+            return floor
+        floor = limit or floor
+    return floor
@@ -0,0 +1,7 @@
+# Jobs Module
+from .queue import Job, JobQueue
+
+__all__ = [
+    "Job",
+    "JobQueue",
+]
@@ -0,0 +1,233 @@
+"""
+비동기 작업 큐 모듈 - 오래 걸리는 AI 해결 요청의 백그라운드 실행
+
+요청은 즉시 job id를 받고, 워커 풀이 백그라운드에서 실행한다.
+클라이언트는 상태를 폴링하거나 SSEManager 토픽(job:<id>, issue:<issue_id>)으로
+작업 이벤트를 구독한다. 이벤트에는 상태만 담기고 결과는 /api/jobs/<id>로 조회한다.
+실행 중인 작업을 취소하면 실행 태스크가 취소되어 CLI 프로세스도 종료된다.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from ..realtime.sse_server import COALESCE, SSEManager
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+TERMINAL_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+# 이벤트에 담는 오류 메시지 최대 길이 (링 버퍼에 보관되므로 작게 유지)
+MAX_EVENT_ERROR_CHARS = 500
+
+
+@dataclass
+class Job:
+    """백그라운드 작업"""
+    job_id: str
+    run: Callable[[], Awaitable[dict]]
+    metadata: dict = field(default_factory=dict)
+    status: str = QUEUED
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _task: Optional[asyncio.Task] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "metadata": self.metadata,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    def to_event(self, event: str) -> dict:
+        """작업 이벤트 payload - 상태만 (결과/출력은 포함하지 않음)"""
+        error = self.error
+        if error is not None and len(error) > MAX_EVENT_ERROR_CHARS:
+            error = error[:MAX_EVENT_ERROR_CHARS] + "..."
+        return {
+            "event": event,
+            "job_id": self.job_id,
+            "status": self.status,
+            "issue_id": self.metadata.get("issue_id"),
+            "has_result": self.result is not None,
+            "error": error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """작업 큐 + 워커 풀
+
+    - workers: 동시에 실행할 작업 수
+    - max_finished: 보관할 완료 작업 수 (초과 시 오래된 것부터 삭제)
+    - sse_manager: 작업 이벤트 전달용
+      (job:<id> 토픽, metadata에 issue_id가 있으면 issue:<id> 토픽에도)
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_finished: int = 1000,
+        sse_manager: Optional[SSEManager] = None,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.workers = workers
+        self.max_finished = max_finished
+        self.sse_manager = sse_manager or SSEManager()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._pending: asyncio.Queue = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self):
+        """워커 시작"""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def stop(self):
+        """워커 종료 - 실행 중/대기 중인 작업은 취소"""
+        for job in list(self._jobs.values()):
+            if not job.done:
+                await self.cancel(job.job_id)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(
+        self, run: Callable[[], Awaitable[dict]], metadata: Optional[dict] = None
+    ) -> Job:
+        """작업 등록 - 즉시 반환하고 워커가 나중에 실행"""
+        job = Job(job_id=uuid.uuid4().hex, run=run, metadata=dict(metadata or {}))
+        self._jobs[job.job_id] = job
+        self._pending.put_nowait(job)
+        await self._publish(job, "queued")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def cancel(self, job_id: str) -> bool:
+        """작업 취소 - 대기 중이면 건너뛰고, 실행 중이면 태스크 취소 (CLI 프로세스 종료)"""
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return False
+        if job._task is not None:
+            job._task.cancel()
+            # 실행 태스크가 정리(CLI 종료)를 마칠 때까지 대기
+            await asyncio.gather(job._task, return_exceptions=True)
+        if not job.done:
+            await self._finish(job, CANCELLED)
+        return True
+
+    async def _worker(self):
+        while True:
+            job = await self._pending.get()
+            try:
+                if not job.done:
+                    await self._execute(job)
+            finally:
+                self._pending.task_done()
+
+    async def _execute(self, job: Job):
+        job.status = RUNNING
+        job.started_at = time.time()
+        await self._publish(job, "started")
+
+        job._task = asyncio.create_task(job.run())
+        try:
+            result = await asyncio.shield(job._task)
+        except asyncio.CancelledError:
+            if not job._task.done():
+                # 워커 자체가 취소됨 (서버 종료) - 실행 중인 작업도 취소
+                job._task.cancel()
+                await asyncio.gather(job._task, return_exceptions=True)
+                await self._finish(job, CANCELLED)
+                raise
+            await self._finish(job, CANCELLED)
+        except Exception as e:
+            await self._finish(job, FAILED, error=str(e))
+        else:
+            await self._finish(job, SUCCEEDED, result=result)
+        finally:
+            job._task = None
+
+    async def _finish(
+        self,
+        job: Job,
+        status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ):
+        if job.done:
+            return
+        job.status = status
+        job.result = result
+        job.error = error
+        job.finished_at = time.time()
+        await self._publish(job, status)
+        self._prune()
+
+    def _prune(self):
+        """보관 한도를 넘은 오래된 완료 작업 삭제"""
+        finished = [job_id for job_id, job in self._jobs.items() if job.done]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    # === 이벤트 구독 ===
+
+    async def subscribe(self, job_id: str) -> str:
+        """작업 이벤트 구독 - SSEManager 연결 client_id 반환"""
+        client_id = f"job-{job_id}-{uuid.uuid4().hex[:8]}"
+        # 구독자가 밀리면 작업별 최신 상태만 남김
+        await self.sse_manager.connect(client_id, overflow=COALESCE)
+        self.sse_manager.subscribe(client_id, f"job:{job_id}")
+        return client_id
+
+    async def unsubscribe(self, job_id: str, client_id: str):
+        """구독 해제 (연결 해제 시 토픽 구독도 함께 해제됨)"""
+        await self.sse_manager.disconnect(client_id)
+
+    async def _publish(self, job: Job, event: str):
+        # 결과(출력 최대 수백 KB)는 빼고 상태만 - 프레임이 토픽 링 버퍼에 남으므로
+        payload: dict[str, Any] = job.to_event(event)
+        self.sse_manager.publish(f"job:{job.job_id}", payload, "job")
+        issue_id = job.metadata.get("issue_id")
+        if issue_id is not None:
+            self.sse_manager.publish(f"issue:{issue_id}", payload, "job")
+
+    def stats(self) -> dict:
+        """상태별 작업 수"""
+        counts = {state: 0 for state in (QUEUED, RUNNING, *TERMINAL_STATES)}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {"workers": self.workers, "running": self.is_running, "jobs": counts}
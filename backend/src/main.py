@@ -3,19 +3,154 @@ GitCommand Center - FastAPI Backend Server
 AI-Native Developer Dashboard API
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from contextlib import asynccontextmanager
 import asyncio
-
+import json
+import os
+import time
+import uuid
+
+from .cli.accounting import UsageAccounting
+from .cli.admission import HostAdmission
+from .auth.jwt import InvalidTokenError, TokenExpiredError, validate_jwt_token
 from .cli.executor import CLIExecutor, execute_with_fallback, CLIExecutionError
-from .cli.checker import check_cli_available
+from .cli.cache import ResponseCache
+from .cli.capture import CaptureStore
+from .cli.pool import CLIProcessPool
+from .cli.fairness import FairQueue
+from .cli.latency import LatencyTracker
+from .cli.health import ModelHealthTracker
+from .cli.registry import CLIRegistry
+from .cli.singleflight import SingleFlight
+from .cli.supervisor import ProcessSupervisor
+from .cli.timeouts import AdaptiveTimeouts
+from .cli.scheduler import CLIScheduler, ModelLimits, SchedulerRejectedError
+from .cli.sessions import CLISessionStore
+from .cli.parser import IncrementalFenceParser
+from .jobs.queue import JobQueue, TERMINAL_STATES
+from .realtime.progress import ProgressTracker
+from .realtime.sse import create_sse_event
+from .realtime.sse_server import DROP_OLDEST, SSEManager
+
+# CLI 설치 상태/버전 캐시 (백그라운드 갱신)
+cli_registry = CLIRegistry(ttl=300.0)
+
+# 모든 CLI를 별도 프로세스 그룹으로 실행하고 종료 시 그룹 전체를 정리
+cli_supervisor = ProcessSupervisor()
+
+# 호스트 load average/메모리/CLI RSS가 임계치를 넘으면 새 CLI 실행을 미루거나 거부
+cli_admission = HostAdmission(supervisor=cli_supervisor)
+
+# stdin 방식 CLI의 warm 프로세스 풀 (서버 시작 시 채워짐)
+cli_pool = CLIProcessPool(
+    models=["claude"],
+    min_size=1,
+    max_size=4,
+    registry=cli_registry,
+    supervisor=cli_supervisor,
+    admission=cli_admission,
+)
+
+# 같은 모델/prompt/HEAD 재실행 방지용 응답 캐시 (메모리 LRU + SQLite)
+cli_cache = ResponseCache(
+    db_path=os.path.join(os.path.expanduser("~"), ".cache", "gitcommand-center", "cli_cache.db"),
+)
+
+# 모델 × prompt 크기별 성공 실행 시간 - 스케줄러/헬스/타임아웃/헤지가 함께 사용
+cli_latency = LatencyTracker(window=200)
+
+# 사용자(JWT subject/세션)별 대기열 + DRR - 큰 배치가 다른 사용자를 굶기지 않게
+cli_fair_queue = FairQueue(max_concurrent=8, max_queue_per_user=64)
+
+# 모델별 동시 실행 제한 + 우선순위 대기열
+# (같은 우선순위는 사용자별 DRR, 가중치는 공정 대기열과 공유)
+cli_scheduler = CLIScheduler(
+    default_limits=ModelLimits(max_concurrent=2, max_queue=16),
+    latency=cli_latency,
+    weights=cli_fair_queue.weights,
+)
+
+# 모델별 성공률/지연 시간 추적 + 서킷 브레이커
+cli_health = ModelHealthTracker(failure_threshold=3, cooldown=60.0, latency=cli_latency)
+
+# 긴 CLI 출력은 head/tail만 응답하고 전체 로그는 파일로 보관
+cli_logs = CaptureStore(max_age=3600.0)
+
+# 모델 × prompt 크기별 관측 실행 시간(p99 × 2)으로 정한 타임아웃 (재시작 후에도 유지)
+cli_timeouts = AdaptiveTimeouts(
+    factor=2.0,
+    min_timeout=15.0,
+    max_timeout=600.0,
+    default_timeout=120.0,
+    latency=cli_latency,
+    path=os.path.join(os.path.expanduser("~"), ".cache", "gitcommand-center", "cli_timeouts.json"),
+)
+
+# 1이면 구조화 출력을 지원하는 CLI(claude/codex/gemini)는 stream-json 이벤트로 실행
+CLI_STRUCTURED_OUTPUT = os.environ.get("GITCOMMAND_CLI_STRUCTURED_OUTPUT", "0") == "1"
+
+# 이슈별 CLI 대화 세션 - 파이프라인 다음 단계는 컨텍스트 없이 이전 대화를 이어서 실행
+cli_sessions = CLISessionStore(max_sessions=256, ttl=1800.0)
+
+# 요청 사용자 식별용 JWT 서명 키 (없으면 세션 헤더/클라이언트 주소로 구분)
+JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY")
+
+# 실행별 CPU/메모리/출력 크기 (모델별/엔드포인트별 집계)
+cli_usage = UsageAccounting()
+
+# 같은 모델/prompt의 동시 요청은 CLI 실행 하나로 병합
+cli_singleflight = SingleFlight()
+
+# 실시간 이벤트 연결 관리 (연결마다 대기열 256개, 넘치면 오래된 이벤트부터 버림)
+# 토픽별 최근 이벤트를 링 버퍼에 보관해 Last-Event-ID 재연결 시 놓친 이벤트만 재전송
+# (링 버퍼 전체 크기는 replay_bytes로 제한)
+sse_manager = SSEManager(
+    max_queue=int(os.environ.get("GITCOMMAND_SSE_MAX_QUEUE", "256")),
+    overflow=DROP_OLDEST,
+    replay_size=int(os.environ.get("GITCOMMAND_SSE_REPLAY_SIZE", "256")),
+    replay_bytes=int(os.environ.get("GITCOMMAND_SSE_REPLAY_BYTES", str(16 * 1024 * 1024))),
+)
+
+# 백그라운드 AI 해결 작업 큐 (워커 수는 환경 변수로 설정)
+job_queue = JobQueue(
+    workers=int(os.environ.get("GITCOMMAND_JOB_WORKERS", "2")),
+    sse_manager=sse_manager,
+)
+
+# 실행 중인 배치 (batch_id → 항목별 태스크), 취소 API에서 사용
+active_batches: dict[str, list[asyncio.Task]] = {}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 CLI 레지스트리/프로세스 풀/작업 큐 관리"""
+    await cli_registry.start()
+    # 이전 프로세스가 남긴 오래된 로그 정리 후 주기적 정리 시작
+    await cli_logs.start()
+    await cli_pool.start()
+    await job_queue.start()
+    try:
+        yield
+    finally:
+        await job_queue.stop()
+        await cli_pool.stop()
+        await cli_supervisor.terminate_all()
+        await cli_registry.stop()
+        await cli_logs.stop()
+        cli_cache.close()
+        cli_timeouts.flush()
+
 
 app = FastAPI(
     title="GitCommand Center API",
     description="AI-Native Developer Dashboard Backend",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -35,6 +170,19 @@ class AIResolveRequest(BaseModel):
     issue_id: int
     issue_title: str
     prompt: Optional[str] = None
+    # 폴백 헤지 실행 (resolve-with-fallback 전용)
+    hedge: bool = False
+    hedge_delay: Optional[float] = None
+    # True이면 응답 캐시를 건너뛰고 항상 CLI 실행
+    bypass_cache: bool = False
+    # 스케줄러 대기열 우선순위 (클수록 먼저)
+    priority: int = 0
+    # 이슈/저장소 컨텍스트 - prompt 앞에 붙음 (세션을 재개하면 다시 보내지 않음)
+    context: Optional[str] = None
+    # True이면 같은 이슈의 이전 CLI 세션을 이어서 실행 (세션 재개를 지원하는 CLI만)
+    reuse_session: bool = False
+    # 이슈 저장소 (owner/name) - 세션 키에 포함해 저장소 간 이슈 번호 충돌을 막음
+    repo: Optional[str] = None
 
 
 class AIResolveResponse(BaseModel):
@@ -43,6 +191,26 @@ class AIResolveResponse(BaseModel):
     code: str
     output: str
     message: str
+    hedge_saved_seconds: Optional[float] = None
+    cached: bool = False
+    # 출력이 잘린 경우 전체 로그는 /api/cli/logs/{output_log_id} 에서 조회
+    output_truncated: bool = False
+    output_log_id: Optional[str] = None
+    # CLI 실행 리소스 사용량 (캐시/병합된 응답은 원래 실행의 값)
+    usage: Optional[dict] = None
+    # 구조화 출력(stream-json) 모드에서만 채워짐
+    tool_calls: Optional[list[dict]] = None
+    file_edits: Optional[list[dict]] = None
+    # 세션 재사용 시: session_id, resumed, turn, prompt_bytes_saved
+    session: Optional[dict] = None
+
+
+class AIBatchResolveRequest(BaseModel):
+    items: list[AIResolveRequest]
+    # 배치 전체의 동시 실행 수 (모델별 제한은 스케줄러가 추가로 적용)
+    max_concurrency: int = Field(default=4, ge=1, le=32)
+    # 스트림 형식: SSE 또는 줄 단위 JSON
+    format: Literal["sse", "ndjson"] = "sse"
 
 
 class CLIStatusResponse(BaseModel):
@@ -50,6 +218,13 @@ class CLIStatusResponse(BaseModel):
     codex: bool
     gemini: bool
     qwen: bool
+    versions: dict[str, Optional[str]] = {}
+
+
+class SchedulerLimitsRequest(BaseModel):
+    max_concurrent: Optional[int] = None
+    max_queue: Optional[int] = None
+    queue_timeout: Optional[float] = None
 
 
 class HealthResponse(BaseModel):
@@ -59,6 +234,15 @@ class HealthResponse(BaseModel):
 
 # === Endpoints ===
 
+def _scheduler_http_error(error: SchedulerRejectedError) -> HTTPException:
+    """스케줄러 거부 → 429/503 + Retry-After"""
+    return HTTPException(
+        status_code=error.status_code,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """서버 상태 확인"""
@@ -67,59 +251,568 @@ async def health_check():
 
 @app.get("/api/cli/status", response_model=CLIStatusResponse)
 async def get_cli_status():
-    """CLI 설치 상태 확인"""
+    """CLI 설치 상태 확인 (레지스트리 캐시)"""
+    statuses = await cli_registry.get_all()
     return CLIStatusResponse(
-        claude=check_cli_available("claude"),
-        codex=check_cli_available("codex"),
-        gemini=check_cli_available("gemini"),
-        qwen=check_cli_available("qwen")
+        claude=statuses["claude"].available,
+        codex=statuses["codex"].available,
+        gemini=statuses["gemini"].available,
+        qwen=statuses["qwen"].available,
+        versions={name: status.version for name, status in statuses.items()},
     )
 
 
-@app.post("/api/ai/resolve", response_model=AIResolveResponse)
-async def resolve_issue_with_ai(request: AIResolveRequest):
-    """AI로 이슈 해결"""
+@app.get("/api/cli/pool")
+async def get_cli_pool_status():
+    """CLI warm 프로세스 풀 상태"""
+    return {"running": cli_pool.is_running, "models": cli_pool.stats()}
+
+
+@app.get("/api/cli/cache")
+async def get_cli_cache_stats():
+    """CLI 응답 캐시 통계"""
+    return cli_cache.stats()
+
+
+@app.get("/api/cli/coalescing")
+async def get_cli_coalescing_stats():
+    """동일 요청 병합 통계 (실행 수, 합류한 요청 수)"""
+    return cli_singleflight.stats()
+
+
+@app.get("/api/cli/sessions")
+async def get_cli_sessions():
+    """이슈별 CLI 세션 재사용 통계 (시작/재개/만료 수, 아낀 prompt 크기)"""
+    return cli_sessions.stats()
+
+
+@app.get("/api/cli/timeouts")
+async def get_cli_timeouts():
+    """모델/prompt 크기별 학습한 실행 시간과 현재 타임아웃"""
+    return cli_timeouts.stats()
+
+
+@app.get("/api/cli/usage")
+async def get_cli_usage():
+    """CLI 실행 리소스 사용량 (모델별/엔드포인트별 CPU 시간, 최대 RSS, 실행 시간, 출력 크기)"""
+    return cli_usage.stats()
+
+
+@app.get("/api/cli/admission")
+async def get_cli_admission():
+    """호스트 부하 기반 실행 허가 상태 (현재 부하, 임계치, 대기/거부 횟수)"""
+    await cli_admission.refresh()
+    return cli_admission.stats()
+
+
+@app.get("/api/cli/fairness")
+async def get_cli_fairness():
+    """사용자별 대기열 길이/실행 수/대기 시간"""
+    return cli_fair_queue.stats()
+
+
+@app.get("/api/cli/health")
+async def get_cli_health():
+    """모델별 서킷 상태/성공률/지연 시간 p50 (공유 LatencyTracker 기준)"""
+    return {"models": cli_health.stats()}
+
+
+@app.get("/api/cli/processes")
+async def get_cli_processes():
+    """실행 중인 CLI 프로세스 (나이, 프로세스 그룹 CPU 시간/RSS)"""
+    return {"processes": cli_supervisor.snapshot()}
+
+
+@app.get("/api/cli/logs/{log_id}")
+async def get_cli_log(log_id: str, start: int = 0, end: Optional[int] = None):
+    """잘린 CLI 출력의 전체 로그를 바이트 범위로 조회 ([start, end), start가 끝을 넘으면 416)"""
+    start = max(0, start)
     try:
-        # 프롬프트 생성
-        prompt = request.prompt or f"Fix the issue: {request.issue_title}"
+        total = cli_logs.size(log_id)
+        if start > 0 and start >= total:
+            return Response(status_code=416, headers={"Content-Range": f"bytes */{total}"})
+        data = cli_logs.read(log_id, start, end)
+    except (KeyError, FileNotFoundError):
+        raise HTTPException(status_code=404, detail=f"Log not found: {log_id}")
+    return Response(
+        content=data,
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "X-Total-Bytes": str(total),
+            "Content-Range": f"bytes {start}-{start + len(data) - 1}/{total}" if data
+            else f"bytes */{total}",
+        },
+    )
 
-        # 선택된 모델로 실행
-        executor = CLIExecutor(model=request.model, timeout=120)
-        result = await executor.generate_code(prompt)
 
-        return AIResolveResponse(
-            success=True,
-            model_used=request.model,
-            code=result.get("code", ""),
-            output=result.get("output", ""),
-            message=f"Issue #{request.issue_id} resolved with {request.model}"
+@app.get("/api/scheduler")
+async def get_scheduler_stats():
+    """모델별 동시 실행/대기열 지표"""
+    return {"models": cli_scheduler.stats()}
+
+
+@app.put("/api/scheduler/limits/{model}")
+async def update_scheduler_limits(model: str, request: SchedulerLimitsRequest):
+    """모델별 동시 실행/대기열 제한 변경 (실행 중 적용)"""
+    try:
+        limits = cli_scheduler.set_limits(
+            model,
+            max_concurrent=request.max_concurrent,
+            max_queue=request.max_queue,
+            queue_timeout=request.queue_timeout,
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"model": model, "limits": limits.to_dict()}
+
+
+def _request_user(http_request: Request) -> str:
+    """공정 대기열 키 - JWT subject → X-Session-Id 헤더 → 클라이언트 주소"""
+    authorization = http_request.headers.get("authorization", "")
+    if JWT_SECRET_KEY and authorization.lower().startswith("bearer "):
+        try:
+            payload = validate_jwt_token(authorization[7:], JWT_SECRET_KEY)
+            subject = payload.get("sub") or payload.get("user_id")
+            if subject:
+                return f"user:{subject}"
+        except (TokenExpiredError, InvalidTokenError):
+            pass
+    session_id = http_request.headers.get("x-session-id")
+    if session_id:
+        return f"session:{session_id}"
+    if http_request.client is not None:
+        return f"client:{http_request.client.host}"
+    return "anonymous"
+
+
+async def _resolve_single(
+    request: AIResolveRequest,
+    endpoint: str = "resolve",
+    user: str = "anonymous",
+) -> AIResolveResponse:
+    """선택된 모델로 이슈 하나 해결 (에러는 호출자가 처리)"""
+    # 프롬프트 생성
+    prompt = request.prompt or f"Fix the issue: {request.issue_title}"
+
+    # 선택된 모델로 실행
+    executor = CLIExecutor(
+        model=request.model,
+        timeout=120,
+        pool=cli_pool,
+        registry=cli_registry,
+        cache=cli_cache,
+        scheduler=cli_scheduler,
+        priority=request.priority,
+        health=cli_health,
+        capture_store=cli_logs,
+        supervisor=cli_supervisor,
+        singleflight=cli_singleflight,
+        timeouts=cli_timeouts,
+        accounting=cli_usage,
+        endpoint=endpoint,
+        admission=cli_admission,
+        fair_queue=cli_fair_queue,
+        user=user,
+        structured_output=CLI_STRUCTURED_OUTPUT,
+        sessions=cli_sessions if request.reuse_session else None,
+        session_key=f"{user}:{request.repo or '-'}:issue:{request.issue_id}",
+    )
+    result = await executor.generate_code(
+        prompt, use_cache=not request.bypass_cache, context=request.context or ""
+    )
+
+    return AIResolveResponse(
+        success=True,
+        model_used=request.model,
+        code=result.get("code", ""),
+        output=result.get("output", ""),
+        message=f"Issue #{request.issue_id} resolved with {request.model}",
+        cached=result.get("cached", False),
+        output_truncated=result.get("output_truncated", False),
+        output_log_id=result.get("output_log_id"),
+        usage=result.get("usage"),
+        tool_calls=result.get("tool_calls"),
+        file_edits=result.get("file_edits"),
+        session=result.get("session"),
+    )
+
+
+@app.post("/api/ai/resolve", response_model=AIResolveResponse)
+async def resolve_issue_with_ai(request: AIResolveRequest, http_request: Request):
+    """AI로 이슈 해결"""
+    try:
+        return await _resolve_single(request, user=_request_user(http_request))
+    except SchedulerRejectedError as e:
+        raise _scheduler_http_error(e)
     except CLIExecutionError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
 
 
+def _sse_frame(data: dict, event_type: str) -> str:
+    """SSE 프레임 (이벤트 구분용 빈 줄 포함)"""
+    return create_sse_event(data, event_type) + "\n"
+
+
+@app.post("/api/ai/resolve/stream")
+async def resolve_issue_with_ai_stream(request: AIResolveRequest, http_request: Request):
+    """AI로 이슈 해결 (SSE 스트리밍)
+
+    이벤트 종류:
+    - progress: 진행 단계 (ProgressTracker)
+    - chunk: CLI 출력 텍스트 조각
+    - code_block: 닫는 fence가 도착한 코드 블록
+    - result: 최종 결과
+    - error: 실행 실패
+    """
+    prompt = request.prompt or f"Fix the issue: {request.issue_title}"
+    if request.context:
+        # 스트리밍/폴백은 세션을 재사용하지 않으므로 컨텍스트를 항상 포함
+        prompt = f"{request.context}\n\n{prompt}"
+    # /api/ai/resolve와 같은 협력 객체 (헬스/적응형 타임아웃/사용량 집계 포함)
+    executor = CLIExecutor(
+        model=request.model,
+        timeout=120,
+        registry=cli_registry,
+        scheduler=cli_scheduler,
+        priority=request.priority,
+        health=cli_health,
+        capture_store=cli_logs,
+        supervisor=cli_supervisor,
+        singleflight=cli_singleflight,
+        timeouts=cli_timeouts,
+        accounting=cli_usage,
+        endpoint="resolve_stream",
+        admission=cli_admission,
+        fair_queue=cli_fair_queue,
+        user=_request_user(http_request),
+        structured_output=CLI_STRUCTURED_OUTPUT,
+    )
+    phases = ["starting", "generating", "parsing", "completed"]
+
+    async def event_stream():
+        tracker = ProgressTracker(total_phases=len(phases))
+
+        def progress(phase: str) -> str:
+            tracker.update_phase(phase, phases.index(phase) + 1)
+            return _sse_frame(
+                {"phase": tracker.current_phase, "percentage": tracker.percentage},
+                "progress",
+            )
+
+        yield progress("starting")
+        parser = IncrementalFenceParser()
+        started = False
+        try:
+            async for chunk in executor.stream_output(prompt):
+                if not started:
+                    started = True
+                    yield progress("generating")
+                yield _sse_frame({"text": chunk}, "chunk")
+                # 닫는 fence가 도착한 코드 블록은 바로 전송
+                for block in parser.feed(chunk):
+                    yield _sse_frame(block, "code_block")
+
+            yield progress("parsing")
+            parsed = parser.close()
+            output = parser.text
+            code = parsed["code_blocks"][0]["code"] if parsed["code_blocks"] else ""
+
+            yield progress("completed")
+            yield _sse_frame(
+                {
+                    "success": True,
+                    "model_used": request.model,
+                    "code": code,
+                    "output": output,
+                    "message": f"Issue #{request.issue_id} resolved with {request.model}",
+                },
+                "result",
+            )
+        except SchedulerRejectedError as e:
+            yield _sse_frame(
+                {"success": False, "detail": str(e), "retry_after": e.retry_after},
+                "error",
+            )
+        except Exception as e:
+            yield _sse_frame({"success": False, "detail": str(e)}, "error")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _ndjson_line(data: dict, event_type: str) -> str:
+    """NDJSON 한 줄 (event 필드로 종류 구분)"""
+    return json.dumps({"event": event_type, **data}, ensure_ascii=False) + "\n"
+
+
+async def _resolve_batch_item(
+    index: int,
+    item: AIResolveRequest,
+    semaphore: asyncio.Semaphore,
+    user: str,
+) -> dict:
+    """배치 항목 하나 실행 - 실패/취소도 결과 dict로 반환"""
+    started_at = time.monotonic()
+    entry = {"index": index, "issue_id": item.issue_id, "model": item.model}
+    try:
+        async with semaphore:
+            response = await _resolve_single(item, endpoint="resolve_batch", user=user)
+        entry.update(status="succeeded", **response.model_dump())
+    except asyncio.CancelledError:
+        entry.update(status="cancelled", success=False)
+    except SchedulerRejectedError as e:
+        entry.update(status="failed", success=False, detail=str(e), retry_after=e.retry_after)
+    except Exception as e:
+        entry.update(status="failed", success=False, detail=str(e))
+    entry["elapsed_seconds"] = round(time.monotonic() - started_at, 4)
+    return entry
+
+
+@app.post("/api/ai/resolve/batch")
+async def resolve_issues_batch(request: AIBatchResolveRequest, http_request: Request):
+    """여러 이슈를 제한된 동시 실행으로 해결하고 완료 순서대로 스트리밍
+
+    이벤트 종류:
+    - batch: 시작 (batch_id, 항목 수) - DELETE /api/ai/resolve/batch/{batch_id}로 남은 항목 취소
+    - item: 항목 결과 (status: succeeded/failed/cancelled)
+    - summary: 전체 소요 시간, 상태별 개수, 항목 실행 시간 합계
+    """
+    if not request.items:
+        raise HTTPException(status_code=400, detail="Batch has no items")
+
+    batch_id = uuid.uuid4().hex
+    user = _request_user(http_request)
+    frame = _sse_frame if request.format == "sse" else _ndjson_line
+    media_type = "text/event-stream" if request.format == "sse" else "application/x-ndjson"
+
+    async def event_stream():
+        started_at = time.monotonic()
+        semaphore = asyncio.Semaphore(request.max_concurrency)
+        tasks = [
+            asyncio.create_task(_resolve_batch_item(index, item, semaphore, user))
+            for index, item in enumerate(request.items)
+        ]
+        active_batches[batch_id] = tasks
+        counts = {"succeeded": 0, "failed": 0, "cancelled": 0}
+        item_seconds = 0.0
+        try:
+            yield frame({"batch_id": batch_id, "total": len(tasks)}, "batch")
+            for next_done in asyncio.as_completed(tasks):
+                entry = await next_done
+                counts[entry["status"]] += 1
+                item_seconds += entry["elapsed_seconds"]
+                yield frame(entry, "item")
+
+            elapsed = time.monotonic() - started_at
+            yield frame(
+                {
+                    "batch_id": batch_id,
+                    "total": len(tasks),
+                    **counts,
+                    "elapsed_seconds": round(elapsed, 4),
+                    "item_seconds_total": round(item_seconds, 4),
+                    # 순차 실행 대비 병렬 실행으로 줄어든 비율
+                    "speedup": round(item_seconds / elapsed, 2) if elapsed > 0 else None,
+                },
+                "summary",
+            )
+        finally:
+            # 클라이언트 연결이 끊기면 남은 항목(실행 중인 CLI 포함)을 정리
+            active_batches.pop(batch_id, None)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "X-Batch-Id": batch_id},
+    )
+
+
+@app.delete("/api/ai/resolve/batch/{batch_id}")
+async def cancel_batch(batch_id: str):
+    """배치의 남은 항목 취소 (완료된 항목은 유지)"""
+    tasks = active_batches.get(batch_id)
+    if tasks is None:
+        raise HTTPException(status_code=404, detail=f"Batch not found: {batch_id}")
+    cancelled = sum(1 for task in tasks if not task.done() and task.cancel())
+    return {"batch_id": batch_id, "cancelled": cancelled}
+
+
+# === 백그라운드 작업 ===
+
+@app.post("/api/jobs", status_code=202)
+async def create_job(request: AIResolveRequest, http_request: Request):
+    """AI 해결 작업 등록 - job id를 즉시 반환하고 백그라운드에서 실행"""
+    user = _request_user(http_request)
+
+    async def run() -> dict:
+        response = await _resolve_single(request, endpoint="jobs", user=user)
+        return response.model_dump()
+
+    job = await job_queue.submit(
+        run,
+        metadata={"issue_id": request.issue_id, "model": request.model},
+    )
+    return {"job_id": job.job_id, "status": job.status}
+
+
+@app.get("/api/jobs")
+async def get_job_stats():
+    """작업 큐 상태 (워커 수, 상태별 작업 수)"""
+    return job_queue.stats()
+
+
+def _get_job_or_404(job_id: str):
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """작업 상태/결과 조회"""
+    return _get_job_or_404(job_id).to_dict()
+
+
+@app.delete("/api/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """작업 취소 - 실행 중이면 CLI 프로세스 종료"""
+    job = _get_job_or_404(job_id)
+    cancelled = await job_queue.cancel(job_id)
+    return {"job_id": job_id, "cancelled": cancelled, "status": job.status}
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """작업 이벤트 SSE 구독 (현재 상태 → 상태 변경 → 종료 상태에서 끝)"""
+    job = _get_job_or_404(job_id)
+    client_id = await job_queue.subscribe(job_id)
+
+    async def event_stream():
+        try:
+            yield _sse_frame({"event": "snapshot", **job.to_dict()}, "job")
+            if job.done:
+                return
+            # 토픽 프레임은 publish에서 한 번 직렬화한 bytes를 그대로 전송
+            async for frame in sse_manager.stream_frames(client_id):
+                yield frame.payload
+                if frame.data["status"] in TERMINAL_STATES:
+                    return
+        finally:
+            await job_queue.unsubscribe(job_id, client_id)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/events")
+async def stream_topic_events(
+    topic: list[str] = Query(..., min_length=1),
+    overflow: Optional[Literal["drop_oldest", "drop_newest", "coalesce", "disconnect"]] = None,
+    last_event_id: Optional[str] = Header(None),
+):
+    """토픽 이벤트 SSE 구독 (예: ?topic=repo:owner/name&topic=issue:42&topic=job:<id>)
+
+    overflow: 대기열이 가득 찼을 때의 정책 (기본: 서버 설정)
+    Last-Event-ID 헤더로 재연결하면 놓친 이벤트부터 전송, 이미 없어졌으면 resync 이벤트 전송
+    """
+    client_id = f"topics-{uuid.uuid4().hex}"
+    await sse_manager.connect(client_id, overflow=overflow)
+    sse_manager.resume(client_id, topic, last_event_id)
+
+    async def event_stream():
+        try:
+            async for frame in sse_manager.stream_frames(client_id):
+                yield frame.payload
+        finally:
+            await sse_manager.disconnect(client_id)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/events/stats")
+async def get_event_stats():
+    """SSE 연결/토픽 구독 수와 publish 통계"""
+    return sse_manager.stats()
+
+
+@app.get("/api/events/connections")
+async def get_event_connections():
+    """SSE 연결별 대기열 카운터 (대기/버림/교체 수, 대기 중인 bytes)"""
+    return sse_manager.connection_stats()
+
+
 @app.post("/api/ai/resolve-with-fallback", response_model=AIResolveResponse)
-async def resolve_issue_with_fallback(request: AIResolveRequest):
+async def resolve_issue_with_fallback(request: AIResolveRequest, http_request: Request):
     """AI로 이슈 해결 (폴백 지원)"""
     try:
         prompt = request.prompt or f"Fix the issue: {request.issue_title}"
+        if request.context:
+            prompt = f"{request.context}\n\n{prompt}"
 
         # 모든 모델 순서대로 시도
         models = [request.model, "claude", "codex", "gemini", "qwen"]
         # 중복 제거하면서 순서 유지
         unique_models = list(dict.fromkeys(models))
-
-        result = await execute_with_fallback(prompt, unique_models)
+        # 미설치 CLI 제외, 서킷이 열린 모델 제외 후 예상 성공 시간 순 정렬
+        unique_models = [
+            model for model in unique_models
+            if (status := cli_registry.cached(model)) is None or status.available
+        ]
+        unique_models = cli_health.order(unique_models, preferred=request.model)
+
+        result = await execute_with_fallback(
+            prompt,
+            unique_models,
+            pool=cli_pool,
+            registry=cli_registry,
+            scheduler=cli_scheduler,
+            priority=request.priority,
+            health=cli_health,
+            capture_store=cli_logs,
+            supervisor=cli_supervisor,
+            singleflight=cli_singleflight,
+            timeouts=cli_timeouts,
+            accounting=cli_usage,
+            endpoint="resolve_with_fallback",
+            admission=cli_admission,
+            fair_queue=cli_fair_queue,
+            user=_request_user(http_request),
+            structured_output=CLI_STRUCTURED_OUTPUT,
+            hedge=request.hedge,
+            hedge_delay=request.hedge_delay,
+        )
 
         return AIResolveResponse(
             success=True,
             model_used=result.get("model_used", request.model),
             code=result.get("code", ""),
             output=result.get("output", ""),
-            message=f"Issue #{request.issue_id} resolved with fallback"
+            message=f"Issue #{request.issue_id} resolved with fallback",
+            hedge_saved_seconds=result.get("hedge_saved_seconds"),
+            output_truncated=result.get("output_truncated", False),
+            output_log_id=result.get("output_log_id"),
+            usage=result.get("usage"),
+            tool_calls=result.get("tool_calls"),
+            file_edits=result.get("file_edits"),
         )
+    except SchedulerRejectedError as e:
+        raise _scheduler_http_error(e)
     except CLIExecutionError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
@@ -131,32 +824,33 @@ async def resolve_issue_with_fallback(request: AIResolveRequest):
 @app.get("/api/models")
 async def get_available_models():
     """사용 가능한 AI 모델 목록"""
+    statuses = await cli_registry.get_all()
     models = [
         {
             "id": "claude",
             "name": "Claude Code",
             "description": "Anthropic Claude 4.5 Opus",
-            "available": check_cli_available("claude")
         },
         {
             "id": "codex",
             "name": "GPT Codex",
             "description": "OpenAI GPT 5.1 Codex Max",
-            "available": check_cli_available("codex")
         },
         {
             "id": "gemini",
             "name": "Gemini",
             "description": "Google Gemini 3.0",
-            "available": check_cli_available("gemini")
         },
         {
             "id": "qwen",
             "name": "Qwen",
             "description": "Alibaba Qwen CLI",
-            "available": check_cli_available("qwen")
         }
     ]
+    for model in models:
+        status = statuses[model["id"]]
+        model["available"] = status.available
+        model["version"] = status.version
     return {"models": models}
 
 
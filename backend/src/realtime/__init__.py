@@ -1,7 +1,16 @@
 # Realtime Module
 from .sse import create_sse_event
 from .progress import ProgressTracker, calculate_percentage, format_log_message
-from .sse_server import SSEManager
+from .sse_server import (
+    COALESCE,
+    DISCONNECT,
+    DROP_NEWEST,
+    DROP_OLDEST,
+    OVERFLOW_POLICIES,
+    RESYNC_EVENT,
+    SSEFrame,
+    SSEManager,
+)
 
 __all__ = [
     "create_sse_event",
@@ -9,4 +18,11 @@ __all__ = [
     "calculate_percentage",
     "format_log_message",
     "SSEManager",
+    "SSEFrame",
+    "DROP_OLDEST",
+    "DROP_NEWEST",
+    "COALESCE",
+    "DISCONNECT",
+    "OVERFLOW_POLICIES",
+    "RESYNC_EVENT",
 ]
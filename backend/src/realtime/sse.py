@@ -3,12 +3,20 @@ SSE 이벤트 생성 모듈
 """
 
 import json
+from typing import Optional
 
 
-def create_sse_event(data: dict, event_type: str = "message") -> str:
-    """SSE 이벤트 포맷 생성"""
+def create_sse_event(
+    data: dict, event_type: str = "message", event_id: Optional[int] = None
+) -> str:
+    """SSE 이벤트 포맷 생성
+
+    event_id가 있으면 id 필드를 붙임 (브라우저가 재연결할 때 Last-Event-ID로 보냄)
+    """
     event_lines = []
 
+    if event_id is not None:
+        event_lines.append(f"id: {event_id}")
     if event_type != "message":
         event_lines.append(f"event: {event_type}")
 
@@ -1,37 +1,267 @@
 """
 SSE 서버 매니저 모듈
+
+연결마다 대기열 하나를 두고, 구독 루프는 이벤트가 들어오거나 연결이 닫힐 때만 깨어난다.
+(주기적인 타임아웃 폴링이 없으므로 유휴 연결은 CPU를 쓰지 않고, 연결 해제는 바로 전달된다)
+
+토픽(예: repo:owner/name, issue:42, job:<id>)을 구독한 연결에는 publish로 한 번에 전달한다.
+SSE 프레임은 publish마다 한 번만 직렬화하고 같은 SSEFrame 객체를 모든 구독자 대기열에 넣는다.
+
+연결별 대기열은 max_queue개로 제한되고, 가득 차면 overflow 정책을 따른다.
+(멈춘 브라우저 탭 하나가 이벤트를 무한히 쌓아 메모리를 다 쓰지 않도록)
+- drop_oldest: 가장 오래된 이벤트를 버리고 추가
+- drop_newest: 새 이벤트를 버림
+- coalesce: 같은 키(기본: 작업별 이벤트)의 대기 중인 이벤트를 최신 것으로 교체 (없으면 drop_oldest)
+- disconnect: 느린 연결을 끊음 (클라이언트는 재연결 후 상태를 다시 조회)
+
+publish한 프레임에는 단조 증가하는 id를 붙이고 토픽별 링 버퍼(replay_size개)에 보관한다.
+링 버퍼 전체 크기는 replay_bytes로 제한한다 (넘으면 가장 오래 publish 안 한 토픽부터 제거).
+Last-Event-ID로 재연결한 클라이언트는 resume에서 놓친 이벤트만 다시 받는다.
+놓친 이벤트가 이미 링 버퍼에서 밀려났으면 resync 이벤트를 보내 전체 상태를 다시 조회하게 한다.
 """
 
 import asyncio
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Callable, Hashable, Optional
 from datetime import datetime
 
+from .sse import create_sse_event
+
+# 대기 중인 구독 루프를 깨우는 연결 종료 표시
+_CLOSED = object()
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+COALESCE = "coalesce"
+DISCONNECT = "disconnect"
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEWEST, COALESCE, DISCONNECT)
+
+# 재개할 수 없을 때 보내는 이벤트 - 클라이언트는 리소스 전체를 다시 조회
+RESYNC_EVENT = "resync"
+
+
+@dataclass(frozen=True)
+class SSEFrame:
+    """직렬화된 SSE 프레임 - 구독자 전체가 같은 객체를 공유"""
+    data: dict
+    event_type: str
+    payload: bytes
+    event_id: Optional[int] = None
+
+    @classmethod
+    def encode(
+        cls, data: dict, event_type: str = "message", event_id: Optional[int] = None
+    ) -> "SSEFrame":
+        # 이벤트 구분용 빈 줄 포함
+        payload = (create_sse_event(data, event_type, event_id) + "\n").encode()
+        return cls(data=data, event_type=event_type, payload=payload, event_id=event_id)
+
+
+class TopicLog:
+    """토픽별 최근 프레임 링 버퍼 (Last-Event-ID 재개용)"""
+
+    def __init__(self, size: int):
+        self.frames: deque[SSEFrame] = deque()
+        self.size = size
+        # 보관 중인 프레임 크기 합
+        self.bytes = 0
+        # 링 버퍼에서 밀려난 마지막 프레임 id - 이보다 오래된 id에서는 재개할 수 없음
+        self.evicted_through = 0
+
+    def append(self, frame: SSEFrame):
+        self.frames.append(frame)
+        self.bytes += len(frame.payload)
+        while len(self.frames) > self.size:
+            self.evict_oldest()
+
+    def evict_oldest(self):
+        """가장 오래된 프레임 제거"""
+        frame = self.frames.popleft()
+        self.bytes -= len(frame.payload)
+        self.evicted_through = frame.event_id
+
+    def since(self, event_id: int) -> Optional[list[SSEFrame]]:
+        """event_id 이후 프레임 (이미 밀려난 프레임이 있으면 None)"""
+        if event_id < self.evicted_through:
+            return None
+        return [frame for frame in self.frames if frame.event_id > event_id]
+
+
+def job_coalesce_key(frame: SSEFrame) -> Optional[Hashable]:
+    """기본 coalesce 키 - 작업 이벤트는 작업별 최신 상태만 남김 (그 외 이벤트는 합치지 않음)"""
+    job_id = frame.data.get("job_id")
+    if job_id is None:
+        return None
+    return (frame.event_type, job_id)
+
 
 @dataclass
 class SSEConnection:
-    """SSE 연결"""
+    """SSE 연결
+
+    - max_queue: 대기열에 쌓아 둘 최대 이벤트 수
+    - overflow: 대기열이 가득 찼을 때의 정책 (OVERFLOW_POLICIES)
+    - queued: 대기열에 들어간 이벤트 수, dropped: 버린 이벤트 수, coalesced: 최신 이벤트로 교체한 수
+    - buffered_bytes: 대기 중인 프레임 크기 합
+    """
     client_id: str
     is_connected: bool = True
     created_at: datetime = field(default_factory=datetime.now)
     reconnection_count: int = 0
-    _queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    max_queue: int = 256
+    overflow: str = DROP_OLDEST
+    coalesce_key: Callable[[SSEFrame], Optional[Hashable]] = job_coalesce_key
+    queued: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    buffered_bytes: int = 0
+    # 대기열이 넘쳐서 끊긴 경우
+    overflowed: bool = False
+    _buffer: deque = field(default_factory=deque)
+    _ready: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def __post_init__(self):
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {self.overflow}")
+        if self.max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+
+    def offer(self, frame: SSEFrame) -> bool:
+        """대기열에 추가 (overflow 정책 적용) - 새 프레임이 대기열에 들어갔는지 반환"""
+        if not self.is_connected:
+            return False
+
+        if len(self._buffer) >= self.max_queue:
+            if self.overflow == COALESCE and self._replace(frame):
+                self.queued += 1
+                return True
+            if self.overflow == DROP_NEWEST:
+                self.dropped += 1
+                return False
+            if self.overflow == DISCONNECT:
+                self.dropped += len(self._buffer) + 1
+                self.overflowed = True
+                self._clear()
+                self.close()
+                return False
+            self.buffered_bytes -= len(self._buffer.popleft().payload)
+            self.dropped += 1
+
+        self._buffer.append(frame)
+        self.buffered_bytes += len(frame.payload)
+        self.queued += 1
+        self._ready.set()
+        return True
+
+    def _replace(self, frame: SSEFrame) -> bool:
+        key = self.coalesce_key(frame)
+        if key is None:
+            return False
+        for index, pending in enumerate(self._buffer):
+            if self.coalesce_key(pending) == key:
+                self._buffer[index] = frame
+                self.buffered_bytes += len(frame.payload) - len(pending.payload)
+                self.coalesced += 1
+                return True
+        return False
+
+    def _clear(self):
+        self._buffer.clear()
+        self.buffered_bytes = 0
+
+    async def get(self):
+        """다음 프레임 (연결이 닫혔으면 _CLOSED)"""
+        while not self._buffer:
+            if not self.is_connected:
+                return _CLOSED
+            self._ready.clear()
+            await self._ready.wait()
+        frame = self._buffer.popleft()
+        self.buffered_bytes -= len(frame.payload)
+        return frame
+
+    def close(self):
+        """연결 종료 - 대기 중인 stream_events를 즉시 깨워 끝냄"""
+        if self.is_connected:
+            self.is_connected = False
+            self._ready.set()
+
+    def stats(self) -> dict:
+        return {
+            "client_id": self.client_id,
+            "overflow": self.overflow,
+            "pending": len(self._buffer),
+            "queued": self.queued,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "buffered_bytes": self.buffered_bytes,
+        }
 
 
 class SSEManager:
-    """SSE 연결 매니저"""
+    """SSE 연결 매니저
+
+    - max_queue/overflow: 새 연결의 기본 대기열 크기와 넘침 정책 (connect에서 연결별로 지정 가능)
+    - replay_size: 토픽별로 보관할 최근 프레임 수 (0이면 재개하지 않고 항상 resync)
+    - max_topics: 링 버퍼를 유지할 최대 토픽 수 (넘으면 가장 오래 publish 안 한 토픽부터 제거)
+    - replay_bytes: 링 버퍼 전체 프레임 크기 상한 (넘으면 가장 오래 publish 안 한 토픽부터 제거)
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_queue: int = 256,
+        overflow: str = DROP_OLDEST,
+        replay_size: int = 256,
+        max_topics: int = 1024,
+        replay_bytes: int = 16 * 1024 * 1024,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.replay_size = replay_size
+        self.max_topics = max_topics
+        self.replay_bytes = replay_bytes
         self.active_connections: dict[str, SSEConnection] = {}
         self._reconnection_counts: dict[str, int] = {}
+        # 토픽 → 구독 client_id, client_id → 구독 토픽 (재연결해도 구독 유지, disconnect에서 해제)
+        self._topics: dict[str, set[str]] = {}
+        self._client_topics: dict[str, set[str]] = {}
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.overflow_disconnects = 0
+        # 이벤트 id는 프로세스 시작 시각(마이크로초)부터 증가
+        # (재시작 전 프로세스가 발급한 id는 _id_base보다 작으므로 resync로 처리)
+        self._id_base = time.time_ns() // 1000
+        self._last_event_id = self._id_base
+        self._logs: "OrderedDict[str, TopicLog]" = OrderedDict()
+        # 제거된 토픽 링 버퍼의 마지막 id - 링 버퍼가 없는 토픽은 이보다 오래된 id에서 재개 불가
+        self._log_floor = self._id_base
+        self._log_bytes = 0
+        self.replayed = 0
+        self.resyncs = 0
 
-    async def connect(self, client_id: str) -> SSEConnection:
+    async def connect(
+        self,
+        client_id: str,
+        max_queue: Optional[int] = None,
+        overflow: Optional[str] = None,
+    ) -> SSEConnection:
         """클라이언트 연결"""
         reconnection_count = self._reconnection_counts.get(client_id, 0)
+        previous = self.active_connections.get(client_id)
+        if previous is not None:
+            # 같은 client_id로 다시 연결 - 이전 연결의 구독 루프는 끝냄
+            previous.close()
 
         connection = SSEConnection(
             client_id=client_id,
             reconnection_count=reconnection_count,
+            max_queue=max_queue or self.max_queue,
+            overflow=overflow or self.overflow,
         )
         self.active_connections[client_id] = connection
 
@@ -40,27 +270,186 @@ class SSEManager:
     async def disconnect(self, client_id: str):
         """클라이언트 연결 해제"""
         if client_id in self.active_connections:
-            self.active_connections[client_id].is_connected = False
+            self.active_connections[client_id].close()
             # Track reconnection count
             current_count = self._reconnection_counts.get(client_id, 0)
             self._reconnection_counts[client_id] = current_count + 1
             del self.active_connections[client_id]
+        for topic in list(self._client_topics.get(client_id, ())):
+            self.unsubscribe(client_id, topic)
 
-    async def send_event(self, client_id: str, data: dict):
+    def _offer(self, conn: SSEConnection, frame: SSEFrame) -> bool:
+        """연결 대기열에 추가하고 버린 이벤트/넘쳐서 끊긴 연결 집계 - 추가됐는지 반환"""
+        if not conn.is_connected:
+            return False
+        dropped = conn.dropped
+        accepted = conn.offer(frame)
+        self.dropped += conn.dropped - dropped
+        if conn.overflowed:
+            self.overflow_disconnects += 1
+        return accepted
+
+    async def send_event(self, client_id: str, data: dict, event_type: str = "message"):
         """클라이언트에 이벤트 전송"""
-        if client_id in self.active_connections:
-            conn = self.active_connections[client_id]
-            await conn._queue.put(data)
+        conn = self.active_connections.get(client_id)
+        if conn is not None:
+            self._offer(conn, SSEFrame.encode(data, event_type))
 
-    async def stream_events(self, client_id: str) -> AsyncIterator[dict]:
-        """클라이언트 이벤트 스트리밍"""
-        if client_id not in self.active_connections:
+    def subscribe(self, client_id: str, topic: str):
+        """토픽 구독"""
+        self._topics.setdefault(topic, set()).add(client_id)
+        self._client_topics.setdefault(client_id, set()).add(topic)
+
+    def unsubscribe(self, client_id: str, topic: str):
+        """토픽 구독 해제"""
+        subscribers = self._topics.get(topic)
+        if subscribers is not None:
+            subscribers.discard(client_id)
+            if not subscribers:
+                del self._topics[topic]
+        topics = self._client_topics.get(client_id)
+        if topics is not None:
+            topics.discard(topic)
+            if not topics:
+                del self._client_topics[client_id]
+
+    def publish(self, topic: str, data: dict, event_type: str = "message") -> int:
+        """토픽 구독자 전체에 전송 - 프레임은 한 번만 직렬화, 전달한 연결 수 반환
+
+        구독자가 없어도 링 버퍼에는 남김 (재연결 중인 클라이언트가 resume으로 받아 감)
+        """
+        subscribers = self._topics.get(topic)
+        if not subscribers and self.replay_size <= 0:
+            return 0
+        self._last_event_id += 1
+        frame = SSEFrame.encode(data, event_type, self._last_event_id)
+        self._record(topic, frame)
+        delivered = 0
+        for client_id in subscribers or ():
+            conn = self.active_connections.get(client_id)
+            if conn is not None and self._offer(conn, frame):
+                delivered += 1
+        self.published += 1
+        self.delivered += delivered
+        return delivered
+
+    def _record(self, topic: str, frame: SSEFrame):
+        if self.replay_size <= 0:
+            self._log_floor = frame.event_id
             return
+        log = self._logs.get(topic)
+        if log is None:
+            log = self._logs[topic] = TopicLog(self.replay_size)
+        else:
+            self._logs.move_to_end(topic)
+        before = log.bytes
+        log.append(frame)
+        self._log_bytes += log.bytes - before
+        while len(self._logs) > 1 and (
+            len(self._logs) > self.max_topics or self._log_bytes > self.replay_bytes
+        ):
+            _, evicted = self._logs.popitem(last=False)
+            self._log_bytes -= evicted.bytes
+            self._log_floor = max(self._log_floor, evicted.frames[-1].event_id)
+        # 토픽 하나만으로 상한을 넘으면 그 토픽의 오래된 프레임부터 제거 (최신 프레임은 유지)
+        while self._log_bytes > self.replay_bytes and len(log.frames) > 1:
+            before = log.bytes
+            log.evict_oldest()
+            self._log_bytes -= before - log.bytes
 
-        conn = self.active_connections[client_id]
-        while conn.is_connected:
-            try:
-                event = await asyncio.wait_for(conn._queue.get(), timeout=1.0)
-                yield event
-            except asyncio.TimeoutError:
+    def replay(self, topics: list[str], last_event_id: int) -> Optional[list[SSEFrame]]:
+        """last_event_id 이후 토픽들에 publish된 프레임 (id 순) - 놓친 프레임이 없어졌으면 None"""
+        if not self._id_base <= last_event_id <= self._last_event_id:
+            # 재시작 전 프로세스가 발급했거나 알 수 없는 id
+            return None
+        missed = []
+        for topic in topics:
+            log = self._logs.get(topic)
+            if log is None:
+                # publish된 적이 없거나 링 버퍼가 제거된 토픽
+                if last_event_id < self._log_floor:
+                    return None
                 continue
+            frames = log.since(last_event_id)
+            if frames is None:
+                return None
+            missed.extend(frames)
+        missed.sort(key=lambda frame: frame.event_id)
+        return missed
+
+    def resume(
+        self, client_id: str, topics: list[str], last_event_id: Optional[str] = None
+    ) -> Optional[int]:
+        """토픽 구독 + Last-Event-ID 이후 놓친 프레임 재전송
+
+        재전송한 프레임 수 반환. 재개할 수 없으면(링 버퍼에서 밀려남, 대기열보다 많음 등)
+        resync 이벤트를 보내고 None 반환. 구독과 재전송 사이에 publish가 끼어들지 않도록 동기 함수.
+        """
+        for topic in topics:
+            self.subscribe(client_id, topic)
+        conn = self.active_connections.get(client_id)
+        if conn is None or last_event_id is None:
+            return 0
+
+        try:
+            missed = self.replay(topics, int(last_event_id))
+        except ValueError:
+            missed = None
+        if missed is None or len(missed) > conn.max_queue:
+            self.resyncs += 1
+            # id는 현재 마지막 id - 클라이언트는 전체 상태를 다시 조회하고 여기서부터 이어 받음
+            resync = {"reason": "events_unavailable", "last_event_id": last_event_id}
+            self._offer(conn, SSEFrame.encode(resync, RESYNC_EVENT, self._last_event_id))
+            return None
+
+        for frame in missed:
+            self._offer(conn, frame)
+        self.replayed += len(missed)
+        return len(missed)
+
+    async def _stream(self, client_id: str) -> AsyncIterator[SSEFrame]:
+        """연결 대기열 항목 - 연결이 닫히면 남은 이벤트와 관계없이 바로 종료"""
+        conn = self.active_connections.get(client_id)
+        if conn is None:
+            return
+
+        while conn.is_connected:
+            frame = await conn.get()
+            if frame is _CLOSED or not conn.is_connected:
+                return
+            yield frame
+
+    async def stream_events(self, client_id: str) -> AsyncIterator[dict]:
+        """클라이언트 이벤트 스트리밍 (이벤트 data만)"""
+        async for frame in self._stream(client_id):
+            yield frame.data
+
+    async def stream_frames(self, client_id: str) -> AsyncIterator[SSEFrame]:
+        """직렬화된 프레임 스트리밍 (frame.payload를 그대로 응답에 씀)"""
+        async for frame in self._stream(client_id):
+            yield frame
+
+    def connection_stats(self) -> list[dict]:
+        """연결별 대기열 카운터"""
+        return [conn.stats() for conn in self.active_connections.values()]
+
+    def stats(self) -> dict:
+        """연결/토픽 수, publish 통계, 대기 중인 프레임 크기 합"""
+        return {
+            "connections": len(self.active_connections),
+            "topics": len(self._topics),
+            "subscriptions": sum(len(s) for s in self._topics.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "overflow_disconnects": self.overflow_disconnects,
+            "buffered_bytes": sum(c.buffered_bytes for c in self.active_connections.values()),
+            "max_queue": self.max_queue,
+            "overflow": self.overflow,
+            "last_event_id": self._last_event_id,
+            "replay_topics": len(self._logs),
+            "replay_frames": sum(len(log.frames) for log in self._logs.values()),
+            "replay_bytes": self._log_bytes,
+            "replayed": self.replayed,
+            "resyncs": self.resyncs,
+        }
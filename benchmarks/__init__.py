@@ -0,0 +1 @@
+# Benchmarks - 실행: python -m benchmarks.<모듈명> (저장소 루트에서)
@@ -0,0 +1,239 @@
+"""
+executor 경로 벤치마크 - 가짜 CLI로 CLIExecutor / execute_with_fallback / API 측정
+
+실행: python -m benchmarks.bench_executor [--concurrency 1,4,16] [--requests 32]
+      [--latency 0.05] [--output-bytes 2048] [--chunks 1] [--out results.jsonl]
+결과: 시나리오/동시성별 JSON 한 줄 (처리량, p50/p95/p99 지연, spawn 오버헤드, 최대 RSS)
+버전 간 비교를 위해 첫 줄에 git HEAD와 파이썬 버전을 기록한다.
+"""
+
+import argparse
+import asyncio
+import atexit
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from backend.src.cli.latency import percentile
+from benchmarks.fake_cli import install
+
+MODELS = ("claude", "codex", "gemini", "qwen")
+
+
+def _peak_rss() -> dict:
+    """현재 프로세스/회수된 자식 프로세스의 최대 RSS (bytes, Linux 기준 KB 단위 변환)"""
+    scale = 1 if sys.platform == "darwin" else 1024
+    return {
+        "peak_rss_self_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+        "peak_rss_children_bytes": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale,
+    }
+
+
+async def _drive(call, concurrency: int, requests: int, errors_to_count: tuple) -> dict:
+    """concurrency개 동시 실행으로 requests번 호출해 지연 시간 수집
+
+    errors_to_count: 실패로 집계할 예외 (그 외 예외는 벤치마크 버그이므로 그대로 전파)
+    """
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for index in remaining:
+            started = time.perf_counter()
+            try:
+                await call(index)
+            except errors_to_count:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+        "p50_seconds": round(percentile(latencies, 0.50), 6),
+        "p95_seconds": round(percentile(latencies, 0.95), 6),
+        "p99_seconds": round(percentile(latencies, 0.99), 6),
+    }
+
+
+async def measure_spawn_overhead(samples: int = 20) -> dict:
+    """프로세스 생성 → 첫 응답까지 걸리는 시간 (가짜 CLI 지연 0)"""
+    from backend.src.cli.executor import CLIExecutor
+
+    os.environ["FAKE_CLI_CLAUDE_LATENCY"] = "0"
+    try:
+        executor = CLIExecutor(model="claude")
+        spawn_times = []
+        total_times = []
+        for _ in range(samples):
+            started = time.perf_counter()
+            process = await executor.spawn_process()
+            spawn_times.append(time.perf_counter() - started)
+            await process.communicate(b"ping")
+            total_times.append(time.perf_counter() - started)
+    finally:
+        del os.environ["FAKE_CLI_CLAUDE_LATENCY"]
+    return {
+        "scenario": "spawn",
+        "samples": samples,
+        "spawn_p50_seconds": round(percentile(spawn_times, 0.5), 6),
+        "spawn_p95_seconds": round(percentile(spawn_times, 0.95), 6),
+        "roundtrip_p50_seconds": round(percentile(total_times, 0.5), 6),
+        "roundtrip_p95_seconds": round(percentile(total_times, 0.95), 6),
+    }
+
+
+async def bench_executor(concurrency: int, requests: int) -> dict:
+    from backend.src.cli.executor import CLIExecutionError, CLIExecutor, CLITimeoutError
+
+    async def call(index):
+        executor = CLIExecutor(model=MODELS[index % len(MODELS)])
+        await executor.generate_code(f"prompt {index}", use_cache=False)
+
+    errors = (CLIExecutionError, CLITimeoutError)
+    return {"scenario": "executor", **await _drive(call, concurrency, requests, errors)}
+
+
+async def bench_fallback(concurrency: int, requests: int) -> dict:
+    """첫 모델(claude)이 실패해 다음 모델로 넘어가는 경로"""
+    from backend.src.cli.executor import CLIExecutionError, execute_with_fallback
+    from backend.src.cli.scheduler import SchedulerRejectedError
+
+    os.environ["FAKE_CLI_CLAUDE_EXIT_CODE"] = "1"
+    try:
+        async def call(index):
+            await execute_with_fallback(f"prompt {index}", ["claude", "codex"])
+
+        errors = (CLIExecutionError, SchedulerRejectedError)
+        return {"scenario": "fallback", **await _drive(call, concurrency, requests, errors)}
+    finally:
+        del os.environ["FAKE_CLI_CLAUDE_EXIT_CODE"]
+
+
+def _import_app():
+    """임시 HOME에서 main 임포트
+
+    main은 임포트 시점에 ~/.cache/gitcommand-center 아래 타임아웃 기록/응답 캐시 경로를
+    정하므로, 벤치마크 실행이 실제 상태를 덮어쓰지 않도록 HOME을 잠시 바꿔 둔다.
+    """
+    if "backend.src.main" not in sys.modules:
+        home = tempfile.mkdtemp(prefix="bench-home-")
+        atexit.register(shutil.rmtree, home, True)
+        previous = os.environ.get("HOME")
+        os.environ["HOME"] = home
+        try:
+            import backend.src.main  # noqa: F401
+        finally:
+            if previous is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = previous
+    return sys.modules["backend.src.main"]
+
+
+async def bench_api(concurrency: int, requests: int) -> dict:
+    """FastAPI 앱을 ASGI로 직접 호출 (네트워크 제외, 스케줄러/캐시 경로 포함)"""
+    import httpx
+
+    main = _import_app()
+    app, cli_scheduler = main.app, main.cli_scheduler
+    for model in MODELS:
+        cli_scheduler.set_limits(model, max_concurrent=concurrency, max_queue=requests)
+
+    transport = httpx.ASGITransport(app=app)
+    client = httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300)
+    async with client:
+        async def call(index):
+            response = await client.post("/api/ai/resolve", json={
+                "model": MODELS[index % len(MODELS)],
+                "issue_id": index,
+                "issue_title": f"bench {index}",
+                "bypass_cache": True,
+            })
+            response.raise_for_status()
+
+        errors = (httpx.HTTPError,)
+        return {"scenario": "api", **await _drive(call, concurrency, requests, errors)}
+
+
+def _environment() -> dict:
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        head = ""
+    return {
+        "scenario": "environment",
+        "git_head": head,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+async def run(args) -> list[dict]:
+    os.environ.update({
+        "FAKE_CLI_LATENCY": str(args.latency),
+        "FAKE_CLI_OUTPUT_BYTES": str(args.output_bytes),
+        "FAKE_CLI_CHUNKS": str(args.chunks),
+    })
+    results = [_environment(), {**await measure_spawn_overhead(), **_peak_rss()}]
+    benches = {"executor": bench_executor, "fallback": bench_fallback, "api": bench_api}
+    for name in args.scenarios.split(","):
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            result = await benches[name](concurrency, args.requests)
+            results.append({
+                **result,
+                "latency_setting": args.latency,
+                "output_bytes": args.output_bytes,
+                **_peak_rss(),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--scenarios", default="executor,fallback,api", help="실행할 시나리오 (쉼표 구분)"
+    )
+    parser.add_argument("--concurrency", default="1,4,16", help="동시 실행 수 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=32, help="동시성 단계별 요청 수")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 CLI 응답 시간(초)")
+    parser.add_argument("--output-bytes", type=int, default=2048, help="가짜 CLI 출력 크기")
+    parser.add_argument("--chunks", type=int, default=1, help="출력 스트리밍 조각 수")
+    parser.add_argument("--out", help="결과를 JSON lines로 저장할 파일")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="fake-cli-") as bin_dir:
+        install(bin_dir)
+        os.environ["PATH"] = bin_dir + os.pathsep + os.environ.get("PATH", "")
+        results = asyncio.run(run(args))
+
+    lines = [json.dumps(result) for result in results]
+    for line in lines:
+        print(line)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    main()
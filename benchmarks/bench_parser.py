@@ -0,0 +1,111 @@
+"""
+CLI 출력 파서 벤치마크 - 기존 정규식 2-pass 파서 vs IncrementalFenceParser
+
+실행: python -m benchmarks.bench_parser [--sizes 1,4,16] [--chunk 4096]
+결과: 크기별 JSON 한 줄 (소요 시간, tracemalloc 최대 메모리)
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+import tracemalloc
+
+from backend.src.cli.parser import IncrementalFenceParser
+
+_CODE_BLOCK_PATTERN = r"```(\w+)?\n([\s\S]*?)```"
+
+
+def regex_parse_cli_output(raw_output: str) -> dict:
+    """기존 구현 (finditer + sub) - 비교 기준"""
+    code_blocks = []
+    for match in re.finditer(_CODE_BLOCK_PATTERN, raw_output):
+        code_blocks.append({
+            "language": match.group(1) or "text",
+            "code": match.group(2).strip(),
+        })
+    explanation = re.sub(_CODE_BLOCK_PATTERN, "", raw_output).strip()
+    return {
+        "code_blocks": code_blocks,
+        "explanation": explanation,
+        "has_code": len(code_blocks) > 0,
+    }
+
+
+def make_output(size_bytes: int, seed: int = 0) -> str:
+    """설명 문단과 코드 블록이 섞인 CLI 출력 생성"""
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    while total < size_bytes:
+        if rng.random() < 0.5:
+            lines = [
+                f"    value_{i} = compute({i}, {rng.randint(0, 999)})"
+                for i in range(rng.randint(5, 80))
+            ]
+            part = "```python\ndef generated():\n" + "\n".join(lines) + "\n```\n"
+        else:
+            part = "Explanation of the change, step %d. " % total * rng.randint(1, 6) + "\n\n"
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)
+
+
+def _measure(func) -> tuple[float, int, object]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def run(size_mb: float, chunk_size: int) -> dict:
+    text = make_output(int(size_mb * 1024 * 1024))
+    # 스트림으로 도착하는 청크를 흉내 (측정 대상에서 제외)
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    del text
+
+    def buffered():
+        # 기존 방식: 전체 출력을 모은 뒤 파싱
+        return regex_parse_cli_output("".join(chunks))
+
+    def incremental():
+        parser = IncrementalFenceParser()
+        first_block_at = None
+        started = time.perf_counter()
+        for chunk in chunks:
+            if parser.feed(chunk) and first_block_at is None:
+                first_block_at = time.perf_counter() - started
+        return parser.close(), first_block_at
+
+    regex_time, regex_peak, expected = _measure(buffered)
+    inc_time, inc_peak, (result, first_block_at) = _measure(incremental)
+
+    return {
+        "size_bytes": sum(len(chunk) for chunk in chunks),
+        "chunk_size": chunk_size,
+        "code_blocks": len(expected["code_blocks"]),
+        "identical": result == expected,
+        "regex_seconds": round(regex_time, 4),
+        "regex_peak_bytes": regex_peak,
+        "incremental_seconds": round(inc_time, 4),
+        "incremental_peak_bytes": inc_peak,
+        "incremental_first_block_seconds": round(first_block_at or 0.0, 6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1,4,16", help="출력 크기 (MB, 쉼표 구분)")
+    parser.add_argument("--chunk", type=int, default=4096, help="청크 크기 (bytes)")
+    args = parser.parse_args()
+
+    for size in args.sizes.split(","):
+        print(json.dumps(run(float(size), args.chunk)))
+
+
+if __name__ == "__main__":
+    main()
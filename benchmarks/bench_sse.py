@@ -0,0 +1,180 @@
+"""
+SSE 벤치마크
+
+- idle: 이벤트 기반 SSEManager vs 기존 1초 타임아웃 폴링
+  (유휴 구간 CPU 시간, 연결당 초당 깨어난 횟수, 연결 해제 후 구독 루프 종료까지 지연 p50/p99)
+- fanout: 토픽 publish(한 번 직렬화) vs 구독자별 send_event + 직렬화
+  (이벤트 하나를 모든 구독자 대기열에 넣는 시간 p50/p99, 구독자 전체가 프레임을 받기까지 시간)
+
+실행: python -m benchmarks.bench_sse [--scenarios idle,fanout] [--connections 100,1000,10000]
+      [--idle 3.0] [--events 20] [--payload-bytes 2048]
+결과: 시나리오/방식/연결 수별 JSON 한 줄
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import time
+
+from backend.src.cli.latency import percentile
+from backend.src.realtime.sse_server import SSEManager
+
+
+async def _event_driven_consumer(manager: SSEManager, client_id: str, counters: dict):
+    async for _ in manager.stream_events(client_id):
+        counters["events"] += 1
+
+
+async def _polling_consumer(manager: SSEManager, client_id: str, counters: dict):
+    """기존 구현 - 1초마다 타임아웃으로 깨어나 연결 상태 확인 (비교 기준)"""
+    conn = manager.active_connections[client_id]
+    while conn.is_connected:
+        try:
+            await asyncio.wait_for(conn.get(), timeout=1.0)
+            counters["events"] += 1
+        except asyncio.TimeoutError:
+            counters["wakeups"] += 1
+            continue
+
+
+def _polling_disconnect(manager: SSEManager, client_id: str):
+    """기존 disconnect - 상태만 바꾸고 대기 중인 루프는 깨우지 않음"""
+    manager.active_connections.pop(client_id).is_connected = False
+
+
+async def bench(mode: str, connections: int, idle: float) -> dict:
+    manager = SSEManager()
+    consumer = _event_driven_consumer if mode == "event" else _polling_consumer
+    counters = {"events": 0, "wakeups": 0}
+    finished_at: dict[str, float] = {}
+
+    async def run(client_id: str):
+        await consumer(manager, client_id, counters)
+        finished_at[client_id] = time.perf_counter()
+
+    client_ids = [f"client-{i}" for i in range(connections)]
+    for client_id in client_ids:
+        await manager.connect(client_id)
+    tasks = [asyncio.create_task(run(client_id)) for client_id in client_ids]
+    await asyncio.sleep(0.1)
+
+    # 유휴 구간: 이벤트 없이 연결만 유지
+    cpu_started = time.process_time()
+    await asyncio.sleep(idle)
+    idle_cpu = time.process_time() - cpu_started
+    wakeups = counters["wakeups"]
+
+    # 연결 해제 → 구독 루프 종료까지 지연
+    disconnected_at = {}
+    for client_id in client_ids:
+        disconnected_at[client_id] = time.perf_counter()
+        if mode == "event":
+            await manager.disconnect(client_id)
+        else:
+            _polling_disconnect(manager, client_id)
+    await asyncio.gather(*tasks)
+    delays = [finished_at[c] - disconnected_at[c] for c in client_ids]
+
+    return {
+        "scenario": "sse_idle",
+        "mode": mode,
+        "connections": connections,
+        "idle_seconds": idle,
+        "idle_cpu_seconds": round(idle_cpu, 6),
+        "idle_cpu_percent": round(idle_cpu / idle * 100, 3),
+        "wakeups_per_connection_per_second": round(wakeups / connections / idle, 4),
+        "disconnect_delay_p50": round(percentile(delays, 0.50), 6),
+        "disconnect_delay_p99": round(percentile(delays, 0.99), 6),
+    }
+
+
+async def bench_fanout(mode: str, connections: int, events: int, payload_bytes: int) -> dict:
+    """구독자 connections명에게 이벤트 events개 broadcast
+
+    publish 시간에는 대기 중인 구독 루프를 깨우는 비용이 포함되므로 구독자가 바쁠수록 작게 나온다.
+    직렬화 비용 비교는 전체 CPU 시간(cpu_per_delivery_us)으로 본다.
+    """
+    manager = SSEManager()
+    client_ids = [f"viewer-{i}" for i in range(connections)]
+    for client_id in client_ids:
+        await manager.connect(client_id)
+        manager.subscribe(client_id, "issue:42")
+    remaining = connections * events
+    done = asyncio.Event()
+
+    async def consume(client_id: str):
+        nonlocal remaining
+        async for _ in manager.stream_frames(client_id):
+            remaining -= 1
+            if remaining == 0:
+                done.set()
+
+    tasks = [asyncio.create_task(consume(client_id)) for client_id in client_ids]
+    await asyncio.sleep(0.1)
+    # 준비 단계에서 만든 연결/태스크 객체 때문에 측정 중 full GC가 끼어들지 않도록
+    gc.collect()
+    gc.freeze()
+
+    publish_times = []
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    for index in range(events):
+        data = {"issue_id": 42, "state": "updated", "sequence": index, "body": "x" * payload_bytes}
+        publish_started = time.perf_counter()
+        if mode == "topic":
+            manager.publish("issue:42", data, "issue")
+        else:
+            for client_id in client_ids:
+                # 구독자마다 직렬화
+                await manager.send_event(client_id, data, "issue")
+        publish_times.append(time.perf_counter() - publish_started)
+        await asyncio.sleep(0)
+    await done.wait()
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    gc.unfreeze()
+    for client_id in client_ids:
+        await manager.disconnect(client_id)
+    await asyncio.gather(*tasks)
+    return {
+        "scenario": "sse_fanout",
+        "mode": mode,
+        "connections": connections,
+        "events": events,
+        "payload_bytes": payload_bytes,
+        "publish_p50": round(percentile(publish_times, 0.50), 6),
+        "publish_p99": round(percentile(publish_times, 0.99), 6),
+        "delivered_per_second": round(connections * events / elapsed, 1),
+        "cpu_per_delivery_us": round(cpu / (connections * events) * 1e6, 3),
+        "total_seconds": round(elapsed, 6),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--connections", default="100,1000,10000", help="연결 수 (쉼표 구분)")
+    parser.add_argument("--idle", type=float, default=3.0, help="유휴 구간 길이(초)")
+    parser.add_argument("--events", type=int, default=20, help="fanout: broadcast할 이벤트 수")
+    parser.add_argument("--payload-bytes", type=int, default=2048, help="fanout: 이벤트 본문 크기")
+    parser.add_argument("--scenarios", default="idle,fanout", help="실행할 시나리오 (쉼표 구분)")
+    args = parser.parse_args()
+
+    scenarios = args.scenarios.split(",")
+    for connections in (int(c) for c in args.connections.split(",")):
+        if "idle" in scenarios:
+            # event: 현재 구현, poll: 기존 1초 폴링
+            for mode in ("event", "poll"):
+                print(json.dumps(asyncio.run(bench(mode, connections, args.idle))))
+        if "fanout" in scenarios:
+            # topic: publish 한 번 직렬화, per_client: 구독자별 send_event + 직렬화
+            for mode in ("topic", "per_client"):
+                result = bench_fanout(mode, connections, args.events, args.payload_bytes)
+                print(json.dumps(asyncio.run(result)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+가짜 CLI - 실제 구독 없이 executor 경로를 측정하기 위한 claude/codex/gemini/qwen 대역
+
+동작은 환경 변수로 설정 (모델별 값 FAKE_CLI_<MODEL>_<KEY>가 공통 값 FAKE_CLI_<KEY>보다 우선):
+- LATENCY: 전체 응답 시간(초)
+- OUTPUT_BYTES: 출력 크기 (코드 블록 하나 포함)
+- EXIT_CODE: 종료 코드 (0이 아니면 stderr에 에러 출력)
+- CHUNKS: 출력을 나눠 쓸 횟수 (LATENCY 동안 균등 간격으로 스트리밍)
+"""
+
+import os
+import sys
+import time
+
+_CODE_BLOCK = "```python\ndef fix():\n    return 42\n```\n"
+
+
+def _setting(model: str, key: str, default: str) -> str:
+    fallback = os.environ.get(f"FAKE_CLI_{key}", default)
+    return os.environ.get(f"FAKE_CLI_{model.upper()}_{key}", fallback)
+
+
+def make_output(size: int) -> str:
+    """설명 텍스트 + 코드 블록으로 이루어진 size 바이트 출력"""
+    filler = max(0, size - len(_CODE_BLOCK))
+    line = "Explanation of the generated fix.\n"
+    text = (line * (filler // len(line) + 1))[:filler]
+    return text + _CODE_BLOCK
+
+
+def main(model: str):
+    if "--version" in sys.argv[1:]:
+        print(f"{model} 0.0.0-fake")
+        return
+
+    latency = float(_setting(model, "LATENCY", "0.05"))
+    output_bytes = int(_setting(model, "OUTPUT_BYTES", "2048"))
+    exit_code = int(_setting(model, "EXIT_CODE", "0"))
+    chunks = max(1, int(_setting(model, "CHUNKS", "1")))
+
+    # stdin 방식(claude)이면 prompt를 끝까지 읽음
+    if not sys.stdin.isatty():
+        sys.stdin.read()
+
+    if exit_code != 0:
+        time.sleep(latency)
+        sys.stderr.write(f"{model}: simulated failure\n")
+        sys.exit(exit_code)
+
+    output = make_output(output_bytes)
+    step = -(-len(output) // chunks)
+    for index in range(chunks):
+        time.sleep(latency / chunks)
+        sys.stdout.write(output[index * step:(index + 1) * step])
+        sys.stdout.flush()
+
+
+def install(directory: str, models=("claude", "codex", "gemini", "qwen")) -> str:
+    """directory에 모델별 가짜 실행 파일 생성 - PATH 앞에 추가해 사용"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    os.makedirs(directory, exist_ok=True)
+    for model in models:
+        path = os.path.join(directory, model)
+        with open(path, "w") as f:
+            f.write(
+                f"#!{sys.executable}\n"
+                "import sys\n"
+                f"sys.path.insert(0, {root!r})\n"
+                "from benchmarks.fake_cli import main\n"
+                f"main({model!r})\n"
+            )
+        os.chmod(path, 0o755)
+    return directory
@@ -78,6 +78,25 @@ class TestAIResolveEndpoint:
             assert data["success"] is True
             assert data["model_used"] == "claude"
 
+    def test_session_key_scoped_to_user_and_repo(self):
+        """세션 키에 요청자와 저장소를 포함해 같은 이슈 번호끼리 세션을 공유하지 않음"""
+        with patch("backend.src.main.CLIExecutor") as MockExecutor:
+            MockExecutor.return_value.generate_code = AsyncMock(return_value={
+                "success": True, "output": "ok", "model": "claude"
+            })
+
+            response = client.post("/api/ai/resolve", headers={"X-Session-Id": "alice"}, json={
+                "model": "claude",
+                "issue_id": 7,
+                "issue_title": "Test",
+                "repo": "owner/name",
+                "reuse_session": True,
+            })
+
+            assert response.status_code == 200
+            key = MockExecutor.call_args.kwargs["session_key"]
+            assert key == "session:alice:owner/name:issue:7"
+
     def test_resolve_invalid_model(self):
         """API-05: 잘못된 모델 요청"""
         with patch("backend.src.main.CLIExecutor") as MockExecutor:
@@ -119,3 +138,272 @@ class TestAIResolveWithFallbackEndpoint:
             data = response.json()
             assert data["success"] is True
             assert data["model_used"] == "codex"
+
+    def test_resolve_with_fallback_hedge_option(self):
+        """API-07: 헤지 옵션 전달 및 절약 시간 응답"""
+        with patch("backend.src.main.execute_with_fallback", new_callable=AsyncMock) as mock_fallback:
+            mock_fallback.return_value = {
+                "success": True,
+                "code": "",
+                "output": "Fixed with hedge",
+                "model_used": "gemini",
+                "hedge_saved_seconds": 12.5,
+            }
+
+            response = client.post("/api/ai/resolve-with-fallback", json={
+                "model": "claude",
+                "issue_id": 1,
+                "issue_title": "Fix bug",
+                "hedge": True,
+                "hedge_delay": 2.0,
+            })
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["model_used"] == "gemini"
+            assert data["hedge_saved_seconds"] == 12.5
+            kwargs = mock_fallback.call_args.kwargs
+            assert kwargs["hedge"] is True
+            assert kwargs["hedge_delay"] == 2.0
+
+
+class TestAIResolveStreamEndpoint:
+    """AI 해결 SSE 스트리밍 API 테스트"""
+
+    def test_resolve_stream_events(self):
+        """API-08: 텍스트/코드 블록/진행/결과 이벤트 스트리밍"""
+        import json
+
+        async def fake_stream(prompt):
+            for line in ["Fixing the bug\n", "```python\n", "def fix(): pass\n", "```\n", "Done\n"]:
+                yield line
+
+        with patch("backend.src.main.CLIExecutor") as MockExecutor:
+            MockExecutor.return_value.stream_output = fake_stream
+
+            response = client.post("/api/ai/resolve/stream", json={
+                "model": "claude",
+                "issue_id": 1,
+                "issue_title": "Fix bug"
+            })
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = []
+        for frame in response.text.split("\n\n"):
+            lines = frame.strip().splitlines()
+            if not lines:
+                continue
+            event_type = lines[0].split(": ", 1)[1] if lines[0].startswith("event:") else "message"
+            data = json.loads(lines[-1].split("data: ", 1)[1])
+            events.append((event_type, data))
+
+        types = [event_type for event_type, _ in events]
+        assert types[0] == "progress"
+        assert types.count("chunk") == 5
+        assert types[-1] == "result"
+        code_blocks = [data for event_type, data in events if event_type == "code_block"]
+        assert code_blocks == [{"language": "python", "code": "def fix(): pass"}]
+        # 코드 블록은 닫는 fence 직후, 최종 결과보다 먼저 도착
+        assert types.index("code_block") < types.index("result")
+        assert events[-1][1]["code"] == "def fix(): pass"
+
+
+class TestSchedulerEndpoints:
+    """스케줄러 API 테스트"""
+
+    def test_resolve_rejected_with_retry_after(self):
+        """API-09: 대기열 초과 시 429 + Retry-After"""
+        from backend.src.cli.scheduler import SchedulerRejectedError
+
+        with patch("backend.src.main.CLIExecutor") as MockExecutor:
+            MockExecutor.return_value.generate_code = AsyncMock(
+                side_effect=SchedulerRejectedError("claude queue is full", 429, 7)
+            )
+
+            response = client.post("/api/ai/resolve", json={
+                "model": "claude",
+                "issue_id": 1,
+                "issue_title": "Fix bug"
+            })
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "7"
+
+    def test_update_limits_at_runtime(self):
+        """API-10: 실행 중 제한 변경"""
+        from backend.src.main import cli_scheduler
+
+        previous = cli_scheduler.limits_for("gemini")
+        try:
+            response = client.put("/api/scheduler/limits/gemini", json={"max_concurrent": 3})
+            assert response.status_code == 200
+            assert response.json()["limits"]["max_concurrent"] == 3
+
+            stats = client.get("/api/scheduler").json()
+            assert stats["models"]["gemini"]["limits"]["max_concurrent"] == 3
+
+            response = client.put("/api/scheduler/limits/gemini", json={"max_concurrent": 0})
+            assert response.status_code == 400
+        finally:
+            # 전역 스케줄러이므로 다른 테스트에 영향이 없도록 원래 제한으로 복구
+            cli_scheduler.set_limits("gemini", **previous.to_dict())
+
+
+class TestCLILogEndpoint:
+    """잘린 CLI 출력 로그 조회 테스트"""
+
+    @pytest.fixture
+    def log_id(self, tmp_path, monkeypatch):
+        from backend.src.cli.capture import CaptureStore
+
+        store = CaptureStore(directory=str(tmp_path), head_bytes=2, tail_bytes=2)
+        log_id, capture = store.create()
+        capture.write(b"0123456789")
+        store.register(log_id, capture)
+        monkeypatch.setattr("backend.src.main.cli_logs", store)
+        return log_id
+
+    def test_content_range_uses_served_start(self, log_id):
+        """API-15: 음수 start는 0으로 맞추고 Content-Range도 실제로 보낸 범위"""
+        response = client.get(f"/api/cli/logs/{log_id}", params={"start": -5, "end": 4})
+        assert response.status_code == 200
+        assert response.content == b"0123"
+        assert response.headers["content-range"] == "bytes 0-3/10"
+
+    def test_start_past_end_is_416(self, log_id):
+        """API-16: start가 파일 끝을 넘으면 416"""
+        response = client.get(f"/api/cli/logs/{log_id}", params={"start": 10})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */10"
+
+
+class TestAIBatchResolveEndpoint:
+    """배치 해결 API 테스트"""
+
+    @staticmethod
+    def _parse_sse(text):
+        import json
+
+        events = []
+        for frame in text.split("\n\n"):
+            lines = frame.strip().splitlines()
+            if not lines:
+                continue
+            event_type = lines[0].split(": ", 1)[1]
+            events.append((event_type, json.loads(lines[-1].split("data: ", 1)[1])))
+        return events
+
+    def test_batch_streams_items_and_summary(self):
+        """API-11: 동시 실행 제한 하에 항목별 결과와 요약 스트리밍"""
+        import asyncio
+        from backend.src.cli.executor import CLIExecutionError
+
+        running = 0
+        peak = 0
+
+        async def fake_generate(prompt, use_cache=True, context=""):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if "broken" in prompt:
+                raise CLIExecutionError("CLI crashed")
+            return {"success": True, "code": "", "output": prompt}
+
+        with patch("backend.src.main.CLIExecutor") as MockExecutor:
+            MockExecutor.return_value.generate_code = fake_generate
+
+            response = client.post("/api/ai/resolve/batch", json={
+                "items": [
+                    {"issue_id": i, "issue_title": "broken" if i == 2 else f"bug {i}"}
+                    for i in range(5)
+                ],
+                "max_concurrency": 2,
+            })
+
+        assert response.status_code == 200
+        events = self._parse_sse(response.text)
+        assert events[0][0] == "batch"
+        assert events[-1][0] == "summary"
+
+        items = [data for event_type, data in events if event_type == "item"]
+        assert sorted(item["index"] for item in items) == [0, 1, 2, 3, 4]
+        failed = [item for item in items if item["status"] == "failed"]
+        assert [item["issue_id"] for item in failed] == [2]
+        assert failed[0]["detail"] == "CLI crashed"
+
+        summary = events[-1][1]
+        assert summary["succeeded"] == 4
+        assert summary["failed"] == 1
+        assert summary["elapsed_seconds"] > 0
+        assert peak <= 2
+
+    def test_batch_ndjson_format(self):
+        """API-12: NDJSON 형식 스트리밍 및 없는 배치 취소"""
+        import json
+
+        with patch("backend.src.main.CLIExecutor") as MockExecutor:
+            MockExecutor.return_value.generate_code = AsyncMock(
+                return_value={"success": True, "code": "x = 1", "output": "done"}
+            )
+
+            response = client.post("/api/ai/resolve/batch", json={
+                "items": [{"issue_id": 1, "issue_title": "Fix bug"}],
+                "format": "ndjson",
+            })
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["event"] for line in lines] == ["batch", "item", "summary"]
+        assert lines[1]["code"] == "x = 1"
+
+        response = client.delete(f"/api/ai/resolve/batch/{lines[0]['batch_id']}")
+        assert response.status_code == 404
+
+
+class TestJobEndpoints:
+    """백그라운드 작업 API 테스트"""
+
+    def test_create_get_and_cancel_job(self):
+        """API-13: 작업 등록 즉시 job id 반환, 조회, 취소"""
+        response = client.post("/api/jobs", json={
+            "model": "claude",
+            "issue_id": 7,
+            "issue_title": "Fix bug"
+        })
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        data = client.get(f"/api/jobs/{job_id}").json()
+        assert data["status"] == "queued"
+        assert data["metadata"] == {"issue_id": 7, "model": "claude"}
+
+        response = client.delete(f"/api/jobs/{job_id}")
+        assert response.json()["cancelled"] is True
+        assert client.get(f"/api/jobs/{job_id}").json()["status"] == "cancelled"
+
+        assert client.get("/api/jobs/unknown").status_code == 404
+
+
+class TestFairQueueUser:
+    """사용자별 공정 대기열 키 테스트"""
+
+    def test_session_header_identifies_user(self):
+        """API-14: X-Session-Id 헤더로 사용자 대기열 구분"""
+        with patch("backend.src.main.CLIExecutor") as MockExecutor:
+            MockExecutor.return_value.generate_code = AsyncMock(
+                return_value={"success": True, "code": "", "output": "ok"}
+            )
+
+            response = client.post(
+                "/api/ai/resolve",
+                json={"model": "claude", "issue_id": 1, "issue_title": "Fix bug"},
+                headers={"X-Session-Id": "tab-1"},
+            )
+
+        assert response.status_code == 200
+        assert MockExecutor.call_args.kwargs["user"] == "session:tab-1"
+        assert "users" in client.get("/api/cli/fairness").json()
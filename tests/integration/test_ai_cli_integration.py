@@ -131,12 +131,11 @@ class TestCLIStreaming:
         with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
             mock_process = AsyncMock()
 
-            async def mock_readline():
-                lines = [b"Line 1\n", b"Line 2\n", b"Line 3\n", b""]
-                for line in lines:
-                    yield line
-
-            mock_process.stdout.__aiter__ = lambda self: mock_readline()
+            # stdout은 조각 단위로 읽고 stderr도 함께 비움
+            mock_process.stdout.read = AsyncMock(
+                side_effect=[b"Line 1\n", b"Line 2\n", b"Line 3\n", b""]
+            )
+            mock_process.stderr.read = AsyncMock(return_value=b"")
             mock_process.returncode = 0
 
             # stdin methods: write/close are sync, drain is async
@@ -99,3 +99,307 @@ class TestSSEConnection:
 
         # Cleanup
         await manager.disconnect(client_id)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_wakes_idle_stream(self):
+        """RT-I04: 유휴 구독 루프는 연결 해제 즉시 종료 (폴링 없음)"""
+        # Arrange
+        from backend.src.realtime.sse_server import SSEManager
+
+        manager = SSEManager()
+        client_id = "client-123"
+        await manager.connect(client_id)
+        received = []
+
+        async def collect_events():
+            async for event in manager.stream_events(client_id):
+                received.append(event)
+
+        task = asyncio.create_task(collect_events())
+        await manager.send_event(client_id, {"step": 0})
+        await asyncio.sleep(0.01)
+
+        # Act
+        started = asyncio.get_running_loop().time()
+        await manager.disconnect(client_id)
+        await asyncio.wait_for(task, timeout=1.0)
+        elapsed = asyncio.get_running_loop().time() - started
+
+        # Assert
+        assert received == [{"step": 0}]
+        assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_reconnect_closes_previous_stream(self):
+        """RT-I05: 같은 client_id로 다시 연결하면 이전 구독 루프 종료"""
+        # Arrange
+        from backend.src.realtime.sse_server import SSEManager
+
+        manager = SSEManager()
+        client_id = "client-123"
+        await manager.connect(client_id)
+
+        async def drain():
+            return [event async for event in manager.stream_events(client_id)]
+
+        old_stream = asyncio.create_task(drain())
+        await asyncio.sleep(0)
+
+        # Act
+        await manager.connect(client_id)
+
+        # Assert
+        assert await asyncio.wait_for(old_stream, timeout=1.0) == []
+        assert manager.active_connections[client_id].is_connected is True
+
+        # Cleanup
+        await manager.disconnect(client_id)
+
+
+class TestSSETopics:
+    """토픽 구독/publish 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_publish_serializes_once_for_all_subscribers(self):
+        """RT-I06: 토픽 publish는 프레임을 한 번만 직렬화해 구독자 전체에 같은 bytes 전달"""
+        # Arrange
+        from backend.src.realtime import sse_server
+        from backend.src.realtime.sse_server import SSEManager
+
+        manager = SSEManager()
+        for i in range(3):
+            await manager.connect(f"viewer-{i}")
+            manager.subscribe(f"viewer-{i}", "issue:42")
+        await manager.connect("other")
+        manager.subscribe("other", "issue:7")
+
+        # Act
+        with patch.object(
+            sse_server, "create_sse_event", wraps=sse_server.create_sse_event
+        ) as encode:
+            delivered = manager.publish("issue:42", {"state": "closed"}, "issue")
+
+        frames = []
+        for i in range(3):
+            async for frame in manager.stream_frames(f"viewer-{i}"):
+                frames.append(frame)
+                break
+
+        # Assert
+        assert delivered == 3
+        assert encode.call_count == 1
+        assert all(frame is frames[0] for frame in frames)
+        assert frames[0].payload == (
+            f'id: {frames[0].event_id}\nevent: issue\ndata: {{"state": "closed"}}\n\n'.encode()
+        )
+        assert manager.active_connections["other"].queued == 0
+
+        # 연결 해제 시 토픽 구독도 해제
+        await manager.disconnect("viewer-0")
+        assert manager.publish("issue:42", {"state": "open"}) == 2
+        assert manager.stats()["subscriptions"] == 3
+
+
+async def _drain(manager, client_id):
+    """대기 중인 프레임 전부 꺼내기"""
+    conn = manager.active_connections[client_id]
+    frames = []
+    while conn.stats()["pending"]:
+        frames.append(await conn.get())
+    return frames
+
+
+class TestSSEBackpressure:
+    """연결별 대기열 한도/overflow 정책 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_and_drop_newest(self):
+        """RT-I07: 가득 찬 대기열 - drop_oldest는 오래된 것, drop_newest는 새 것을 버림"""
+        # Arrange
+        from backend.src.realtime.sse_server import DROP_NEWEST, SSEManager
+
+        manager = SSEManager(max_queue=3)
+        oldest = await manager.connect("oldest")
+        newest = await manager.connect("newest", overflow=DROP_NEWEST)
+        manager.subscribe("oldest", "repo:a/b")
+        manager.subscribe("newest", "repo:a/b")
+
+        # Act
+        for i in range(5):
+            manager.publish("repo:a/b", {"seq": i})
+
+        # Assert
+        assert [f.data["seq"] for f in await _drain(manager, "oldest")] == [2, 3, 4]
+        assert [f.data["seq"] for f in await _drain(manager, "newest")] == [0, 1, 2]
+        assert oldest.dropped == 2 and newest.dropped == 2
+        assert oldest.buffered_bytes == 0
+        stats = manager.stats()
+        assert stats["dropped"] == 4
+        assert stats["delivered"] == 8
+
+    @pytest.mark.asyncio
+    async def test_coalesce_keeps_latest_job_state(self):
+        """RT-I08: coalesce는 같은 작업의 대기 중인 이벤트를 최신 상태로 교체"""
+        # Arrange
+        from backend.src.realtime.sse_server import COALESCE, SSEManager
+
+        manager = SSEManager(max_queue=2)
+        conn = await manager.connect("viewer", overflow=COALESCE)
+        manager.subscribe("viewer", "issue:1")
+
+        # Act
+        manager.publish("issue:1", {"job_id": "a", "status": "queued"}, "job")
+        manager.publish("issue:1", {"job_id": "b", "status": "queued"}, "job")
+        manager.publish("issue:1", {"job_id": "a", "status": "running"}, "job")
+        manager.publish("issue:1", {"job_id": "a", "status": "succeeded"}, "job")
+        bytes_before = conn.buffered_bytes
+
+        # Assert
+        frames = await _drain(manager, "viewer")
+        assert [(f.data["job_id"], f.data["status"]) for f in frames] == [
+            ("a", "succeeded"), ("b", "queued"),
+        ]
+        assert bytes_before == sum(len(f.payload) for f in frames)
+        assert conn.coalesced == 2 and conn.dropped == 0
+
+        # 키가 없는 이벤트는 drop_oldest로 처리
+        manager.publish("issue:1", {"state": "x"})
+        manager.publish("issue:1", {"state": "y"})
+        manager.publish("issue:1", {"state": "z"})
+        assert conn.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_ends_slow_stream(self):
+        """RT-I09: disconnect 정책은 느린 연결을 끊고 대기 중인 이벤트를 해제"""
+        # Arrange
+        from backend.src.realtime.sse_server import DISCONNECT, SSEManager
+
+        manager = SSEManager(max_queue=2, overflow=DISCONNECT)
+        conn = await manager.connect("slow")
+        manager.subscribe("slow", "issue:1")
+        received = []
+
+        async def consume():
+            async for data in manager.stream_events("slow"):
+                received.append(data)
+
+        # Act
+        for i in range(3):
+            manager.publish("issue:1", {"seq": i})
+        await asyncio.wait_for(consume(), timeout=1.0)
+
+        # Assert
+        assert received == []
+        assert conn.overflowed is True
+        assert conn.buffered_bytes == 0
+        assert manager.publish("issue:1", {"seq": 3}) == 0
+        stats = manager.stats()
+        assert stats["overflow_disconnects"] == 1
+        assert stats["dropped"] == 3
+
+
+class TestSSEReplay:
+    """Last-Event-ID 재개 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_only_missed_events(self):
+        """RT-I10: 재연결 시 Last-Event-ID 이후 이벤트만 id 순서대로 재전송"""
+        # Arrange
+        from backend.src.realtime.sse_server import SSEManager
+
+        manager = SSEManager()
+        await manager.connect("viewer")
+        manager.resume("viewer", ["issue:1", "repo:a/b"])
+        manager.publish("issue:1", {"seq": 0})
+        seen = (await _drain(manager, "viewer"))[-1].event_id
+        await manager.disconnect("viewer")
+
+        # 재연결 중에 publish된 이벤트 (다른 토픽 포함)
+        manager.publish("issue:1", {"seq": 1})
+        manager.publish("issue:2", {"seq": 2})
+        manager.publish("repo:a/b", {"seq": 3})
+
+        # Act
+        await manager.connect("viewer")
+        replayed = manager.resume("viewer", ["issue:1", "repo:a/b"], str(seen))
+        manager.publish("issue:1", {"seq": 4})
+
+        # Assert
+        frames = await _drain(manager, "viewer")
+        assert replayed == 2
+        assert [f.data["seq"] for f in frames] == [1, 3, 4]
+        ids = [f.event_id for f in frames]
+        assert ids == sorted(ids) and ids[0] > seen
+        assert frames[0].payload.startswith(f"id: {ids[0]}\n".encode())
+        assert manager.stats()["replayed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_evicted_id_falls_back_to_resync(self):
+        """RT-I11: 놓친 이벤트가 링 버퍼에서 밀려났으면 resync 이벤트"""
+        # Arrange
+        from backend.src.realtime.sse_server import RESYNC_EVENT, SSEManager
+
+        manager = SSEManager(replay_size=2)
+        manager.publish("issue:1", {"seq": 0})
+        first = manager.stats()["last_event_id"]
+        for i in range(1, 4):
+            manager.publish("issue:1", {"seq": i})
+
+        # Act
+        await manager.connect("viewer")
+        replayed = manager.resume("viewer", ["issue:1"], str(first))
+
+        # Assert
+        frames = await _drain(manager, "viewer")
+        assert replayed is None
+        assert [f.event_type for f in frames] == [RESYNC_EVENT]
+        assert frames[0].event_id == manager.stats()["last_event_id"]
+        assert manager.stats()["resyncs"] == 1
+
+        # resync 이후 id에서는 정상 재개 (남은 이벤트 없음)
+        await manager.connect("viewer")
+        assert manager.resume("viewer", ["issue:1"], str(frames[0].event_id)) == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_ids_resync(self):
+        """RT-I12: 재시작 전 id/형식이 틀린 id/제거된 토픽은 resync"""
+        # Arrange
+        from backend.src.realtime.sse_server import SSEManager
+
+        manager = SSEManager(max_topics=1)
+        manager.publish("issue:1", {"seq": 0})
+        seen = manager.stats()["last_event_id"]
+        manager.publish("issue:1", {"seq": 1})
+        # issue:1 링 버퍼는 토픽 한도 때문에 제거됨
+        manager.publish("issue:2", {"seq": 2})
+        await manager.connect("viewer")
+
+        # Act / Assert
+        assert manager.resume("viewer", ["issue:1"], "1") is None
+        assert manager.resume("viewer", ["issue:1"], "not-a-number") is None
+        assert manager.resume("viewer", ["issue:1"], str(seen)) is None
+        assert manager.resume("viewer", ["issue:2"], str(seen)) == 1
+        assert manager.stats()["replay_topics"] == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_buffer_capped_by_bytes(self):
+        """RT-I13: 링 버퍼 전체 크기가 replay_bytes를 넘으면 오래된 토픽부터 제거"""
+        # Arrange
+        from backend.src.realtime.sse_server import SSEManager
+
+        manager = SSEManager(replay_bytes=4096)
+        big = "x" * 1000
+
+        # Act
+        for i in range(20):
+            manager.publish(f"job:{i}", {"output": big})
+        for i in range(10):
+            manager.publish("job:hot", {"seq": i, "output": big})
+
+        # Assert
+        stats = manager.stats()
+        assert 0 < stats["replay_bytes"] <= 4096
+        assert stats["replay_topics"] == 1
+        assert 0 < stats["replay_frames"] < 10
+        await manager.connect("viewer")
+        assert manager.resume("viewer", ["job:0"], str(manager._id_base + 1)) is None
@@ -71,6 +71,68 @@ class TestCLIAvailability:
         assert is_available is True
 
 
+class TestCLIRegistry:
+    """CLI 레지스트리 (비동기 probe + TTL 캐시) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_registry_probes_concurrently_and_records_version(self):
+        """설치된 CLI는 버전과 함께, 없는 CLI는 unavailable로 기록"""
+        # Arrange
+        import os
+        import sys
+        from backend.src.cli.registry import CLIRegistry
+
+        python_name = os.path.basename(sys.executable)
+        registry = CLIRegistry(names=[python_name, "no-such-cli-xyz"])
+
+        # Act
+        statuses = await registry.get_all()
+
+        # Assert
+        assert statuses[python_name].available is True
+        assert statuses[python_name].version.startswith("Python")
+        assert statuses["no-such-cli-xyz"].available is False
+
+    @pytest.mark.asyncio
+    async def test_registry_serves_cached_status(self):
+        """TTL 안에서는 다시 probe하지 않음"""
+        # Arrange
+        import time
+        from backend.src.cli.registry import CLIRegistry, CLIStatus
+
+        registry = CLIRegistry(names=["claude"], ttl=60)
+
+        async def fake_probe(name):
+            return CLIStatus(name=name, available=True, version="1.0", checked_at=time.monotonic())
+
+        with patch.object(registry, "probe", side_effect=fake_probe) as mock_probe:
+            # Act
+            await registry.get_all()
+            await registry.get_all()
+            status = await registry.get("claude")
+
+        # Assert
+        assert mock_probe.call_count == 1
+        assert status.version == "1.0"
+
+    @pytest.mark.asyncio
+    async def test_executor_skips_spawn_for_missing_cli(self):
+        """레지스트리가 미설치로 기록한 CLI는 spawn 없이 실패"""
+        # Arrange
+        from backend.src.cli.executor import CLIExecutor, CLIExecutionError
+        from backend.src.cli.registry import CLIRegistry, CLIStatus
+
+        registry = CLIRegistry(names=["codex"])
+        registry._statuses["codex"] = CLIStatus(name="codex", available=False)
+        executor = CLIExecutor(model="codex", registry=registry)
+
+        # Act & Assert
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            with pytest.raises(CLIExecutionError):
+                await executor.generate_code("Fix the bug")
+            mock_exec.assert_not_called()
+
+
 class TestCLIParsing:
     """CLI 명령어/출력 파싱 테스트"""
 
@@ -116,6 +178,79 @@ I've fixed the token validation by adding expiry check.
         assert "explanation" in parsed
 
 
+class TestIncrementalFenceParser:
+    """청크 단위 fence 파서 테스트"""
+
+    def test_matches_regex_parser_on_chunked_input(self):
+        """임의로 나눈 청크 입력도 기존 정규식 결과와 동일"""
+        # Arrange
+        import random
+        import re
+        from backend.src.cli.parser import IncrementalFenceParser
+
+        pattern = r"```(\w+)?\n([\s\S]*?)```"
+        pieces = ["`", "```", "````", "\n", "py", " ", "x", "~~~", "_"]
+        rng = random.Random(7)
+
+        for _ in range(2000):
+            raw = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 30)))
+            expected_blocks = [
+                {"language": m.group(1) or "text", "code": m.group(2).strip()}
+                for m in re.finditer(pattern, raw)
+            ]
+
+            # Act
+            parser = IncrementalFenceParser()
+            position = 0
+            while position < len(raw):
+                size = rng.randint(1, 4)
+                parser.feed(raw[position:position + size])
+                position += size
+            result = parser.close()
+
+            # Assert
+            assert result["code_blocks"] == expected_blocks, raw
+            assert result["explanation"] == re.sub(pattern, "", raw).strip(), raw
+
+    def test_block_emitted_when_closing_fence_arrives(self):
+        """닫는 fence 도착 즉시 코드 블록 반환"""
+        # Arrange
+        from backend.src.cli.parser import IncrementalFenceParser
+
+        parser = IncrementalFenceParser()
+
+        # Act & Assert
+        assert parser.feed("Here is the fix:\n```pyth") == []
+        assert parser.feed("on\nprint('hi')\n`") == []
+        assert parser.feed("``\nDone.") == [{"language": "python", "code": "print('hi')"}]
+        assert parser.explanation() == "Here is the fix:\n\nDone."
+
+    def test_markdown_mode_tilde_indented_and_nested_fences(self):
+        """markdown 모드: ~~~, 들여쓴 fence, 중첩 fence"""
+        # Arrange
+        from backend.src.cli.parser import IncrementalFenceParser
+
+        raw = (
+            "~~~js\nlet a = 1;\n~~~\n"
+            "- step\n    ```python\n    def f():\n        return 1\n    ```\n"
+            "````md\n```bash\necho hi\n```\n````\n"
+        )
+
+        # Act
+        parser = IncrementalFenceParser(mode="markdown")
+        for char in raw:
+            parser.feed(char)
+        result = parser.close()
+
+        # Assert
+        assert result["code_blocks"] == [
+            {"language": "js", "code": "let a = 1;"},
+            {"language": "python", "code": "def f():\n    return 1"},
+            {"language": "md", "code": "```bash\necho hi\n```"},
+        ]
+        assert result["explanation"] == "- step"
+
+
 class TestCLIExecution:
     """CLI 실행 테스트"""
 
@@ -153,3 +288,54 @@ class TestCLIExecution:
         # Assert
         assert result["success"] is True
         assert result["model_used"] == "codex"
+
+    @pytest.mark.asyncio
+    async def test_cli_hedged_fallback(self):
+        """헤지 실행 - 느린 모델을 기다리지 않고 다음 모델 결과 사용"""
+        # Arrange
+        import asyncio
+        from backend.src.cli.executor import execute_with_fallback, CLIExecutor
+
+        cancelled = []
+
+        async def fake_generate(self, prompt):
+            if self.model == "claude":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(self.model)
+                    raise
+            await asyncio.sleep(0.05)
+            return {"success": True, "code": "", "output": "ok", "model": self.model}
+
+        # Act
+        with patch.object(CLIExecutor, "generate_code", new=fake_generate):
+            result = await execute_with_fallback(
+                "Fix the bug", ["claude", "codex"], hedge=True, hedge_delay=0.05
+            )
+
+        # Assert
+        assert result["model_used"] == "codex"
+        assert result["hedged"] is True
+        assert result["models_launched"] == ["claude", "codex"]
+        assert result["hedge_saved_seconds"] > 0
+        assert cancelled == ["claude"]
+
+    @pytest.mark.asyncio
+    async def test_cli_hedged_fallback_on_failure(self):
+        """헤지 실행 - 실패한 모델은 지연 없이 다음 모델로 넘어감"""
+        # Arrange
+        from backend.src.cli.executor import execute_with_fallback, CLIExecutor
+
+        with patch.object(CLIExecutor, "generate_code", new_callable=AsyncMock) as mock_generate:
+            mock_generate.side_effect = [
+                Exception("Claude unavailable"),
+                {"success": True, "code": "Fixed", "output": "Fixed", "model": "codex"},
+            ]
+            result = await execute_with_fallback(
+                "Fix the bug", ["claude", "codex"], hedge=True, hedge_delay=30
+            )
+
+        # Assert
+        assert result["model_used"] == "codex"
+        assert result["hedged"] is True
@@ -0,0 +1,132 @@
+"""
+CLI 실행 리소스 사용량 집계 단위 테스트
+"""
+
+import os
+import sys
+
+import pytest
+
+linux_only = pytest.mark.skipif(not os.path.isdir("/proc"), reason="/proc 샘플링은 Linux 전용")
+
+# CPU를 쓰고 메모리를 잡은 뒤 출력하는 스크립트
+_BUSY_SCRIPT = (
+    "import sys, time;"
+    "data = bytearray(32 * 1024 * 1024);"
+    "end = time.process_time() + 0.5;"
+    "x = 0\n"
+    "while time.process_time() < end: x += 1\n"
+    "sys.stdout.write('```python\\nx = 1\\n```\\n');"
+    "sys.stderr.write('warn')"
+)
+
+
+def _executor(script, **kwargs):
+    from backend.src.cli.executor import CLIExecutor
+
+    executor = CLIExecutor(model="claude", **kwargs)
+    executor._cli_configs["claude"] = {
+        "cmd": sys.executable, "args": ["-c", script], "use_stdin": True,
+    }
+    return executor
+
+
+class TestUsageAccounting:
+    """실행별 사용량 기록/집계 테스트"""
+
+    @linux_only
+    @pytest.mark.asyncio
+    async def test_run_reports_cpu_memory_and_bytes(self):
+        """실행 결과에 CPU 시간/최대 RSS/출력 크기/종료 코드 첨부"""
+        from backend.src.cli.accounting import UsageAccounting
+
+        accounting = UsageAccounting()
+        executor = _executor(_BUSY_SCRIPT, accounting=accounting, endpoint="resolve")
+        result = await executor.generate_code("hello")
+
+        usage = result["usage"]
+        assert usage["exit_status"] == 0
+        assert usage["cpu_seconds"] >= 0.2
+        assert usage["max_rss_bytes"] >= 32 * 1024 * 1024
+        assert usage["stdout_bytes"] == len("```python\nx = 1\n```\n")
+        assert usage["stderr_bytes"] == len("warn")
+        assert usage["wall_seconds"] >= usage["cpu_seconds"] * 0.5
+
+        stats = accounting.stats()
+        assert stats["models"]["claude"]["runs"] == 1
+        assert stats["endpoints"]["resolve"]["cpu_seconds_total"] == usage["cpu_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_failed_run_is_recorded(self):
+        """실패한 실행도 종료 코드와 함께 집계"""
+        from backend.src.cli.accounting import UsageAccounting
+        from backend.src.cli.executor import CLIExecutionError
+
+        accounting = UsageAccounting()
+        executor = _executor("import sys; sys.exit(3)", accounting=accounting, endpoint="jobs")
+        with pytest.raises(CLIExecutionError):
+            await executor.generate_code("hello")
+
+        stats = accounting.stats()["endpoints"]["jobs"]
+        assert stats["runs"] == 1
+        assert stats["failures"] == 1
+        assert stats["exit_statuses"] == {"3": 1}
+
+    def test_aggregates_per_model_and_endpoint(self):
+        """모델별/엔드포인트별로 따로 집계"""
+        from backend.src.cli.accounting import ExecutionUsage, UsageAccounting
+
+        accounting = UsageAccounting()
+        accounting.record(ExecutionUsage("claude", "resolve", 2.0, 1.0, 0.5, 100, 10, 0, 0))
+        accounting.record(ExecutionUsage("claude", "jobs", 4.0, 2.0, 0.5, 300, 20, 5, 0))
+        accounting.record(ExecutionUsage("gemini", "resolve", 1.0, 0.2, 0.1, 50, 5, 0, 1))
+
+        stats = accounting.stats()
+        assert stats["models"]["claude"]["runs"] == 2
+        assert stats["models"]["claude"]["cpu_seconds_total"] == 4.0
+        assert stats["models"]["claude"]["max_rss_bytes_peak"] == 300
+        assert stats["endpoints"]["resolve"]["runs"] == 2
+        assert stats["endpoints"]["resolve"]["failures"] == 1
+        assert stats["endpoints"]["jobs"]["stderr_bytes_total"] == 5
+
+    @linux_only
+    def test_read_process_usage_self(self):
+        """/proc에서 현재 프로세스 사용량 조회"""
+        from backend.src.cli.accounting import read_process_usage
+
+        usage = read_process_usage(os.getpid())
+        assert usage["processes"] == 1
+        assert usage["rss_bytes"] > 0
+        assert usage["cpu_seconds"] == pytest.approx(
+            usage["cpu_user_seconds"] + usage["cpu_system_seconds"], abs=0.002
+        )
+
+    @linux_only
+    def test_group_sampler_rescans_rarely(self):
+        """그룹 샘플링은 rescan_interval마다만 /proc 전체를 훑고 그 사이에는 알고 있는 pid만 읽음"""
+        import subprocess
+
+        from backend.src.cli.accounting import UsageSampler, read_process_groups_usage
+
+        script = (
+            "import subprocess, sys, time;"
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']);"
+            "print('ready', flush=True);"
+            "time.sleep(30)"
+        )
+        process = subprocess.Popen(
+            [sys.executable, "-c", script], stdout=subprocess.PIPE, start_new_session=True
+        )
+        try:
+            process.stdout.readline()
+            sampler = UsageSampler(process.pid, group=True, rescan_interval=60)
+            sampler.sample()
+            sampler.sample()
+            sampler.sample(rescan=False)
+            assert sampler.scans == 1
+            assert sampler.samples == 3
+            assert len(sampler._members) == 2
+            assert read_process_groups_usage([process.pid])[process.pid]["processes"] == 2
+        finally:
+            os.killpg(process.pid, 9)
+            process.wait()
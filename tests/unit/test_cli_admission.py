@@ -0,0 +1,207 @@
+"""
+호스트 부하 기반 실행 허가 단위 테스트
+"""
+
+import os
+
+import pytest
+
+
+def _load(load_per_cpu=0.2, mem_available_ratio=0.5):
+    return {
+        "load1": load_per_cpu,
+        "cpu_count": 1,
+        "load_per_cpu": load_per_cpu,
+        "mem_total_bytes": 100,
+        "mem_available_bytes": int(100 * mem_available_ratio),
+        "mem_available_ratio": mem_available_ratio,
+    }
+
+
+class TestHostAdmission:
+    """delay/reject 임계치 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_admits_when_idle(self, monkeypatch):
+        """부하가 낮으면 바로 허가"""
+        from backend.src.cli import admission as module
+
+        monkeypatch.setattr(module, "read_host_load", lambda: _load())
+        admission = module.HostAdmission()
+        await admission.admit("claude")
+        assert admission.stats()["admitted"] == 1
+        assert admission.stats()["delayed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_past_reject_threshold(self, monkeypatch):
+        """reject 임계치를 넘으면 503 + Retry-After"""
+        from backend.src.cli import admission as module
+        from backend.src.cli.scheduler import SchedulerRejectedError
+
+        monkeypatch.setattr(module, "read_host_load", lambda: _load(mem_available_ratio=0.01))
+        admission = module.HostAdmission()
+        with pytest.raises(SchedulerRejectedError) as exc_info:
+            await admission.admit("claude")
+        assert exc_info.value.status_code == 503
+        assert "mem_available_ratio" in str(exc_info.value)
+        assert admission.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delays_until_load_drops(self, monkeypatch):
+        """delay 임계치 초과 시 부하가 내려갈 때까지 대기"""
+        from backend.src.cli import admission as module
+
+        samples = iter([_load(2.0), _load(2.0), _load(0.5)])
+        monkeypatch.setattr(module, "read_host_load", lambda: next(samples))
+        admission = module.HostAdmission(
+            module.AdmissionThresholds(delay_load_per_cpu=1.5, poll_interval=0.01, max_delay=1.0)
+        )
+        await admission.admit("gemini")
+
+        stats = admission.stats()
+        assert stats["delayed"] == 1
+        assert stats["delay_seconds_total"] > 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_max_delay(self, monkeypatch):
+        """최대 대기 시간 안에 부하가 내려가지 않으면 거부"""
+        from backend.src.cli import admission as module
+        from backend.src.cli.scheduler import SchedulerRejectedError
+
+        monkeypatch.setattr(module, "read_host_load", lambda: _load(2.0))
+        admission = module.HostAdmission(
+            module.AdmissionThresholds(delay_load_per_cpu=1.5, poll_interval=0.01, max_delay=0.05)
+        )
+        with pytest.raises(SchedulerRejectedError):
+            await admission.admit("gemini")
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_one_sample(self, monkeypatch):
+        """대기 중인 요청들은 poll_interval마다 갱신되는 샘플 하나를 공유"""
+        import asyncio
+
+        from backend.src.cli import admission as module
+
+        reads = 0
+
+        def read():
+            nonlocal reads
+            reads += 1
+            return _load(2.0 if reads < 4 else 0.5)
+
+        monkeypatch.setattr(module, "read_host_load", read)
+        admission = module.HostAdmission(
+            module.AdmissionThresholds(delay_load_per_cpu=1.5, poll_interval=0.02, max_delay=5.0)
+        )
+        await asyncio.gather(*(admission.admit("claude") for _ in range(20)))
+
+        assert admission.stats()["delayed"] == 20
+        # 요청마다 /proc을 읽었다면 20 × 3회 이상
+        assert reads <= 5
+
+    @pytest.mark.asyncio
+    async def test_cli_rss_threshold_uses_supervisor(self, monkeypatch):
+        """실행 중인 CLI RSS 합계 임계치"""
+        from backend.src.cli import admission as module
+        from backend.src.cli.scheduler import SchedulerRejectedError
+
+        class FakeSupervisor:
+            def snapshot(self):
+                return [{"rss_bytes": 600}, {"rss_bytes": 500}]
+
+        monkeypatch.setattr(module, "read_host_load", lambda: _load())
+        admission = module.HostAdmission(
+            module.AdmissionThresholds(reject_cli_rss_bytes=1000),
+            supervisor=FakeSupervisor(),
+        )
+        assert (await admission.refresh())["cli_rss_bytes"] == 1100
+        with pytest.raises(SchedulerRejectedError):
+            await admission.admit("claude")
+
+    @pytest.mark.asyncio
+    async def test_sync_sample_never_reads_on_loop(self, monkeypatch):
+        """sample()/overloaded()는 캐시만 보고, /proc 읽기는 스레드 갱신으로 미룸"""
+        import asyncio
+        import threading
+
+        from backend.src.cli import admission as module
+
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def read():
+            threads.append(threading.get_ident())
+            return _load(2.0)
+
+        monkeypatch.setattr(module, "read_host_load", read)
+        admission = module.HostAdmission(module.AdmissionThresholds(delay_load_per_cpu=1.5))
+        assert admission.sample()["load_per_cpu"] is None
+        assert admission.overloaded() is False
+
+        await asyncio.sleep(0.05)
+        assert admission.overloaded() is True
+        assert threads and loop_thread not in threads
+
+    @pytest.mark.skipif(not os.path.isdir("/proc"), reason="/proc은 Linux 전용")
+    def test_read_host_load(self):
+        """/proc에서 실제 부하 조회"""
+        from backend.src.cli.admission import read_host_load
+
+        load = read_host_load()
+        assert load["load_per_cpu"] is not None
+        assert 0 < load["mem_available_ratio"] <= 1
+
+
+class TestExecutorAdmission:
+    """CLIExecutor 허가 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rejected_before_spawn(self, monkeypatch):
+        """거부되면 CLI를 실행하지 않음"""
+        from backend.src.cli import admission as module
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.scheduler import SchedulerRejectedError
+
+        monkeypatch.setattr(module, "read_host_load", lambda: _load(load_per_cpu=10.0))
+        executor = CLIExecutor(model="claude", admission=module.HostAdmission())
+
+        async def fail_spawn(prompt=None):
+            raise AssertionError("must not spawn")
+
+        executor.spawn_process = fail_spawn
+        with pytest.raises(SchedulerRejectedError):
+            await executor.generate_code("hello")
+
+    @pytest.mark.asyncio
+    async def test_waits_for_admission_without_holding_slot(self, monkeypatch):
+        """부하로 대기 중인 요청은 스케줄러 슬롯을 잡지 않음"""
+        import asyncio
+
+        from backend.src.cli import admission as module
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.scheduler import CLIScheduler, ModelLimits
+
+        load = {"value": 2.0}
+        monkeypatch.setattr(module, "read_host_load", lambda: _load(load["value"]))
+        scheduler = CLIScheduler(default_limits=ModelLimits(max_concurrent=1))
+        executor = CLIExecutor(
+            model="claude",
+            scheduler=scheduler,
+            admission=module.HostAdmission(
+                module.AdmissionThresholds(
+                    delay_load_per_cpu=1.5, poll_interval=0.01, max_delay=5.0
+                ),
+                sample_ttl=0.01,
+            ),
+        )
+
+        async def run(prompt):
+            return {"success": True, "output": "", "code_blocks": []}
+
+        executor._run = run
+        task = asyncio.create_task(executor._scheduled_run("hello"))
+        await asyncio.sleep(0.05)
+        assert scheduler._state("claude").running == 0
+
+        load["value"] = 0.5
+        assert (await task)["success"] is True
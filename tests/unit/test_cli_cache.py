@@ -0,0 +1,185 @@
+"""
+CLI 응답 캐시 단위 테스트
+"""
+
+import pytest
+from unittest.mock import patch, AsyncMock
+
+
+class TestResponseCache:
+    """메모리 LRU + SQLite 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_memory_hit_and_miss_counters(self):
+        """메모리 캐시 hit/miss 카운트"""
+        from backend.src.cli.cache import ResponseCache, make_cache_key
+
+        cache = ResponseCache()
+        key = make_cache_key("claude", "Fix the bug", cli_version="1.0", repo_head="abc")
+
+        assert await cache.get(key) is None
+        await cache.set(key, {"success": True, "output": "Fixed"})
+        assert (await cache.get(key))["output"] == "Fixed"
+
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_key_depends_on_version_and_head(self):
+        """CLI 버전/HEAD가 다르면 다른 키"""
+        from backend.src.cli.cache import make_cache_key
+
+        base = make_cache_key("claude", "p", cli_version="1.0", repo_head="abc")
+        assert base != make_cache_key("claude", "p", cli_version="1.1", repo_head="abc")
+        assert base != make_cache_key("claude", "p", cli_version="1.0", repo_head="def")
+        assert base != make_cache_key("codex", "p", cli_version="1.0", repo_head="abc")
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """SQLite 캐시는 새 인스턴스에서도 조회"""
+        from backend.src.cli.cache import ResponseCache
+
+        db_path = str(tmp_path / "cache.db")
+        first = ResponseCache(db_path=db_path)
+        await first.set("k", {"output": "from disk"})
+        first.close()
+
+        second = ResponseCache(db_path=db_path)
+        value = await second.get("k")
+        second.close()
+
+        assert value == {"output": "from disk"}
+        assert second.stats()["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_and_age_eviction(self, tmp_path):
+        """항목 수/기간 초과 시 제거"""
+        from backend.src.cli.cache import ResponseCache
+
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.set(key, {"output": key})
+        assert await cache.get("a") is None
+        assert await cache.get("c") == {"output": "c"}
+
+        expired = ResponseCache(db_path=str(tmp_path / "age.db"), max_age=0)
+        await expired.set("k", {"output": "old"})
+        assert await expired.get("k") is None
+        expired.close()
+
+    @pytest.mark.asyncio
+    async def test_disk_size_eviction(self, tmp_path):
+        """디스크 크기 상한 초과 시 오래 안 쓴 항목부터 삭제"""
+        from backend.src.cli.cache import ResponseCache
+
+        cache = ResponseCache(db_path=str(tmp_path / "size.db"), max_entries=0, max_disk_bytes=150)
+        for key in ("a", "b", "c"):
+            await cache.set(key, {"output": key * 40})
+
+        assert await cache.get("a") is None
+        assert await cache.get("c") is not None
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_per_run_fields_are_not_stored(self):
+        """로그 id/사용량/세션은 저장하지 않음 (만료된 로그 id를 돌려주지 않도록)"""
+        from backend.src.cli.cache import ResponseCache
+
+        cache = ResponseCache()
+        await cache.set("k", {
+            "output": "x", "output_log_id": "log-1", "usage": {"cpu_seconds": 1.0},
+            "session": {"session_id": "s"}, "session_id": "s",
+        })
+
+        assert await cache.get("k") == {"output": "x"}
+
+    def test_worktree_state_tracks_edits(self, tmp_path):
+        """깨끗하면 "", 수정하면 해시, 이미 수정된 파일을 다시 고쳐도 해시가 바뀜"""
+        import subprocess
+
+        from backend.src.cli.cache import read_worktree_state
+
+        assert read_worktree_state(str(tmp_path)) is None
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q")
+        (tmp_path / "app.py").write_text("x = 1\n")
+        git("add", "app.py")
+        git("-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "init")
+        assert read_worktree_state(str(tmp_path)) == ""
+
+        (tmp_path / "app.py").write_text("x = 2\n")
+        first = read_worktree_state(str(tmp_path))
+        (tmp_path / "app.py").write_text("x = 30\n")
+        second = read_worktree_state(str(tmp_path))
+
+        assert first and second and first != second
+
+    def test_read_repo_head(self, tmp_path):
+        """.git 파일에서 HEAD 커밋 읽기"""
+        from backend.src.cli.cache import read_repo_head
+
+        git_dir = tmp_path / ".git"
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+        (git_dir / "refs" / "heads" / "main").write_text("0123abcd\n")
+
+        assert read_repo_head(str(tmp_path)) == "0123abcd"
+        assert read_repo_head(str(tmp_path / "missing")) is None
+
+
+class TestExecutorCache:
+    """executor 캐시 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self):
+        """같은 prompt 재실행 시 CLI를 다시 띄우지 않음"""
+        from backend.src.cli.cache import ResponseCache
+        from backend.src.cli.executor import CLIExecutor
+
+        cache = ResponseCache()
+        executor = CLIExecutor(model="claude", cache=cache)
+
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            mock_process = AsyncMock()
+            mock_process.communicate.return_value = (b"```python\nx = 1\n```", b"")
+            mock_process.returncode = 0
+            mock_exec.return_value = mock_process
+
+            first = await executor.generate_code("Fix the bug")
+            second = await executor.generate_code("Fix the bug")
+            bypassed = await executor.generate_code("Fix the bug", use_cache=False)
+
+        assert mock_exec.call_count == 2
+        assert second["cached"] is True
+        assert second["code"] == first["code"] == bypassed["code"]
+        assert "cached" not in bypassed
+
+    @pytest.mark.asyncio
+    async def test_worktree_change_misses_cache(self):
+        """작업 트리가 바뀌면 다른 키, 상태를 확인할 수 없으면 캐시하지 않음"""
+        from backend.src.cli import executor as executor_module
+        from backend.src.cli.cache import ResponseCache
+        from backend.src.cli.executor import CLIExecutor
+
+        cache = ResponseCache()
+        executor = CLIExecutor(model="claude", cache=cache)
+        states = iter(["", "dirty-1", None, None])
+
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec, \
+                patch.object(executor_module, "read_repo_head", return_value="abc"), \
+                patch.object(executor_module, "read_worktree_state", lambda _: next(states)):
+            mock_process = AsyncMock()
+            mock_process.communicate.return_value = (b"done", b"")
+            mock_process.returncode = 0
+            mock_exec.return_value = mock_process
+
+            await executor.generate_code("Fix the bug")
+            await executor.generate_code("Fix the bug")
+            await executor.generate_code("Fix the bug")
+            await executor.generate_code("Fix the bug")
+
+        assert mock_exec.call_count == 4
+        assert cache.stats()["stores"] == 2
@@ -0,0 +1,142 @@
+"""
+메모리 한도 출력 캡처 단위 테스트
+"""
+
+import sys
+
+import pytest
+
+
+class TestBoundedCapture:
+    """head/tail 버퍼 + spill 테스트"""
+
+    def test_small_output_stays_in_memory(self, tmp_path):
+        """한도 이하 출력은 파일 없이 그대로 보관"""
+        from backend.src.cli.capture import BoundedCapture
+
+        capture = BoundedCapture(head_bytes=8, tail_bytes=8, spill_path=str(tmp_path / "a.log"))
+        capture.write(b"hello ")
+        capture.write(b"world")
+        capture.close()
+
+        assert capture.getvalue() == b"hello world"
+        assert capture.truncated is False
+        assert not (tmp_path / "a.log").exists()
+
+    def test_large_output_keeps_head_tail_and_spills(self, tmp_path):
+        """한도 초과 시 head/tail만 메모리에, 전체는 파일에"""
+        from backend.src.cli.capture import BoundedCapture, TRUNCATION_MARKER
+
+        path = tmp_path / "b.log"
+        capture = BoundedCapture(head_bytes=4, tail_bytes=4, spill_path=str(path))
+        data = bytes(range(48, 48 + 40))
+        for i in range(0, len(data), 3):
+            capture.write(data[i:i + 3])
+        capture.close()
+
+        assert capture.truncated is True
+        assert capture.getvalue() == data[:4] + TRUNCATION_MARKER + data[-4:]
+        assert path.read_bytes() == data
+
+    def test_store_reads_byte_ranges(self, tmp_path):
+        """로그 바이트 범위 조회 (mmap)"""
+        from backend.src.cli.capture import CaptureStore
+
+        store = CaptureStore(directory=str(tmp_path), head_bytes=2, tail_bytes=2)
+        log_id, capture = store.create()
+        capture.write(b"0123456789")
+        store.register(log_id, capture)
+
+        assert store.size(log_id) == 10
+        assert store.read(log_id, 3, 7) == b"3456"
+        assert store.read(log_id, 8) == b"89"
+        assert store.read(log_id, 20) == b""
+        with pytest.raises(KeyError):
+            store.read("unknown")
+
+    @pytest.mark.asyncio
+    async def test_awrite_spills_in_thread(self, tmp_path):
+        """awrite도 같은 head/tail과 spill 파일을 만듦"""
+        from backend.src.cli.capture import BoundedCapture
+
+        path = tmp_path / "c.log"
+        capture = BoundedCapture(head_bytes=4, tail_bytes=4, spill_path=str(path))
+        for chunk in (b"0123", b"4567", b"89ab"):
+            await capture.awrite(chunk)
+        capture.close()
+
+        assert capture.spilled is True
+        assert path.read_bytes() == b"0123456789ab"
+
+    @pytest.mark.asyncio
+    async def test_start_removes_stale_logs(self, tmp_path):
+        """시작 시 이전 프로세스가 남긴 오래된 로그 삭제, 주기적으로 만료 로그 삭제"""
+        import asyncio
+        import os
+        import time
+
+        from backend.src.cli.capture import CaptureStore
+
+        stale = tmp_path / "old.log"
+        stale.write_bytes(b"x")
+        old = time.time() - 7200
+        os.utime(stale, (old, old))
+        recent = tmp_path / "recent.log"
+        recent.write_bytes(b"x")
+
+        store = CaptureStore(
+            directory=str(tmp_path), max_age=3600, head_bytes=1, tail_bytes=1,
+            cleanup_interval=0.01,
+        )
+        await store.start()
+        try:
+            assert not stale.exists()
+            assert recent.exists()
+
+            log_id, capture = store.create()
+            await capture.awrite(b"0123")
+            capture.close()
+            store.register(log_id, capture)
+            store.max_age = 0
+            await asyncio.sleep(0.05)
+
+            with pytest.raises(KeyError):
+                store.read(log_id)
+            assert not recent.exists()
+            assert store.removed == 3
+        finally:
+            await store.stop()
+
+
+class TestExecutorBoundedCapture:
+    """executor 메모리 한도 캡처 모드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_large_cli_output_is_truncated_but_parsed(self, tmp_path):
+        """큰 출력: 응답은 잘리고, 코드 블록은 추출되고, 전체 로그는 조회 가능"""
+        from backend.src.cli.capture import CaptureStore
+        from backend.src.cli.executor import CLIExecutor
+
+        script = (
+            "import sys\n"
+            "sys.stdout.write('x' * 1_000_000)\n"
+            "sys.stdout.write('\\n```python\\nprint(42)\\n```\\n')\n"
+            "sys.stdout.write('y' * 1_000_000)\n"
+            "sys.stderr.write('warn\\n' * 50_000)\n"
+        )
+        store = CaptureStore(directory=str(tmp_path), head_bytes=1024, tail_bytes=1024)
+        executor = CLIExecutor(model="python", timeout=30, capture_store=store)
+        # prompt는 "--" 뒤 인자로 전달되어 무시됨
+        executor._cli_configs["python"] = {
+            "cmd": sys.executable, "args": ["-c", script, "--"], "use_stdin": False,
+        }
+
+        result = await executor.generate_code("ignored")
+
+        assert result["code"] == "print(42)"
+        assert result["output_truncated"] is True
+        assert len(result["output"]) < 4096
+        total = result["output_bytes"]
+        assert total > 2_000_000
+        assert store.size(result["output_log_id"]) == total
+        assert store.read(result["output_log_id"], 0, 5) == b"xxxxx"
@@ -0,0 +1,161 @@
+"""
+사용자별 공정 대기열(DRR) 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+
+async def _grant_order(queue, requests):
+    """슬롯 하나를 점유한 상태에서 requests(사용자 목록)를 대기시킨 뒤 실행 순서 반환"""
+    order = []
+
+    async def run(user):
+        async with queue.slot(user):
+            order.append(user)
+            await asyncio.sleep(0)
+
+    await queue.acquire("holder")
+    tasks = []
+    for user in requests:
+        tasks.append(asyncio.create_task(run(user)))
+        await asyncio.sleep(0)
+    queue.release("holder")
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestFairQueue:
+    """DRR 분배 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_request_not_starved_by_batch(self):
+        """배치 뒤에 도착한 다른 사용자의 요청이 한 라운드 안에 실행"""
+        from backend.src.cli.fairness import FairQueue
+
+        queue = FairQueue(max_concurrent=1)
+        order = await _grant_order(queue, ["batch"] * 6 + ["interactive"])
+
+        assert order.index("interactive") <= 1
+        assert order.count("batch") == 6
+
+    @pytest.mark.asyncio
+    async def test_weights_share_slots(self):
+        """가중치 2:1이면 2:1 비율로 실행"""
+        from backend.src.cli.fairness import FairQueue
+
+        queue = FairQueue(max_concurrent=1, weights={"a": 2.0})
+        order = await _grant_order(queue, ["a"] * 6 + ["b"] * 3)
+
+        assert order[:6] == ["a", "a", "b", "a", "a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_per_user_queue_limit(self):
+        """사용자별 대기열이 가득 차면 429"""
+        from backend.src.cli.fairness import FairQueue
+        from backend.src.cli.scheduler import SchedulerRejectedError
+
+        queue = FairQueue(max_concurrent=1, max_queue_per_user=1)
+        await queue.acquire("holder")
+        waiter = asyncio.create_task(queue.acquire("a"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(SchedulerRejectedError) as exc_info:
+            await queue.acquire("a")
+        assert exc_info.value.status_code == 429
+
+        # 다른 사용자는 영향 없음
+        other = asyncio.create_task(queue.acquire("b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        queue.release("holder")
+        await asyncio.wait_for(other, timeout=1.0)
+        assert queue.stats()["users"]["b"]["running"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """대기 중 취소되면 슬롯이 다른 대기자에게 넘어감"""
+        from backend.src.cli.fairness import FairQueue
+
+        queue = FairQueue(max_concurrent=1)
+        await queue.acquire("holder")
+        first = asyncio.create_task(queue.acquire("a"))
+        second = asyncio.create_task(queue.acquire("b"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        queue.release("holder")
+        await asyncio.wait_for(second, timeout=1.0)
+
+        stats = queue.stats()
+        assert stats["running"] == 1
+        assert stats["users"]["b"]["running"] == 1
+        assert stats["users"]["a"]["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        """대기 시간이 초과되면 503"""
+        from backend.src.cli.fairness import FairQueue
+        from backend.src.cli.scheduler import SchedulerRejectedError
+
+        queue = FairQueue(max_concurrent=1, queue_timeout=0.05)
+        await queue.acquire("holder")
+        with pytest.raises(SchedulerRejectedError) as exc_info:
+            await queue.acquire("a")
+        assert exc_info.value.status_code == 503
+        assert queue.stats()["users"]["a"]["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_report_wait_times(self):
+        """사용자별 대기 시간/실행 수 집계"""
+        from backend.src.cli.fairness import FairQueue
+
+        queue = FairQueue(max_concurrent=1)
+        await _grant_order(queue, ["a", "b"])
+
+        users = queue.stats()["users"]
+        assert users["a"]["served"] == 1
+        assert users["b"]["served"] == 1
+        assert users["b"]["wait_time_p95"] >= 0.0
+
+
+class TestExecutorFairness:
+    """CLIExecutor 공정 대기열 + 모델 스케줄러 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_single_request_not_behind_batch_in_model_queue(self):
+        """배치가 모델 대기열을 채워도 다른 사용자의 요청은 한 라운드 안에 실행"""
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.fairness import FairQueue
+        from backend.src.cli.scheduler import CLIScheduler, ModelLimits
+
+        fair_queue = FairQueue(max_concurrent=8)
+        scheduler = CLIScheduler(default_limits=ModelLimits(max_concurrent=2, max_queue=16))
+        started = []
+
+        def executor(user):
+            ex = CLIExecutor(
+                model="claude", scheduler=scheduler, fair_queue=fair_queue, user=user
+            )
+
+            async def run(prompt):
+                started.append(user)
+                await asyncio.sleep(0.01)
+                return {"success": True, "output": "", "code_blocks": []}
+
+            ex._run = run
+            return ex
+
+        batch = [
+            asyncio.create_task(executor("batch")._scheduled_run(f"p{i}")) for i in range(10)
+        ]
+        await asyncio.sleep(0)
+        single = asyncio.create_task(executor("single")._scheduled_run("q"))
+        await asyncio.gather(*batch, single)
+
+        # 배치가 모델 슬롯 2개를 먼저 잡은 뒤 다음 라운드에서 실행
+        assert started.index("single") <= 3
+        # 모델 슬롯을 기다리는 동안에는 전체 공정 슬롯을 잡지 않음
+        assert fair_queue.stats()["users"]["batch"]["wait_time_p95"] == 0.0
@@ -0,0 +1,101 @@
+"""
+모델 헬스 추적/서킷 브레이커 단위 테스트
+"""
+
+import pytest
+from unittest.mock import patch, AsyncMock
+
+
+class TestModelHealthTracker:
+    """서킷 브레이커 + 지연 시간 기반 순서 테스트"""
+
+    def test_circuit_opens_after_repeated_failures(self):
+        """연속 실패가 임계치에 도달하면 서킷 open"""
+        from backend.src.cli.health import ModelHealthTracker
+
+        tracker = ModelHealthTracker(failure_threshold=2, cooldown=60)
+        tracker.record_failure("codex")
+        assert tracker.allow("codex") is True
+        tracker.record_failure("codex")
+
+        assert tracker.state("codex") == "open"
+        assert tracker.allow("codex") is False
+        assert tracker.order(["claude", "codex", "gemini"], preferred="claude") == [
+            "claude", "gemini",
+        ]
+
+    def test_half_open_allows_single_trial(self):
+        """쿨다운 후 half-open - 시험 요청 하나만 허용, 성공 시 close"""
+        from backend.src.cli.health import ModelHealthTracker
+
+        tracker = ModelHealthTracker(failure_threshold=1, cooldown=0)
+        tracker.record_failure("gemini")
+
+        assert tracker.state("gemini") == "half_open"
+        assert tracker.allow("gemini") is True
+        assert tracker.allow("gemini") is False
+
+        tracker.record_success("gemini", 1.0)
+        assert tracker.state("gemini") == "closed"
+
+    def test_order_by_expected_time_to_success(self):
+        """선호 모델은 앞에, 나머지는 p50 지연/성공률 순"""
+        from backend.src.cli.health import ModelHealthTracker
+
+        tracker = ModelHealthTracker(failure_threshold=10)
+        tracker.record_success("codex", 40.0)
+        tracker.record_success("gemini", 5.0)
+        tracker.record_success("qwen", 5.0)
+        tracker.record_failure("qwen")
+
+        order = tracker.order(["claude", "codex", "gemini", "qwen"], preferred="claude")
+
+        # gemini 5s, qwen 5s/0.5 = 10s, codex 40s
+        assert order == ["claude", "gemini", "qwen", "codex"]
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_costs_no_spawn(self):
+        """서킷이 열린 모델은 CLI를 띄우지 않고 바로 실패"""
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.health import ModelHealthTracker, CircuitOpenError
+
+        tracker = ModelHealthTracker(failure_threshold=1, cooldown=60)
+        executor = CLIExecutor(model="claude", health=tracker)
+
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            mock_process = AsyncMock()
+            mock_process.communicate.return_value = (b"", b"Error: crashed")
+            mock_process.returncode = 1
+            mock_exec.return_value = mock_process
+
+            with pytest.raises(Exception):
+                await executor.generate_code("Fix the bug")
+            with pytest.raises(CircuitOpenError):
+                await executor.generate_code("Fix the bug")
+
+        assert mock_exec.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_queued_releases_trial(self):
+        """시험 요청이 슬롯 대기 중 취소되면 다음 요청이 다시 시험할 수 있음"""
+        import asyncio
+
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.health import HALF_OPEN, ModelHealthTracker
+        from backend.src.cli.scheduler import CLIScheduler, ModelLimits
+
+        tracker = ModelHealthTracker(failure_threshold=1, cooldown=0)
+        tracker.record_failure("claude")
+        scheduler = CLIScheduler(default_limits=ModelLimits(max_concurrent=1))
+        await scheduler.acquire("claude")
+        executor = CLIExecutor(model="claude", health=tracker, scheduler=scheduler)
+
+        queued = asyncio.create_task(executor.generate_code("Fix the bug", use_cache=False))
+        await asyncio.sleep(0.01)
+        assert tracker.state("claude") == HALF_OPEN
+        assert tracker.allow("claude") is False
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        assert tracker.allow("claude") is True
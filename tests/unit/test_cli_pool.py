@@ -0,0 +1,123 @@
+"""
+CLI warm 프로세스 풀 단위 테스트
+"""
+
+import asyncio
+import sys
+
+import pytest
+from unittest.mock import patch
+
+
+ECHO_CMD = [sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read())"]
+
+
+async def _spawn_echo(model: str) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        *ECHO_CMD,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+class TestCLIProcessPool:
+    """warm 프로세스 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_pool_prespawns_min_size(self):
+        """풀 시작 시 min_size 만큼 프로세스 준비"""
+        from backend.src.cli.pool import CLIProcessPool
+
+        pool = CLIProcessPool(models=["claude"], min_size=2, max_size=3)
+        with patch.object(CLIProcessPool, "_spawn", side_effect=_spawn_echo):
+            await pool.start()
+            try:
+                assert pool.stats()["claude"]["idle"] == 2
+                assert pool.stats()["claude"]["spawned"] == 2
+            finally:
+                await pool.stop()
+
+        assert pool.stats()["claude"]["idle"] == 0
+
+    @pytest.mark.asyncio
+    async def test_executor_uses_warm_process(self):
+        """executor가 풀의 프로세스로 prompt 실행"""
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.pool import CLIProcessPool
+
+        pool = CLIProcessPool(models=["claude"], min_size=1, max_size=1)
+        with patch.object(CLIProcessPool, "_spawn", side_effect=_spawn_echo):
+            await pool.start()
+            try:
+                executor = CLIExecutor(model="claude", timeout=10, pool=pool)
+                result = await executor.generate_code("```python\nprint(1)\n```")
+                assert result["success"] is True
+                assert result["code"] == "print(1)"
+                assert pool.stats()["claude"]["hits"] == 1
+            finally:
+                await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_acquire_miss_falls_back(self):
+        """풀 미시작/미지원 모델은 None 반환 (one-shot 폴백)"""
+        from backend.src.cli.pool import CLIProcessPool
+
+        pool = CLIProcessPool(models=["claude"])
+        assert pool.acquire("claude") is None
+        assert pool.acquire("codex") is None
+
+    @pytest.mark.asyncio
+    async def test_dead_process_is_recycled(self):
+        """죽은 프로세스는 헬스 체크에서 교체"""
+        from backend.src.cli.pool import CLIProcessPool
+
+        pool = CLIProcessPool(models=["claude"], min_size=1, max_size=1)
+        with patch.object(CLIProcessPool, "_spawn", side_effect=_spawn_echo):
+            await pool.start()
+            try:
+                warm = pool._idle["claude"][0]
+                warm.process.kill()
+                await warm.process.wait()
+
+                await pool.check_health()
+
+                stats = pool.stats()["claude"]
+                assert stats["recycled"] == 1
+                assert stats["idle"] == 1
+                assert pool._idle["claude"][0].process.returncode is None
+            finally:
+                await pool.stop()
+
+    @pytest.mark.asyncio
+    async def test_spawn_failures_back_off_then_retry(self):
+        """연속 spawn 실패 시 backoff 동안만 보충을 멈추고, 성공하면 실패 수 초기화"""
+        from backend.src.cli.pool import CLIProcessPool
+
+        missing = True
+
+        async def spawn(model):
+            if missing:
+                raise FileNotFoundError("claude")
+            return await _spawn_echo(model)
+
+        pool = CLIProcessPool(
+            models=["claude"], min_size=1, max_size=1, max_spawn_failures=3, spawn_backoff=60
+        )
+        with patch.object(CLIProcessPool, "_spawn", side_effect=spawn):
+            await pool.start()
+            try:
+                assert pool.stats()["claude"]["spawn_failures"] == 3
+                await pool.check_health()
+                assert pool.stats()["claude"]["spawn_failures"] == 3
+
+                # CLI가 다시 설치되고 backoff가 끝나면 보충 재개
+                missing = False
+                pool._stats["claude"].retry_at = 0.0
+                await pool.check_health()
+
+                stats = pool.stats()["claude"]
+                assert stats["idle"] == 1
+                assert stats["consecutive_failures"] == 0
+            finally:
+                await pool.stop()
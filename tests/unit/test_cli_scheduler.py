@@ -0,0 +1,127 @@
+"""
+CLI 실행 스케줄러 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+
+class TestCLIScheduler:
+    """모델별 동시 실행 제한/대기열 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_per_model(self):
+        """모델별 동시 실행 수 제한"""
+        from backend.src.cli.scheduler import CLIScheduler, ModelLimits
+
+        scheduler = CLIScheduler(default_limits=ModelLimits(max_concurrent=2))
+        active = {"claude": 0}
+        peak = {"claude": 0}
+
+        async def job():
+            async with scheduler.slot("claude"):
+                active["claude"] += 1
+                peak["claude"] = max(peak["claude"], active["claude"])
+                await asyncio.sleep(0.02)
+                active["claude"] -= 1
+
+        await asyncio.gather(*(job() for _ in range(6)))
+
+        assert peak["claude"] == 2
+        stats = scheduler.stats()["claude"]
+        assert stats["admitted"] == 6
+        assert stats["running"] == 0
+        assert stats["queue_time_p95"] > 0
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """높은 우선순위 대기자가 먼저 실행"""
+        from backend.src.cli.scheduler import CLIScheduler, ModelLimits
+
+        scheduler = CLIScheduler(default_limits=ModelLimits(max_concurrent=1))
+        order = []
+
+        await scheduler.acquire("claude")
+
+        async def job(name, priority):
+            async with scheduler.slot("claude", priority=priority):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(job("low", 0)),
+            asyncio.create_task(job("high", 10)),
+        ]
+        await asyncio.sleep(0.01)
+        scheduler.release("claude")
+        await asyncio.gather(*tasks)
+
+        assert order == ["high", "low"]
+
+    @pytest.mark.asyncio
+    async def test_same_priority_users_take_turns(self):
+        """같은 우선순위에서는 먼저 쌓인 배치 뒤에 온 다른 사용자 요청이 한 라운드 안에 실행"""
+        from backend.src.cli.scheduler import CLIScheduler, ModelLimits
+
+        scheduler = CLIScheduler(default_limits=ModelLimits(max_concurrent=1))
+        order = []
+
+        await scheduler.acquire("claude", user="holder")
+
+        async def job(user):
+            async with scheduler.slot("claude", user=user):
+                order.append(user)
+                await asyncio.sleep(0)
+
+        tasks = [asyncio.create_task(job("batch")) for _ in range(6)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(job("interactive")))
+        await asyncio.sleep(0.01)
+        scheduler.release("claude")
+        await asyncio.gather(*tasks)
+
+        assert order.index("interactive") <= 1
+
+    @pytest.mark.asyncio
+    async def test_queue_full_and_timeout_rejections(self):
+        """대기열 초과 429, 대기 시간 초과 503 (Retry-After 포함)"""
+        from backend.src.cli.scheduler import (
+            CLIScheduler, ModelLimits, SchedulerRejectedError,
+        )
+
+        scheduler = CLIScheduler(
+            default_limits=ModelLimits(max_concurrent=1, max_queue=1, queue_timeout=0.05)
+        )
+        await scheduler.acquire("claude")
+        waiter = asyncio.create_task(scheduler.acquire("claude"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(SchedulerRejectedError) as full:
+            await scheduler.acquire("claude")
+        assert full.value.status_code == 429
+        assert full.value.retry_after >= 1
+
+        with pytest.raises(SchedulerRejectedError) as timeout:
+            await waiter
+        assert timeout.value.status_code == 503
+
+        stats = scheduler.stats()["claude"]
+        assert stats["rejected"] == 1
+        assert stats["timed_out"] == 1
+        assert stats["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_raising_limit_at_runtime_admits_waiters(self):
+        """실행 중 제한을 늘리면 대기자가 바로 실행"""
+        from backend.src.cli.scheduler import CLIScheduler, ModelLimits
+
+        scheduler = CLIScheduler(default_limits=ModelLimits(max_concurrent=1))
+        await scheduler.acquire("codex")
+        waiter = asyncio.create_task(scheduler.acquire("codex"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        scheduler.set_limits("codex", max_concurrent=2)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert scheduler.stats()["codex"]["running"] == 2
@@ -0,0 +1,188 @@
+"""
+CLI 세션 재사용 단위 테스트
+"""
+
+import json
+import sys
+import time
+
+import pytest
+
+
+class TestCLISessionStore:
+    """LRU/TTL + 재사용 통계 테스트"""
+
+    def test_resume_records_saved_context(self):
+        """두 번째 실행부터 재개 - 첫 실행의 컨텍스트 크기만큼 절약"""
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore()
+        session = store.acquire("claude", "issue:1")
+        assert session.resumable is False
+        assert store.record(session, 1000) == 0
+
+        again = store.acquire("claude", "issue:1")
+        assert again is session and again.resumable is True
+        assert store.record(again, 1000) == 1000
+        assert store.acquire("codex", "issue:1") is not session
+
+        stats = store.stats()
+        assert stats["started"] == 1
+        assert stats["resumed"] == 1
+        assert stats["prompt_bytes_saved"] == 1000
+
+    def test_lru_eviction_and_ttl(self):
+        """max_sessions 초과 시 가장 오래 안 쓴 세션 제거, TTL 지나면 만료"""
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore(max_sessions=2, ttl=60.0)
+        first = store.acquire("claude", "a")
+        store.acquire("claude", "b")
+        store.acquire("claude", "a")
+        store.acquire("claude", "c")
+
+        assert store.get("claude", "a") is first
+        assert store.get("claude", "b") is None
+        assert store.stats()["evicted"] == 1
+
+        first.last_used = time.monotonic() - 61
+        assert store.get("claude", "a") is None
+        assert store.stats()["expired"] == 1
+
+    def test_invalidate_starts_new_session(self):
+        """무효화한 세션은 다음에 새 session_id로 시작"""
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore()
+        session = store.acquire("claude", "issue:1")
+        store.record(session, 10)
+        store.invalidate(session)
+
+        fresh = store.acquire("claude", "issue:1")
+        assert fresh.session_id != session.session_id
+        assert fresh.resumable is False
+
+
+def _session_executor(store, tmp_path, key="issue:7"):
+    """argv와 stdin을 JSON으로 출력하는 CLI - fail 파일이 있으면 재개 실패"""
+    from backend.src.cli.executor import CLIExecutor
+
+    fail = tmp_path / "fail"
+    script = (
+        "import json, os, sys\n"
+        f"if '--resume' in sys.argv and os.path.exists({str(fail)!r}):\n"
+        "    sys.exit('No conversation found')\n"
+        "print(json.dumps({'argv': sys.argv[1:], 'stdin': sys.stdin.read()}))\n"
+    )
+    executor = CLIExecutor(model="python", timeout=30, sessions=store, session_key=key)
+    executor._cli_configs["python"] = {
+        "cmd": sys.executable, "args": ["-c", script], "use_stdin": True,
+        "session_args": {"start": "--session-id", "resume": "--resume"},
+    }
+    return executor, fail
+
+
+class TestExecutorSessions:
+    """executor 세션 시작/재개 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_later_steps_resume_without_context(self, tmp_path):
+        """첫 단계는 컨텍스트와 함께 새 세션, 다음 단계는 재개하고 단계 prompt만 전송"""
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore()
+        executor, _ = _session_executor(store, tmp_path)
+        context = "Issue #7: login fails\n" + "repo context " * 100
+
+        first = await executor.generate_code("analyze", context=context)
+        sent = json.loads(first["output"])
+        session_id = first["session"]["session_id"]
+        assert sent["argv"] == ["--session-id", session_id]
+        assert sent["stdin"] == f"{context}\n\nanalyze"
+        assert first["session"]["resumed"] is False
+
+        second = await executor.generate_code("plan", context=context)
+        sent = json.loads(second["output"])
+        assert sent["argv"] == ["--resume", session_id]
+        assert sent["stdin"] == "plan"
+        assert second["session"]["turn"] == 2
+        assert second["session"]["prompt_bytes_saved"] == len(context.encode()) + 2
+        assert store.stats()["prompt_bytes_saved"] == len(context.encode()) + 2
+
+    @pytest.mark.asyncio
+    async def test_failed_resume_restarts_with_context(self, tmp_path):
+        """재개 실패 시 컨텍스트를 포함해 새 세션으로 다시 실행"""
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore()
+        executor, fail = _session_executor(store, tmp_path)
+        first = await executor.generate_code("analyze", context="ctx")
+        fail.write_text("1")
+
+        second = await executor.generate_code("plan", context="ctx")
+
+        sent = json.loads(second["output"])
+        assert sent["argv"][0] == "--session-id"
+        assert sent["argv"][1] != first["session"]["session_id"]
+        assert sent["stdin"] == "ctx\n\nplan"
+        assert store.stats()["invalidated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_keeps_session(self, tmp_path):
+        """서킷 열림 거부는 세션을 무효화하거나 재시도하지 않음"""
+        from backend.src.cli.health import CircuitOpenError, ModelHealthTracker
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore()
+        executor, _ = _session_executor(store, tmp_path)
+        first = await executor.generate_code("analyze", context="ctx")
+        executor.health = ModelHealthTracker(failure_threshold=1)
+        executor.health.record_failure("python")
+
+        with pytest.raises(CircuitOpenError):
+            await executor.generate_code("plan", context="ctx")
+
+        assert store.stats()["invalidated"] == 0
+        session = store.acquire("python", "issue:7")
+        assert session.session_id == first["session"]["session_id"]
+        assert session.resumable is True
+
+    @pytest.mark.asyncio
+    async def test_timeout_invalidates_session(self, tmp_path):
+        """시간 초과한 턴은 세션을 버리고 재시도 없이 전달"""
+        from backend.src.cli.executor import CLITimeoutError
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore()
+        executor, _ = _session_executor(store, tmp_path)
+        first = await executor.generate_code("analyze", context="ctx")
+        calls = 0
+
+        async def timeout(prompt):
+            nonlocal calls
+            calls += 1
+            raise CLITimeoutError("timed out")
+
+        executor._scheduled_run = timeout
+        with pytest.raises(CLITimeoutError):
+            await executor.generate_code("plan", context="ctx")
+
+        assert calls == 1
+        assert store.stats()["invalidated"] == 1
+        session = store.acquire("python", "issue:7")
+        assert session.session_id != first["session"]["session_id"]
+
+    @pytest.mark.asyncio
+    async def test_cli_without_session_support_sends_context(self, tmp_path):
+        """session_args가 없는 CLI는 세션 없이 매번 컨텍스트 포함"""
+        from backend.src.cli.sessions import CLISessionStore
+
+        store = CLISessionStore()
+        executor, _ = _session_executor(store, tmp_path)
+        del executor._cli_configs["python"]["session_args"]
+
+        result = await executor.generate_code("plan", context="ctx")
+
+        assert json.loads(result["output"]) == {"argv": [], "stdin": "ctx\n\nplan"}
+        assert "session" not in result
+        assert store.stats()["sessions"] == 0
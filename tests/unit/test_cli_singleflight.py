@@ -0,0 +1,249 @@
+"""
+요청 병합(single-flight) 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+
+class TestSingleFlight:
+    """실행/스트림 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """같은 키의 동시 호출은 한 번만 실행하고 결과를 공유"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        calls = 0
+
+        async def run():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"code": "x = 1"}
+
+        results = await asyncio.gather(*(flight.do("key", run) for _ in range(3)))
+
+        assert calls == 1
+        assert all(result["code"] == "x = 1" for result in results)
+        assert sum(1 for result in results if result.get("coalesced")) == 2
+        # 대기자마다 별도 사본
+        results[0]["code"] = "changed"
+        assert results[1]["code"] == "x = 1"
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_shared_run(self):
+        """대기자 하나가 취소되어도 다른 대기자가 있으면 실행 유지"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def run():
+            await release.wait()
+            return {"ok": True}
+
+        first = asyncio.create_task(flight.do("key", run))
+        second = asyncio.create_task(flight.do("key", run))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        release.set()
+        assert (await second)["ok"] is True
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancel_stops_run(self):
+        """마지막 대기자가 취소되면 실행도 취소"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        stopped = asyncio.Event()
+
+        async def run():
+            try:
+                await asyncio.sleep(60)
+            finally:
+                stopped.set()
+            return {}
+
+        waiter = asyncio.create_task(flight.do("key", run))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert stopped.is_set()
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared(self):
+        """실행 실패는 모든 대기자에게 전달"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight()
+
+        async def run():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("CLI crashed")
+
+        results = await asyncio.gather(
+            flight.do("key", run), flight.do("key", run), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_stream_shared_with_late_subscriber(self):
+        """늦게 합류한 구독자도 처음부터 모든 조각을 받음"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        opened = 0
+        step = asyncio.Event()
+
+        async def source():
+            nonlocal opened
+            opened += 1
+            yield "a"
+            await step.wait()
+            yield "b"
+            yield "c"
+
+        async def collect():
+            return [chunk async for chunk in flight.stream("key", source)]
+
+        first = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        step.set()
+
+        assert await first == ["a", "b", "c"]
+        assert await second == ["a", "b", "c"]
+        assert opened == 1
+
+
+    @pytest.mark.asyncio
+    async def test_stream_paced_by_slowest_subscriber(self):
+        """가장 느린 구독자가 max_buffered개 밀리면 원본 읽기를 멈추고, 읽은 조각은 버림"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight(max_buffered=4)
+        produced = 0
+
+        async def source():
+            nonlocal produced
+            for i in range(100):
+                produced += 1
+                yield str(i)
+
+        stream = flight.stream("key", source)
+        assert await stream.__anext__() == "0"
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # 구독자가 하나만 읽었으므로 원본은 max_buffered개 앞까지만 읽음
+        assert produced <= 6
+        assert flight.stats()["stream_buffered_chunks"] <= 5
+
+        rest = [chunk async for chunk in stream]
+        assert rest == [str(i) for i in range(1, 100)]
+        assert produced == 100
+
+    @pytest.mark.asyncio
+    async def test_leaving_paused_stream_closes_source(self):
+        """원본 읽기가 멈춘 상태에서 마지막 구독자가 떠나면 원본 제너레이터를 닫음"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight(max_buffered=1)
+        closed = False
+
+        async def source():
+            nonlocal closed
+            try:
+                for i in range(100):
+                    yield str(i)
+            finally:
+                closed = True
+
+        # 참조를 잡아 두어 GC의 asyncgen 정리에 기대지 않음
+        sources = []
+
+        def factory():
+            sources.append(source())
+            return sources[-1]
+
+        stream = flight.stream("key", factory)
+        assert await stream.__anext__() == "0"
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await stream.aclose()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert closed is True
+        assert flight.stats()["streams_in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_after_trim_starts_new_stream(self):
+        """앞부분을 이미 버린 스트림에 늦게 합류하면 새로 실행해 처음부터 받음"""
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight(max_buffered=2)
+        opened = 0
+        step = asyncio.Event()
+
+        async def source():
+            nonlocal opened
+            opened += 1
+            for i in range(5):
+                yield str(i)
+            await step.wait()
+
+        first = flight.stream("key", source)
+        assert [await first.__anext__() for _ in range(5)] == ["0", "1", "2", "3", "4"]
+
+        async def collect():
+            return [chunk async for chunk in flight.stream("key", source)]
+
+        second = asyncio.create_task(collect())
+        await asyncio.sleep(0.01)
+        step.set()
+
+        assert await second == ["0", "1", "2", "3", "4"]
+        assert [chunk async for chunk in first] == []
+        assert opened == 2
+
+class TestExecutorSingleFlight:
+    """CLIExecutor 병합 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_generate_code_coalesces_identical_prompts(self):
+        """같은 모델/prompt의 동시 generate_code는 CLI를 한 번만 실행"""
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.singleflight import SingleFlight
+
+        flight = SingleFlight()
+        runs = []
+
+        async def fake_run(prompt):
+            runs.append(prompt)
+            await asyncio.sleep(0.02)
+            return {"success": True, "code": "", "output": prompt}
+
+        executors = [CLIExecutor(model="claude", singleflight=flight) for _ in range(3)]
+        for executor in executors:
+            executor._scheduled_run = fake_run
+
+        results = await asyncio.gather(
+            executors[0].generate_code("same"),
+            executors[1].generate_code("same"),
+            executors[2].generate_code("other"),
+        )
+
+        assert sorted(runs) == ["other", "same"]
+        assert [result["output"] for result in results] == ["same", "same", "other"]
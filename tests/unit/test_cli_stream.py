@@ -0,0 +1,148 @@
+"""
+CLI 스트리밍 읽기 단위 테스트 - 실제 하위 프로세스 사용
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+
+def _python_executor(script: str, **kwargs):
+    from backend.src.cli.executor import CLIExecutor
+
+    executor = CLIExecutor(model="python", timeout=30, **kwargs)
+    # prompt는 "--" 뒤 인자로 전달되어 무시됨
+    executor._cli_configs["python"] = {
+        "cmd": sys.executable, "args": ["-c", script, "--"], "use_stdin": False,
+    }
+    return executor
+
+
+class TestChunkedStream:
+    """stdout/stderr 동시 읽기 + 조각 단위 전달 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_chatty_stderr_does_not_block_stdout(self):
+        """stderr를 파이프 버퍼보다 많이 써도 멈추지 않음"""
+        script = (
+            "import sys\n"
+            "sys.stderr.write('w' * 1_000_000)\n"
+            "sys.stderr.flush()\n"
+            "sys.stdout.write('done\\n')\n"
+        )
+        executor = _python_executor(script)
+
+        chunks = await asyncio.wait_for(
+            _collect(executor.stream_output("ignored")), timeout=10
+        )
+
+        assert "".join(chunks) == "done\n"
+
+    @pytest.mark.asyncio
+    async def test_long_line_is_split_into_bounded_chunks(self):
+        """줄바꿈 없는 긴 출력도 STREAM_CHUNK_BYTES 단위 조각으로 전달"""
+        from backend.src.cli.executor import STREAM_CHUNK_BYTES
+
+        script = "import sys\nsys.stdout.write('가' * 100_000)\n"
+        executor = _python_executor(script)
+
+        chunks = await _collect(executor.stream_output("ignored"))
+
+        assert "".join(chunks) == "가" * 100_000
+        assert len(chunks) > 1
+        # 조각 경계에 걸친 UTF-8 문자(최대 3바이트)는 다음 조각으로 넘어감
+        assert all(len(chunk.encode()) <= STREAM_CHUNK_BYTES + 3 for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_flush_interval_coalesces_small_writes(self):
+        """stream_flush_interval 동안 도착한 작은 조각은 합쳐서 전달"""
+        script = (
+            "import sys, time\n"
+            "for i in range(5):\n"
+            "    sys.stdout.write(f'{i}\\n'); sys.stdout.flush(); time.sleep(0.01)\n"
+        )
+        executor = _python_executor(script, stream_flush_interval=1.0)
+
+        chunks = await _collect(executor.stream_output("ignored"))
+
+        assert "".join(chunks) == "0\n1\n2\n3\n4\n"
+        assert len(chunks) < 5
+
+    @pytest.mark.asyncio
+    async def test_nonzero_exit_raises_with_stderr_tail(self):
+        """비정상 종료 시 stderr 꼬리를 담은 CLIExecutionError"""
+        from backend.src.cli.executor import CLIExecutionError
+
+        script = (
+            "import sys\n"
+            "sys.stdout.write('partial')\n"
+            "sys.stderr.write('boom')\n"
+            "sys.exit(3)\n"
+        )
+        executor = _python_executor(script)
+
+        chunks = []
+        with pytest.raises(CLIExecutionError, match="boom"):
+            async for chunk in executor.stream_output("ignored"):
+                chunks.append(chunk)
+        assert "".join(chunks) == "partial"
+
+    @pytest.mark.asyncio
+    async def test_early_close_kills_and_reaps(self):
+        """소비자가 중간에 닫으면 프로세스를 종료하고 회수"""
+        from backend.src.cli.supervisor import ProcessSupervisor
+
+        script = (
+            "import sys, time\n"
+            "sys.stdout.write('first\\n'); sys.stdout.flush()\n"
+            "time.sleep(60)\n"
+        )
+        supervisor = ProcessSupervisor(grace_period=0.5)
+        executor = _python_executor(script, supervisor=supervisor)
+
+        stream = executor.stream_output("ignored")
+        first = await asyncio.wait_for(stream.__anext__(), timeout=10)
+        pid = supervisor.snapshot()[0]["pid"]
+        await asyncio.wait_for(stream.aclose(), timeout=10)
+
+        assert first == "first\n"
+        assert supervisor.snapshot() == []
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
+
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_times_out_and_records(self):
+        """출력이 멈춘 스트림은 타임아웃에 종료되고 헬스/타임아웃/사용량에 기록"""
+        from backend.src.cli.accounting import UsageAccounting
+        from backend.src.cli.executor import CLITimeoutError
+        from backend.src.cli.health import ModelHealthTracker
+        from backend.src.cli.supervisor import ProcessSupervisor
+
+        script = (
+            "import sys, time\n"
+            "sys.stdout.write('first\\n'); sys.stdout.flush()\n"
+            "time.sleep(60)\n"
+        )
+        supervisor = ProcessSupervisor(grace_period=0.5)
+        health = ModelHealthTracker(failure_threshold=3)
+        accounting = UsageAccounting()
+        executor = _python_executor(
+            script, supervisor=supervisor, health=health, accounting=accounting
+        )
+        executor.timeout = 0.5
+
+        chunks = []
+        with pytest.raises(CLITimeoutError):
+            async for chunk in executor.stream_output("ignored"):
+                chunks.append(chunk)
+
+        assert chunks == ["first\n"]
+        assert supervisor.snapshot() == []
+        assert health.stats()["python"]["consecutive_failures"] == 1
+        assert accounting.stats()["models"]["python"]["runs"] == 1
+
+async def _collect(stream) -> list[str]:
+    return [chunk async for chunk in stream]
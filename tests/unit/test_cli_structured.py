@@ -0,0 +1,227 @@
+"""
+구조화 출력(stream-json) 파싱 단위 테스트
+"""
+
+import json
+import sys
+
+import pytest
+
+
+def _lines(*events) -> str:
+    return "".join(json.dumps(event) + "\n" for event in events)
+
+
+CLAUDE_EVENTS = _lines(
+    {"type": "system", "subtype": "init", "session_id": "s-1"},
+    {"type": "assistant", "message": {"content": [
+        {"type": "text", "text": "Fixed it:\n```python\nprint(1)\n```\n"},
+        {"type": "tool_use", "id": "t1", "name": "Write",
+         "input": {"file_path": "app.py", "content": "print(1)\n"}},
+    ]}},
+    {"type": "result", "subtype": "success", "is_error": False,
+     "result": "Fixed it", "session_id": "s-1"},
+)
+
+
+class TestStreamJsonParser:
+    """이벤트 정규화 테스트"""
+
+    def test_claude_events_map_to_result_shape(self):
+        """텍스트/코드 블록/도구 호출/파일 수정/세션 id 추출"""
+        from backend.src.cli.structured import parse_stream_json
+
+        parsed = parse_stream_json(CLAUDE_EVENTS)
+
+        assert parsed["text"] == "Fixed it:\n```python\nprint(1)\n```\n"
+        assert parsed["code_blocks"] == [{"language": "python", "code": "print(1)"}]
+        assert parsed["has_code"] is True
+        assert parsed["tool_calls"][0]["name"] == "Write"
+        assert parsed["file_edits"] == [
+            {"tool": "Write", "path": "app.py", "content": "print(1)\n"}
+        ]
+        assert parsed["session_id"] == "s-1"
+        assert parsed["is_error"] is False
+
+    def test_events_split_across_chunks(self):
+        """줄 중간에서 잘린 청크도 완성된 줄 단위로 처리"""
+        from backend.src.cli.structured import StreamJsonParser
+
+        parser = StreamJsonParser()
+        events = []
+        for i in range(0, len(CLAUDE_EVENTS), 7):
+            events.extend(parser.feed(CLAUDE_EVENTS[i:i + 7]))
+
+        assert [e["type"] for e in events] == ["text", "tool_call", "result"]
+        assert parser.close()["code_blocks"][0]["code"] == "print(1)"
+
+    def test_long_line_in_small_chunks(self):
+        """한 줄이 작은 청크 여러 개로 나뉘어 와도 줄 단위로 한 번만 파싱"""
+        from backend.src.cli.structured import StreamJsonParser
+
+        text = "x" * 200_000
+        raw = _lines({"type": "message", "role": "assistant", "content": text})
+        parser = StreamJsonParser()
+        events = []
+        for i in range(0, len(raw), 64):
+            events.extend(parser.feed(raw[i:i + 64]))
+
+        assert [e["text"] for e in events] == [text]
+        assert parser.close()["text"] == text
+
+    def test_text_capture_bounds_retained_text(self):
+        """text_capture가 있으면 어시스턴트 텍스트는 head/tail만 보관"""
+        from backend.src.cli.capture import BoundedCapture
+        from backend.src.cli.structured import StreamJsonParser
+
+        parser = StreamJsonParser(text_capture=BoundedCapture(head_bytes=100, tail_bytes=100))
+        for i in range(100):
+            chunk = f"{i:04d}" * 50
+            parser.feed(_lines({"type": "message", "role": "assistant", "content": chunk}))
+        parser.feed(_lines({"type": "message", "role": "assistant",
+                            "content": "```python\nprint(1)\n```\n"}))
+
+        parsed = parser.close()
+        assert len(parsed["text"]) < 300
+        assert "output truncated" in parsed["text"]
+        assert parsed["code_blocks"] == [{"language": "python", "code": "print(1)"}]
+
+    def test_partial_deltas_are_not_duplicated(self):
+        """delta를 받았으면 완성된 assistant 메시지의 텍스트는 무시"""
+        from backend.src.cli.structured import parse_stream_json
+
+        raw = _lines(
+            {"type": "stream_event", "event": {"delta": {"type": "text_delta", "text": "He"}}},
+            {"type": "stream_event", "event": {"delta": {"type": "text_delta", "text": "llo"}}},
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "Hello"}]}},
+        )
+
+        assert parse_stream_json(raw)["text"] == "Hello"
+
+    def test_gemini_and_codex_events(self):
+        """gemini message/tool_use, codex item.completed 이벤트"""
+        from backend.src.cli.structured import parse_stream_json
+
+        raw = _lines(
+            {"type": "message", "role": "assistant", "content": "a", "delta": True},
+            {"type": "tool_use", "tool_name": "write_file",
+             "parameters": {"file_path": "x.py", "content": "x = 1"}},
+            {"type": "item.completed", "item": {"type": "agent_message", "text": "b"}},
+            {"type": "result", "status": "error"},
+        )
+        parsed = parse_stream_json(raw)
+
+        assert parsed["text"] == "ab"
+        assert parsed["file_edits"][0]["path"] == "x.py"
+        assert parsed["is_error"] is True
+
+    def test_non_json_lines_and_result_only(self):
+        """JSON이 아닌 줄은 텍스트, 텍스트 이벤트가 없으면 최종 결과 텍스트 사용"""
+        from backend.src.cli.structured import parse_stream_json
+
+        assert parse_stream_json("warning: old node\n")["text"] == "warning: old node\n"
+        raw = _lines({"type": "result", "is_error": False, "result": "done"})
+        assert parse_stream_json(raw)["text"] == "done"
+
+
+def _structured_executor(events: str, **kwargs):
+    from backend.src.cli.executor import CLIExecutor
+
+    script = f"import sys\nsys.stdout.write({events!r})\n"
+    executor = CLIExecutor(model="python", timeout=30, structured_output=True, **kwargs)
+    # stream_json_args는 "--" 앞에 붙어 python -c 스크립트 인자로 무시됨
+    executor._cli_configs["python"] = {
+        "cmd": sys.executable, "args": ["-c", script], "use_stdin": False,
+        "stream_json_args": ["--"],
+    }
+    return executor
+
+
+class TestExecutorStructuredOutput:
+    """executor 구조화 출력 모드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_generate_code_uses_events(self):
+        """결과 형태는 텍스트 모드와 같고 도구 호출/파일 수정이 추가됨"""
+        executor = _structured_executor(CLAUDE_EVENTS)
+
+        result = await executor.generate_code("ignored")
+
+        assert result["success"] is True
+        assert result["code"] == "print(1)"
+        assert result["output"].startswith("Fixed it:")
+        assert result["file_edits"][0]["path"] == "app.py"
+        assert result["session_id"] == "s-1"
+
+    @pytest.mark.asyncio
+    async def test_bounded_capture_mode(self, tmp_path):
+        """메모리 한도 캡처 모드에서도 이벤트를 증분 파싱"""
+        from backend.src.cli.capture import CaptureStore
+
+        store = CaptureStore(directory=str(tmp_path))
+        executor = _structured_executor(CLAUDE_EVENTS, capture_store=store)
+
+        result = await executor.generate_code("ignored")
+
+        assert result["code"] == "print(1)"
+        assert result["tool_calls"][0]["name"] == "Write"
+
+    @pytest.mark.asyncio
+    async def test_error_result_raises(self):
+        """결과 이벤트가 실패면 종료 코드가 0이어도 CLIExecutionError"""
+        from backend.src.cli.executor import CLIExecutionError
+
+        events = _lines({"type": "result", "is_error": True, "result": "quota exceeded"})
+        executor = _structured_executor(events)
+
+        with pytest.raises(CLIExecutionError, match="quota exceeded"):
+            await executor.generate_code("ignored")
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_only_text(self):
+        """스트리밍은 어시스턴트 텍스트만 chunk로 전달"""
+        executor = _structured_executor(CLAUDE_EVENTS)
+
+        chunks = [chunk async for chunk in executor.stream_output("ignored")]
+
+        assert "".join(chunks) == "Fixed it:\n```python\nprint(1)\n```\n"
+
+    @pytest.mark.asyncio
+    async def test_stream_retains_bounded_text(self, tmp_path, monkeypatch):
+        """스트리밍 중 파서가 보관하는 텍스트도 캡처 head/tail 한도를 따름"""
+        from backend.src.cli import executor as module
+        from backend.src.cli.capture import CaptureStore
+
+        parsers = []
+
+        class RecordingParser(module.StreamJsonParser):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                parsers.append(self)
+
+        monkeypatch.setattr(module, "StreamJsonParser", RecordingParser)
+        events = _lines(*(
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "x" * 100}]}}
+            for _ in range(50)
+        ))
+        store = CaptureStore(directory=str(tmp_path), head_bytes=64, tail_bytes=64)
+        executor = _structured_executor(events, capture_store=store)
+
+        chunks = [chunk async for chunk in executor.stream_output("ignored")]
+
+        assert len("".join(chunks)) == 5000
+        retained = parsers[0]._text_capture
+        assert retained.total_bytes == 5000
+        assert len(retained.getvalue()) < 5000
+
+    @pytest.mark.asyncio
+    async def test_cli_without_stream_json_falls_back_to_text(self):
+        """stream_json_args가 없는 CLI는 기존 텍스트 파싱"""
+        executor = _structured_executor(CLAUDE_EVENTS)
+        del executor._cli_configs["python"]["stream_json_args"]
+        executor._cli_configs["python"]["args"].append("--")
+
+        result = await executor.generate_code("ignored")
+
+        assert result["output"] == CLAUDE_EVENTS
+        assert "tool_calls" not in result
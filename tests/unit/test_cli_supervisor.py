@@ -0,0 +1,140 @@
+"""
+CLI 프로세스 감독자 단위 테스트
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="프로세스 그룹/rlimit은 POSIX 전용")
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # 좀비는 회수 전까지 kill(0)이 성공하므로 /proc 상태로 확인
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return False
+
+
+# 자식 프로세스를 하나 띄우고 그 pid를 출력한 뒤 대기하는 스크립트
+_PARENT_WITH_CHILD = (
+    "import subprocess, sys, time;"
+    "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']);"
+    "print(child.pid, flush=True);"
+    "time.sleep(60)"
+)
+
+
+class TestProcessSupervisor:
+    """프로세스 그룹 종료/회수/rlimit 테스트"""
+
+    @posix_only
+    @pytest.mark.asyncio
+    async def test_terminate_kills_whole_group(self):
+        """terminate는 CLI가 띄운 자식까지 종료하고 회수"""
+        from backend.src.cli.supervisor import ProcessSupervisor
+
+        supervisor = ProcessSupervisor(grace_period=0.5)
+        process = await supervisor.spawn(
+            sys.executable, "-c", _PARENT_WITH_CHILD,
+            model="test",
+            stdout=asyncio.subprocess.PIPE,
+        )
+        child_pid = int((await process.stdout.readline()).decode())
+        assert _alive(child_pid)
+
+        await supervisor.terminate(process)
+
+        assert process.returncode is not None
+        # 자식은 init이 회수하므로 잠시 기다림
+        for _ in range(50):
+            if not _alive(child_pid):
+                break
+            await asyncio.sleep(0.05)
+        assert not _alive(child_pid)
+        assert supervisor.snapshot() == []
+
+    @posix_only
+    @pytest.mark.skipif(not os.path.isdir("/proc"), reason="/proc 필요")
+    @pytest.mark.asyncio
+    async def test_group_kill_skipped_for_reused_pgid(self):
+        """재사용된 pgid(시작 시각 불일치)나 없어진 그룹에는 SIGKILL을 보내지 않음"""
+        from backend.src.cli.supervisor import ProcessSupervisor
+
+        supervisor = ProcessSupervisor(grace_period=0.5)
+        process = await supervisor.spawn(
+            sys.executable, "-c", "import time; time.sleep(60)", model="test"
+        )
+        start_time = supervisor._running[process.pid].start_time
+        assert start_time is not None
+        assert supervisor._group_is_ours(process.pid, start_time)
+        assert not supervisor._group_is_ours(process.pid, start_time + 1)
+
+        await supervisor.terminate(process)
+        assert not supervisor._group_is_ours(process.pid, start_time)
+
+    @posix_only
+    @pytest.mark.asyncio
+    async def test_snapshot_reports_running_process(self):
+        """snapshot에 실행 중 프로세스와 그룹 사용량 표시, 종료 후 자동 제거"""
+        from backend.src.cli.supervisor import ProcessSupervisor
+
+        supervisor = ProcessSupervisor()
+        process = await supervisor.spawn(
+            sys.executable, "-c", "import time; time.sleep(0.3)", model="claude",
+        )
+
+        snapshot = supervisor.snapshot()
+        assert len(snapshot) == 1
+        assert snapshot[0]["pid"] == process.pid
+        assert snapshot[0]["model"] == "claude"
+        assert snapshot[0]["processes"] >= 1
+        assert snapshot[0]["rss_bytes"] > 0
+
+        await process.wait()
+        await asyncio.sleep(0)
+        assert supervisor.snapshot() == []
+
+    @posix_only
+    @pytest.mark.asyncio
+    async def test_cpu_rlimit_is_applied(self):
+        """CPU 시간 rlimit이 자식 프로세스에 적용됨"""
+        from backend.src.cli.supervisor import ProcessSupervisor, ResourceLimits
+
+        supervisor = ProcessSupervisor(limits=ResourceLimits(cpu_seconds=7))
+        process = await supervisor.spawn(
+            sys.executable, "-c",
+            "import resource; print(resource.getrlimit(resource.RLIMIT_CPU)[0])",
+            stdout=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await process.communicate()
+
+        assert stdout.decode().strip() == "7"
+
+    @posix_only
+    @pytest.mark.asyncio
+    async def test_executor_timeout_reaps_process_group(self):
+        """executor 타임아웃 시 감독자가 그룹을 종료하고 회수"""
+        from backend.src.cli.executor import CLIExecutor, CLITimeoutError
+        from backend.src.cli.supervisor import ProcessSupervisor
+
+        supervisor = ProcessSupervisor(grace_period=0.5)
+        executor = CLIExecutor(model="claude", timeout=0.5, supervisor=supervisor)
+        executor._cli_configs["claude"] = {
+            "cmd": sys.executable,
+            "args": ["-c", _PARENT_WITH_CHILD],
+            "use_stdin": True,
+        }
+
+        with pytest.raises(CLITimeoutError):
+            await executor.generate_code("hello", use_cache=False)
+
+        assert supervisor.snapshot() == []
@@ -0,0 +1,184 @@
+"""
+적응형 타임아웃 단위 테스트
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+class TestAdaptiveTimeouts:
+    """백분위수 기반 타임아웃 테스트"""
+
+    def test_default_until_enough_samples(self):
+        """기록이 부족하면 기본값"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        timeouts = AdaptiveTimeouts(default_timeout=120.0, min_samples=5)
+        for _ in range(4):
+            timeouts.record("gemini", 100, 3.0)
+        assert timeouts.timeout_for("gemini", 100) == 120.0
+
+    def test_p99_times_factor_clamped(self):
+        """p99 × factor를 하한/상한으로 제한"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        timeouts = AdaptiveTimeouts(
+            factor=2.0, min_timeout=5.0, max_timeout=60.0, default_timeout=30.0, min_samples=5
+        )
+        for seconds in [3.0, 4.0, 5.0, 6.0, 8.0]:
+            timeouts.record("gemini", 100, seconds)
+        assert timeouts.timeout_for("gemini", 100) == 16.0
+
+        for _ in range(5):
+            timeouts.record("codex", 100, 0.5)
+        assert timeouts.timeout_for("codex", 100) == 5.0
+
+        for _ in range(5):
+            timeouts.record("claude", 100, 100.0)
+        assert timeouts.timeout_for("claude", 100) == 60.0
+
+    def test_prompt_size_buckets(self):
+        """prompt 크기 구간별로 따로 학습, 구간 기록이 없으면 모델 전체 기록 사용"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        timeouts = AdaptiveTimeouts(factor=1.0, min_timeout=1.0, min_samples=3)
+        for _ in range(3):
+            timeouts.record("claude", 100, 10.0)
+            timeouts.record("claude", 64 * 1024, 50.0)
+
+        assert timeouts.timeout_for("claude", 200) == 10.0
+        assert timeouts.timeout_for("claude", 40 * 1024) == 50.0
+        # 1-8KB 구간은 기록이 없으므로 모델 전체 p99
+        assert timeouts.timeout_for("claude", 4 * 1024) == 50.0
+
+    def test_timeout_raises_next_timeout(self):
+        """타임아웃은 하한 기록으로 남아 다음 타임아웃을 늘림"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        timeouts = AdaptiveTimeouts(factor=2.0, min_timeout=1.0, min_samples=3)
+        for _ in range(3):
+            timeouts.record("qwen", 10, 2.0)
+        assert timeouts.timeout_for("qwen", 10) == 4.0
+
+        timeouts.record_timeout("qwen", 10, 4.0)
+        assert timeouts.timeout_for("qwen", 10) == 8.0
+        assert timeouts.stats()["timeouts_observed"] == 1
+
+    def test_timeout_raises_immediately_with_full_window(self):
+        """기록이 많아도 타임아웃 직후 바로 올림 (p99가 움직이기를 기다리지 않음)"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        timeouts = AdaptiveTimeouts(factor=2.0, min_timeout=1.0, min_samples=3, penalty_ttl=60)
+        for _ in range(200):
+            timeouts.record("qwen", 10, 2.0)
+
+        timeouts.record_timeout("qwen", 10, 4.0)
+        assert timeouts.timeout_for("qwen", 10) == 8.0
+        # 다른 구간은 영향 없음
+        assert timeouts.timeout_for("qwen", 64 * 1024) == 4.0
+
+        timeouts.penalty_ttl = 0
+        assert timeouts.timeout_for("qwen", 10) == 4.0
+
+    @pytest.mark.asyncio
+    async def test_save_runs_off_event_loop(self, tmp_path):
+        """이벤트 루프 안에서는 스레드에서 저장"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        path = tmp_path / "timeouts.json"
+        timeouts = AdaptiveTimeouts(path=str(path), save_interval=0)
+        timeouts.record("gemini", 10, 5.0)
+
+        assert timeouts._save_task is not None
+        await timeouts._save_task
+        assert "gemini" in path.read_text()
+        assert not timeouts._dirty
+
+    def test_survives_restart(self, tmp_path):
+        """저장한 학습값을 새 인스턴스가 복원"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        path = str(tmp_path / "timeouts.json")
+        timeouts = AdaptiveTimeouts(factor=2.0, min_timeout=1.0, min_samples=3, path=path)
+        for _ in range(3):
+            timeouts.record("gemini", 10, 5.0)
+        timeouts.flush()
+
+        restored = AdaptiveTimeouts(factor=2.0, min_timeout=1.0, min_samples=3, path=path)
+        assert restored.timeout_for("gemini", 10) == 10.0
+        assert restored.stats()["models"]["gemini"]["<1KB"]["samples"] == 3
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """손상된 저장 파일은 무시"""
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        path = tmp_path / "timeouts.json"
+        path.write_text("{not json")
+        timeouts = AdaptiveTimeouts(path=str(path))
+        assert timeouts.timeout_for("claude", 10) == timeouts.default_timeout
+
+
+class TestExecutorAdaptiveTimeout:
+    """CLIExecutor 적응형 타임아웃 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_executor_uses_learned_timeout(self):
+        """학습한 타임아웃으로 빠르게 실패하고 타임아웃을 기록"""
+        from backend.src.cli.executor import CLIExecutor, CLITimeoutError
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        timeouts = AdaptiveTimeouts(factor=1.0, min_timeout=0.05, min_samples=3)
+        for _ in range(3):
+            timeouts.record("gemini", 5, 0.05)
+
+        async def slow_communicate(input=None):
+            await asyncio.sleep(5)
+
+        process = MagicMock()
+        process.communicate = slow_communicate
+        process.returncode = None
+        process.kill = MagicMock()
+        process.wait = AsyncMock()
+
+        executor = CLIExecutor(model="gemini", timeout=120, timeouts=timeouts)
+        with patch("asyncio.create_subprocess_exec", new=AsyncMock(return_value=process)):
+            with pytest.raises(CLITimeoutError, match="0.05s"):
+                await executor.generate_code("hello")
+
+        assert timeouts.stats()["timeouts_observed"] == 1
+
+
+class TestSharedLatency:
+    """실행 시간 기록 공유 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_one_record_feeds_all_consumers(self):
+        """executor가 한 번 기록한 실행 시간을 스케줄러/헬스/타임아웃/헤지가 함께 읽음"""
+        import sys
+
+        from backend.src.cli.executor import CLIExecutor
+        from backend.src.cli.health import ModelHealthTracker
+        from backend.src.cli.latency import LatencyTracker
+        from backend.src.cli.scheduler import CLIScheduler
+        from backend.src.cli.timeouts import AdaptiveTimeouts
+
+        latency = LatencyTracker()
+        scheduler = CLIScheduler(latency=latency)
+        health = ModelHealthTracker(latency=latency)
+        timeouts = AdaptiveTimeouts(latency=latency, min_samples=1, min_timeout=1.0)
+        executor = CLIExecutor(
+            model="python", timeout=30, scheduler=scheduler, health=health, timeouts=timeouts
+        )
+        executor._cli_configs["python"] = {
+            "cmd": sys.executable, "args": ["-c", "print('ok')"], "use_stdin": False,
+        }
+
+        await executor.generate_code("ignored")
+
+        assert executor.latency is latency
+        assert len(latency.samples("python")) == 1
+        assert scheduler.stats()["python"]["run_time_p50"] > 0
+        assert health.stats()["python"]["latency_p50"] > 0
+        assert timeouts.stats()["models"]["python"]["<1KB"]["samples"] == 1
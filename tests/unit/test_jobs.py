@@ -0,0 +1,197 @@
+"""
+백그라운드 작업 큐 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+
+async def _wait_done(queue, job_id, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not queue.get(job_id).done:
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+    return queue.get(job_id)
+
+
+class TestJobQueue:
+    """작업 등록/실행/취소/이벤트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_in_background(self):
+        """등록 즉시 반환하고 워커가 실행해 결과 저장"""
+        from backend.src.jobs.queue import JobQueue
+
+        queue = JobQueue(workers=1)
+        await queue.start()
+        try:
+            async def run():
+                await asyncio.sleep(0.01)
+                return {"code": "x = 1"}
+
+            job = await queue.submit(run, metadata={"issue_id": 1})
+            assert job.status == "queued"
+
+            job = await _wait_done(queue, job.job_id)
+            assert job.status == "succeeded"
+            assert job.result == {"code": "x = 1"}
+            assert job.to_dict()["metadata"] == {"issue_id": 1}
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self):
+        """실패한 작업은 에러 메시지 보관"""
+        from backend.src.jobs.queue import JobQueue
+
+        queue = JobQueue(workers=1)
+        await queue.start()
+        try:
+            async def run():
+                raise RuntimeError("CLI crashed")
+
+            job = await _wait_done(queue, (await queue.submit(run)).job_id)
+            assert job.status == "failed"
+            assert job.error == "CLI crashed"
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_running_job_cancels_execution(self):
+        """실행 중 작업 취소 시 실행 태스크가 취소됨 (CLI 종료 경로)"""
+        from backend.src.jobs.queue import JobQueue
+
+        queue = JobQueue(workers=1)
+        await queue.start()
+        started = asyncio.Event()
+        cleaned_up = asyncio.Event()
+        try:
+            async def run():
+                started.set()
+                try:
+                    await asyncio.sleep(60)
+                finally:
+                    cleaned_up.set()
+                return {}
+
+            job = await queue.submit(run)
+            await asyncio.wait_for(started.wait(), timeout=1.0)
+
+            assert await queue.cancel(job.job_id) is True
+            assert cleaned_up.is_set()
+            assert queue.get(job.job_id).status == "cancelled"
+
+            # 워커는 계속 살아 다음 작업을 실행
+            async def next_run():
+                return {"ok": True}
+
+            next_job = await _wait_done(queue, (await queue.submit(next_run)).job_id)
+            assert next_job.status == "succeeded"
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_job_is_skipped(self):
+        """대기 중 작업 취소 시 실행되지 않음"""
+        from backend.src.jobs.queue import JobQueue
+
+        queue = JobQueue(workers=1)
+        executed = []
+
+        async def run():
+            executed.append(True)
+            return {}
+
+        job = await queue.submit(run)
+        assert await queue.cancel(job.job_id) is True
+        assert await queue.cancel(job.job_id) is False
+
+        await queue.start()
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            await queue.stop()
+        assert executed == []
+        assert queue.get(job.job_id).status == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_subscriber_receives_status_events(self):
+        """구독자는 SSEManager로 상태 변경 이벤트를 받음"""
+        from backend.src.jobs.queue import JobQueue
+
+        queue = JobQueue(workers=1)
+        release = asyncio.Event()
+
+        async def run():
+            await release.wait()
+            return {"code": ""}
+
+        job = await queue.submit(run)
+        client_id = await queue.subscribe(job.job_id)
+        await queue.start()
+        try:
+            release.set()
+            events = []
+            async for event in queue.sse_manager.stream_events(client_id):
+                events.append(event["event"])
+                if event["status"] == "succeeded":
+                    break
+            assert events == ["started", "succeeded"]
+        finally:
+            await queue.unsubscribe(job.job_id, client_id)
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_events_carry_status_not_result(self):
+        """작업 이벤트에는 상태만 담기고 결과는 작업 조회로 받음"""
+        from backend.src.jobs.queue import JobQueue
+
+        queue = JobQueue(workers=1)
+        await queue.sse_manager.connect("viewer")
+        queue.sse_manager.subscribe("viewer", "issue:7")
+
+        async def run():
+            return {"code": "x" * 100_000}
+
+        job = await queue.submit(run, metadata={"issue_id": 7})
+        await queue.start()
+        try:
+            async for frame in queue.sse_manager.stream_frames("viewer"):
+                assert "result" not in frame.data
+                assert len(frame.payload) < 1024
+                if frame.data["status"] == "succeeded":
+                    assert frame.data["has_result"] is True
+                    assert frame.data["issue_id"] == 7
+                    break
+            assert queue.get(job.job_id).result == {"code": "x" * 100_000}
+        finally:
+            await queue.sse_manager.disconnect("viewer")
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_issue_topic_receives_job_events(self):
+        """metadata에 issue_id가 있으면 issue 토픽 구독자도 작업 이벤트를 받음"""
+        from backend.src.jobs.queue import JobQueue
+
+        queue = JobQueue(workers=1)
+        await queue.sse_manager.connect("issue-viewer")
+        queue.sse_manager.subscribe("issue-viewer", "issue:42")
+
+        async def run():
+            return {"code": ""}
+
+        await queue.submit(run, metadata={"issue_id": 42})
+        await queue.start()
+        try:
+            events = []
+            async for frame in queue.sse_manager.stream_frames("issue-viewer"):
+                events.append(frame.data["event"])
+                assert frame.event_type == "job"
+                if frame.data["status"] == "succeeded":
+                    break
+            # 작업 생성 전부터 구독 중이므로 queued 이벤트도 받음
+            assert events == ["queued", "started", "succeeded"]
+        finally:
+            await queue.sse_manager.disconnect("issue-viewer")
+            await queue.stop()
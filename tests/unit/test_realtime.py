@@ -37,6 +37,14 @@ class TestSSEEvents:
         assert parsed["type"] == "progress"
         assert parsed["percentage"] == 25
 
+    def test_sse_event_id(self):
+        """이벤트 id가 있으면 id 필드가 먼저 옴 (재연결 시 Last-Event-ID)"""
+        from backend.src.realtime.sse import create_sse_event
+
+        sse_event = create_sse_event({"seq": 1}, "issue", event_id=42)
+
+        assert sse_event == 'id: 42\nevent: issue\ndata: {"seq": 1}\n'
+
     def test_progress_phase_update(self):
         """RT-U02: 단계 업데이트 (P0)"""
         # Arrange